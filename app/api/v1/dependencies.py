@@ -153,6 +153,17 @@ async def get_current_moderator(
 # ---------------------------------------------------------------------------
 
 
+async def video_lookup_scope() -> None:
+    """Router-level dependency enabling the per-request video lookup memo.
+
+    Several handlers resolve the same video more than once per request (access
+    checks, status gates, the service call itself); with the scope active the
+    repeated ``get_video_by_id`` calls are served from memory.
+    """
+
+    video_service.start_video_lookup_scope()
+
+
 async def get_video_for_owner_or_moderator_access(
     video_id_path: VideoID,
     current_user: Annotated[User, Depends(get_current_user_from_token)],
@@ -25,17 +25,15 @@ router = APIRouter(prefix="/users", tags=["Users"])
     summary="Register new account",
 )
 async def register_user(user_in: UserCreateRequest):
-    existing_user = await user_service.get_user_by_email_from_credentials_table(
-        email=user_in.email
-    )
-    if existing_user:
+    # The service probes the email before hashing the password and returns
+    # ``None`` when it is already registered.
+    created_user_doc = await user_service.create_user_in_table(user_in=user_in)
+    if created_user_doc is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered",
         )
 
-    created_user_doc = await user_service.create_user_in_table(user_in=user_in)
-
     return UserCreateResponse.model_validate(created_user_doc)
 
 
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-from typing import Annotated, List
+from typing import Annotated, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 
-from app.models.comment import CommentCreateRequest, CommentResponse, Comment
+from app.models.comment import (
+    CommentCreateRequest,
+    CommentPage,
+    CommentPagination,
+    CommentResponse,
+)
 from app.models.video import VideoID
 from app.models.user import User
 from app.api.v1.dependencies import (
@@ -13,8 +18,8 @@ from app.api.v1.dependencies import (
     get_current_user_from_token,
     PaginationParams,
     get_current_user_optional,
+    video_lookup_scope,
 )
-from app.models.common import PaginatedResponse, Pagination
 from app.services import comment_service, rating_service
 from app.models.rating import (
     RatingCreateOrUpdateRequest,
@@ -22,7 +27,9 @@ from app.models.rating import (
     AggregateRatingResponse,
 )
 
-router = APIRouter(tags=["Comments & Ratings"])
+router = APIRouter(
+    tags=["Comments & Ratings"], dependencies=[Depends(video_lookup_scope)]
+)
 
 
 @router.post(
@@ -46,47 +53,79 @@ async def post_comment_to_video(
 
 # pagination helper
 
+_BEFORE_DESCRIPTION = (
+    "Keyset cursor: the `pagination.nextCursor` of the previous page. "
+    "When set, `page` is ignored and the next page is read by key."
+)
 
-def _build_paginated(data: List[Comment], total: int, pagination: PaginationParams):
-    response_data = [CommentResponse.model_validate(c) for c in data]
+_EXACT_TOTAL_DESCRIPTION = (
+    "Count every matching comment for `totalItems`. By default a full page "
+    "reports an estimate (one more than the items seen) to save a round trip."
+)
+
+
+def _build_paginated(
+    data: List[CommentResponse], total: int, pagination: PaginationParams
+) -> Response:
     pages = (total + pagination.pageSize - 1) // pagination.pageSize
-    return PaginatedResponse(
-        data=response_data,
-        pagination=Pagination(
+    # A full page may have a successor; hand out its key for ``before``.
+    next_cursor = data[-1].commentId if len(data) >= pagination.pageSize else None
+    page = CommentPage.model_construct(
+        data=data,
+        pagination=CommentPagination.model_construct(
             currentPage=pagination.page,
             pageSize=pagination.pageSize,
             totalItems=total,
             totalPages=pages,
+            nextCursor=next_cursor,
         ),
     )
+    # The service already returns ``CommentResponse`` objects, so skip
+    # FastAPI's re-validate + jsonable_encoder pass and let pydantic-core write
+    # the JSON bytes directly.  ``response_model`` still drives the OpenAPI doc.
+    return Response(
+        content=page.model_dump_json(by_alias=True), media_type="application/json"
+    )
 
 
 @router.get(
     "/videos/{video_id_path:uuid}/comments",
-    response_model=PaginatedResponse,
+    response_model=CommentPage,
     summary="List comments for video",
 )
 async def list_comments_video(
     video_id_path: VideoID,
     pagination: PaginationParams = Depends(),
+    before: Optional[UUID] = Query(None, description=_BEFORE_DESCRIPTION),
+    exactTotal: bool = Query(False, description=_EXACT_TOTAL_DESCRIPTION),
 ):
     comments, total = await comment_service.list_comments_for_video(
-        video_id=video_id_path, page=pagination.page, page_size=pagination.pageSize
+        video_id=video_id_path,
+        page=pagination.page,
+        page_size=pagination.pageSize,
+        exact_total=exactTotal,
+        before=before,
     )
     return _build_paginated(comments, total, pagination)
 
 
 @router.get(
     "/users/{user_id_path:uuid}/comments",
-    response_model=PaginatedResponse,
+    response_model=CommentPage,
     summary="List comments by user",
 )
 async def list_comments_user(
     user_id_path: UUID,
     pagination: PaginationParams = Depends(),
+    before: Optional[UUID] = Query(None, description=_BEFORE_DESCRIPTION),
+    exactTotal: bool = Query(False, description=_EXACT_TOTAL_DESCRIPTION),
 ):
     comments, total = await comment_service.list_comments_by_user(
-        user_id=user_id_path, page=pagination.page, page_size=pagination.pageSize
+        user_id=user_id_path,
+        page=pagination.page,
+        page_size=pagination.pageSize,
+        exact_total=exactTotal,
+        before=before,
     )
     return _build_paginated(comments, total, pagination)
 
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 from typing import Annotated, Optional, List
 from uuid import UUID
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from app.api.v1.dependencies import (
     get_current_moderator,
@@ -26,6 +26,8 @@ from app.services import flag_service, user_service, video_service, comment_serv
 
 router = APIRouter(prefix="/moderation", tags=["Moderation Actions"])
 
+_USER_LIST_ADAPTER = TypeAdapter(List[User])
+
 
 # Helper to construct paginated response consistently
 
@@ -124,7 +126,14 @@ async def search_users_endpoint(
     search_query: Optional[str] = Query(None, alias="q", description="Search text"),
     current_moderator: Annotated[User, Depends(get_current_moderator)] = None,
 ):
-    return await user_service.search_users(query=search_query)
+    users = await user_service.search_users(query=search_query)
+    # ``search_users`` hands back validated ``User`` objects; serialise the
+    # whole list in one pydantic-core call instead of FastAPI re-validating and
+    # jsonable-encoding each row.  ``response_model`` still drives the OpenAPI doc.
+    return Response(
+        content=_USER_LIST_ADAPTER.dump_json(users, by_alias=True),
+        media_type="application/json",
+    )
 
 
 @router.post(
@@ -136,7 +145,9 @@ async def assign_moderator_endpoint(
     user_id_path: UUID,
     current_moderator: Annotated[User, Depends(get_current_moderator)],
 ):
-    updated = await user_service.assign_role_to_user(user_id_path, "moderator")
+    updated = await user_service.assign_role_to_user(
+        user_id=user_id_path, role="moderator"
+    )
     if updated is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
@@ -153,7 +164,9 @@ async def revoke_moderator_endpoint(
     user_id_path: UUID,
     current_moderator: Annotated[User, Depends(get_current_moderator)],
 ):
-    updated = await user_service.revoke_role_from_user(user_id_path, "moderator")
+    updated = await user_service.revoke_role_from_user(
+        user_id=user_id_path, role="moderator"
+    )
     if updated is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
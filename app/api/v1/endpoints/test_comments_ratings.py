@@ -39,7 +39,6 @@ async def test_post_comment_success(viewer_user: User, viewer_token: str):
         commentid=uuid4(),
         videoid=uuid4(),
         userid=viewer_user.userid,
-        comment="Great video!",
         text="Great video!",
     )
 
@@ -34,14 +34,17 @@ from app.api.v1.dependencies import (
     get_current_user_from_token,
     get_video_for_owner_or_moderator_access,
     get_current_user_optional,
+    video_lookup_scope,
 )
-from app.services import video_service, recommendation_service
+from app.services import video_service, recommendation_service, rating_service
 from app.models.common import PaginatedResponse, Pagination
 from app.api.v1.dependencies import PaginationParams
 from app.models.recommendation import RecommendationItem
 from app.core.config import settings
 
-router = APIRouter(prefix="/videos", tags=["Videos"])
+router = APIRouter(
+    prefix="/videos", tags=["Videos"], dependencies=[Depends(video_lookup_scope)]
+)
 
 
 @router.post(
@@ -260,6 +263,25 @@ async def record_view(
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
+async def _with_current_ratings(data: List[VideoSummary]) -> List[VideoSummary]:
+    """Overlay each card's ``averageRating`` with the rating summary.
+
+    The average on the video row is only a mirror (and absent on schemas
+    without the column); one batched read serves the whole page.  Cards of
+    videos with no summary row keep the value from their row.
+    """
+
+    if not data:
+        return data
+    summaries = await rating_service.get_video_ratings_summaries(
+        [video.videoid for video in data]
+    )
+    for video, summary in zip(data, summaries):
+        if summary.totalRatingsCount:
+            video.averageRating = summary.averageRating
+    return data
+
+
 def _build_paginated_response(
     data: List["VideoSummary"],
     total_items: int,
@@ -289,7 +311,9 @@ async def get_latest_videos(
     data, total = await video_service.list_latest_videos(
         pagination.page, pagination.pageSize
     )
-    return _build_paginated_response(data, total, pagination)
+    return _build_paginated_response(
+        await _with_current_ratings(data), total, pagination
+    )
 
 
 @router.get(
@@ -304,7 +328,9 @@ async def get_videos_by_tag(
     data, total = await video_service.list_videos_by_tag(
         tag_name, pagination.page, pagination.pageSize
     )
-    return _build_paginated_response(data, total, pagination)
+    return _build_paginated_response(
+        await _with_current_ratings(data), total, pagination
+    )
 
 
 @router.get(
@@ -319,7 +345,9 @@ async def get_videos_by_uploader(
     data, total = await video_service.list_videos_by_user(
         uploader_id_path, pagination.page, pagination.pageSize
     )
-    return _build_paginated_response(data, total, pagination)
+    return _build_paginated_response(
+        await _with_current_ratings(data), total, pagination
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -365,7 +393,7 @@ async def get_related_videos_for_video(
     """Return a list of videos related to the given video.
 
     The underlying implementation is currently stubbed out and will return the
-    latest videos (excluding the source video) with a random relevance score.
+    latest videos (excluding the source video) with a rank-based relevance score.
     """
 
     related_items = await recommendation_service.get_related_videos(
@@ -406,7 +434,7 @@ async def get_trending_videos(
     """Return the *trending* list – most viewed videos in the selected window."""
 
     trending_list = await video_service.list_trending_videos(intervalDays, limit)
-    return trending_list
+    return await _with_current_ratings(trending_list)
 
 
 # ---------------------------------------------------------------------------
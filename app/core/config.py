@@ -118,6 +118,18 @@ class Settings(BaseSettings):
         description="Minimum cosine similarity score for search results (0.0-1.0)",
     )
 
+    # Inference backend for the Granite embedding model:
+    #   "auto"     – OpenVINO on Intel CPUs with VNNI/AMX when the optional
+    #                extras are installed, torch otherwise (default)
+    #   "torch"    – plain FP32 PyTorch
+    #   "onnx"     – dynamic int8 quantised ONNX Runtime session
+    #   "openvino" – OpenVINO runtime (int8 IR when one has been exported)
+    # Optional backends fall back to torch when their extras are missing.
+    EMBEDDING_BACKEND: str = Field(
+        default="auto",
+        description="Embedding inference backend: auto | torch | onnx | openvino",
+    )
+
     # ------------------------------------------------------------------
     # YouTube integration
     # ------------------------------------------------------------------
@@ -4,7 +4,7 @@
 # wrapper that relies on the new `DataAPIClient` + `AsyncDatabase` classes.
 
 import logging
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 # Optional imports for more granular connection error handling.  These are
 # only used for *type checking* in the `except` clause; failure to import is
@@ -101,6 +101,13 @@ from app.core.config import settings
 logger = logging.getLogger(__name__)
 db_instance: Optional[AstraDB] = None
 
+# Resolved table handles keyed by name.  Every astrapy collection handle owns
+# its own API commander (and therefore its own HTTP connection pool), so
+# handles are created once per database instance and reused afterwards.  The
+# owning instance is stored alongside so a re-initialised client never serves
+# stale handles.
+_table_handles: Dict[str, Tuple[AstraDB, AstraDBCollection]] = {}
+
 
 async def init_astra_db():
     global db_instance
@@ -183,4 +190,11 @@ async def get_astra_db() -> AstraDB:
 
 async def get_table(table_name: str) -> AstraDBCollection:
     db = await get_astra_db()
-    return db.collection(table_name)
+    cached = _table_handles.get(table_name)
+    if cached is not None and cached[0] is db:
+        return cached[1]
+    # No await between the lookup above and the store below, so concurrent
+    # callers cannot interleave here and no lock is required.
+    table = db.collection(table_name)
+    _table_handles[table_name] = (db, table)
+    return table
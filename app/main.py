@@ -18,6 +18,8 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
 from app.db.astra_client import init_astra_db
+from app.services import flag_service
+from app.services.embedding_service import preload_embedding_service
 from app.models.common import ProblemDetail
 from app.api.v1.endpoints import (
     account_management,
@@ -99,6 +101,8 @@ except ModuleNotFoundError:  # pragma: no cover
 @app.on_event("startup")
 async def startup_event():
     await init_astra_db()
+    await flag_service.ensure_flags_table()
+    await preload_embedding_service()
 
     # ------------------------------------------------------------------
     # Debug – dump env vars and settings so we can verify flags like
@@ -7,6 +7,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
 from app.db.astra_client import init_astra_db
+from app.services import flag_service
 from app.models.common import ProblemDetail
 from app.api.v1.endpoints.moderation import router as moderation_router
 from app.utils.observability import configure_observability
@@ -35,6 +36,7 @@ configure_observability(service_app)
 @service_app.on_event("startup")
 async def startup_event() -> None:
     await init_astra_db()
+    await flag_service.ensure_flags_table()
 
 
 @service_app.exception_handler(HTTPException)
@@ -8,6 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.db.astra_client import init_astra_db
 from app.models.common import ProblemDetail
+from app.services.embedding_service import preload_embedding_service
 from app.api.v1.endpoints.search_catalog import (
     router as search_catalog_router,
 )
@@ -37,6 +38,7 @@ configure_observability(service_app)
 @service_app.on_event("startup")
 async def startup_event() -> None:
     await init_astra_db()
+    await preload_embedding_service()
 
 
 @service_app.exception_handler(HTTPException)
@@ -7,6 +7,8 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
 from app.db.astra_client import init_astra_db
+from app.services import flag_service
+from app.services.embedding_service import preload_embedding_service
 from app.models.common import ProblemDetail
 from app.api.v1.endpoints.video_catalog import router as video_catalog_router
 from app.api.v1.endpoints.flags import router as flags_router
@@ -38,6 +40,8 @@ configure_observability(service_app)
 @service_app.on_event("startup")
 async def startup_event() -> None:
     await init_astra_db()
+    await flag_service.ensure_flags_table()
+    await preload_embedding_service()
 
 
 @service_app.exception_handler(HTTPException)
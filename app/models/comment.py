@@ -5,10 +5,17 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Optional
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import AliasChoices, BaseModel, Field, ConfigDict
 
 # Import centralized type aliases
-from app.models.common import UserID, VideoID, CommentID
+from app.models.common import (
+    UserID,
+    VideoID,
+    CommentID,
+    OptionalDatetime,
+    PaginatedResponse,
+    Pagination,
+)
 
 
 class CommentBase(BaseModel):
@@ -28,17 +35,24 @@ class Comment(CommentBase):
 
     model_config = ConfigDict(populate_by_name=True, from_attributes=True)
 
+    # Table rows carry the body in the ``comment`` column; accept either key so
+    # rows validate without a rename pass.
+    text: str = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        validation_alias=AliasChoices("text", "comment"),
+    )
     commentid: CommentID = Field(..., alias="commentId")
     videoid: VideoID = Field(..., alias="videoId")
     userid: UserID = Field(..., alias="userId")
-    comment: str = Field(..., alias="text")
     sentiment_score: Optional[float] = None
 
     # Optional metadata fields present in some API contexts/tests
-    createdAt: Optional[datetime] = Field(
+    createdAt: OptionalDatetime = Field(
         default_factory=lambda: datetime.now(timezone.utc), alias="created_at"
     )
-    updatedAt: Optional[datetime] = Field(
+    updatedAt: OptionalDatetime = Field(
         default_factory=lambda: datetime.now(timezone.utc), alias="updated_at"
     )
     sentiment: Optional[str] = None  # Free-form sentiment label used by tests
@@ -47,6 +61,16 @@ class Comment(CommentBase):
     # Compatibility helpers (camelCase attribute access)
     # ------------------------------------------------------------------
 
+    @property
+    def comment(self) -> str:
+        """Return the body under its table column name (``comment``).
+
+        ``CommentResponse`` reads the body from this attribute when built
+        with ``from_attributes``.
+        """
+
+        return self.text
+
     @property  # type: ignore[override]
     def videoId(self) -> VideoID:  # noqa: N802 – keep camelCase for backward-compat
         """Return the camelCase alias for ``videoid``.
@@ -90,10 +114,26 @@ class CommentResponse(BaseModel):
     lastname: Optional[str] = Field(None, alias="lastName")
 
 
+class CommentPagination(Pagination):
+    """Pagination block for comment listings, with a keyset cursor."""
+
+    # commentId of the last comment on a full page – pass it back as
+    # ``before`` to read the next page by key; ``None`` on the last page.
+    nextCursor: Optional[CommentID] = None
+
+
+class CommentPage(PaginatedResponse[CommentResponse]):
+    """One page of comments."""
+
+    pagination: CommentPagination
+
+
 __all__ = [
     "CommentID",
     "CommentBase",
     "CommentCreateRequest",
     "Comment",
     "CommentResponse",
+    "CommentPagination",
+    "CommentPage",
 ]
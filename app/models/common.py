@@ -1,5 +1,6 @@
-from typing import List, TypeVar, Generic, Optional
-from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Annotated, Any, List, TypeVar, Generic, Optional
+from pydantic import BaseModel, BeforeValidator, Field
 from uuid import UUID
 
 DataT = TypeVar("DataT")
@@ -12,6 +13,32 @@ VideoID = UUID
 CommentID = UUID
 FlagID = UUID
 
+
+# ---------------------------------------------------------------------------
+# Nullable timestamps
+# ---------------------------------------------------------------------------
+
+
+def _maybe_dt(value: Any) -> Any:
+    """Resolve the common ``None`` / ``datetime`` / ISO-string cases in one branch.
+
+    Anything ``datetime.fromisoformat`` cannot handle (e.g. a ``Z`` suffix on
+    Python 3.10, or epoch numbers) is handed on unchanged so pydantic-core's
+    own datetime parsing still applies.
+    """
+
+    if value is None or isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return value
+    return value
+
+
+OptionalDatetime = Annotated[Optional[datetime], BeforeValidator(_maybe_dt)]
+
 __all__ = [
     "ProblemDetail",
     "Pagination",
@@ -20,6 +47,7 @@ __all__ = [
     "VideoID",
     "CommentID",
     "FlagID",
+    "OptionalDatetime",
 ]
 
 
@@ -12,7 +12,7 @@ from pydantic import BaseModel, Field
 # ---------------------------------------------------------------------------
 # Aliases (centralized)
 # ---------------------------------------------------------------------------
-from app.models.common import FlagID
+from app.models.common import FlagID, OptionalDatetime
 
 
 # ---------------------------------------------------------------------------
@@ -76,7 +76,7 @@ class Flag(FlagBase):
     status: FlagStatusEnum = FlagStatusEnum.OPEN
     moderatorId: Optional[UUID] = None  # Set once actioned
     moderatorNotes: Optional[str] = None
-    resolvedAt: Optional[datetime] = None
+    resolvedAt: OptionalDatetime = None
 
 
 class FlagResponse(Flag):
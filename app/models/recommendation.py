@@ -15,7 +15,7 @@ class RecommendationItem(BaseModel):
     thumbnailUrl: Optional[HttpUrl] = None
     # Optional relevance score between 0 and 1 returned if the backend is able
     # to compute it. For the current stub implementation this field will be
-    # populated with a random value to help front-end developers integrate.
+    # populated with a rank-based value to help front-end developers integrate.
     score: Optional[float] = Field(
         default=None,
         ge=0,
@@ -4,6 +4,8 @@ from datetime import datetime, timezone
 
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
 
+from app.models.common import OptionalDatetime
+
 
 class UserBase(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
@@ -29,7 +31,7 @@ class User(UserBase):
         default_factory=lambda: datetime.now(timezone.utc), alias="createdDate"
     )
     account_status: str = Field(default="active", alias="accountStatus")
-    last_login_date: Optional[datetime] = Field(None, alias="lastLoginDate")
+    last_login_date: OptionalDatetime = Field(None, alias="lastLoginDate")
     roles: List[str] = []  # Populated from token, not from DB
 
     # ------------------------------------------------------------------
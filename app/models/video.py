@@ -18,7 +18,7 @@ from pydantic import BaseModel, Field, HttpUrl, ConfigDict
 # ---------------------------------------------------------------------------
 # Aliases (centralized)
 # ---------------------------------------------------------------------------
-from app.models.common import VideoID
+from app.models.common import VideoID, OptionalDatetime
 
 
 # ---------------------------------------------------------------------------
@@ -89,7 +89,7 @@ class Video(VideoBase):
 
     # Fields not in schema, but in original model
     youtubeVideoId: Optional[str] = None
-    updatedAt: Optional[datetime] = None
+    updatedAt: OptionalDatetime = None
     status: VideoStatusEnum = VideoStatusEnum.PENDING
     # Persisted as ``views`` in the *videos* table but still exposed to
     # callers as ``viewCount`` for backward-compatibility.
@@ -97,7 +97,16 @@ class Video(VideoBase):
     averageRating: Optional[float] = None
     totalRatingsCount: int = 0
     is_deleted: bool = False
-    deleted_at: Optional[datetime] = None
+    deleted_at: OptionalDatetime = None
+
+    # ------------------------------------------------------------------
+    # Compatibility helpers
+    # ------------------------------------------------------------------
+
+    @property  # type: ignore[override]
+    def videoId(self) -> VideoID:  # noqa: N802 – keep camelCase for backward-compat
+        """Alias for the canonical ``videoid`` field (snake_case)."""
+        return self.videoid
 
 
 class VideoUpdateRequest(BaseModel):
@@ -112,10 +121,9 @@ class VideoUpdateRequest(BaseModel):
     tags: Optional[List[str]] = None
 
 
-class VideoDetailResponse(Video):
-    """Response model returned when fetching full video details."""
-
-    pass
+# Response model returned when fetching full video details.  A plain alias
+# rather than an empty subclass, so pydantic builds the schema only once.
+VideoDetailResponse = Video
 
 
 class VideoStatusResponse(BaseModel):
@@ -222,11 +230,3 @@ __all__ = [
     "TagSuggestion",
     "VideoPreviewResponse",
 ]
-
-# Ensure the full Video model also exposes camelCase aliases where useful.
-
-setattr(
-    Video,  # type: ignore[arg-type]
-    "videoId",
-    property(lambda self: self.videoid),  # noqa: B023
-)
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Optional, List, Tuple
+import asyncio
+from typing import Any, Optional, List, Tuple, TypedDict
 from uuid import UUID, uuid1
 
 from fastapi import HTTPException, status
@@ -11,10 +12,10 @@ from app.db.astra_client import get_table, AstraDBCollection
 from app.models.comment import CommentCreateRequest, Comment, CommentID, CommentResponse
 from app.models.user import User
 from app.models.video import VideoID, VideoStatusEnum
-from app.services import video_service, user_service
+from app.services.user_service import get_users_by_ids
+from app.services.video_service import get_video_by_id
 from app.external_services.sentiment_mock import MockSentimentAnalyzer
-import inspect  # local import to avoid new dependency
-from app.utils.db_helpers import safe_count
+from app.utils.db_helpers import fetch_docs, page_total
 
 # testing mocks
 from unittest.mock import AsyncMock, MagicMock
@@ -22,12 +23,24 @@ from unittest.mock import AsyncMock, MagicMock
 COMMENTS_BY_VIDEO_TABLE_NAME = "comments"
 COMMENTS_BY_USER_TABLE_NAME = "comments_by_user"
 
+# Video states in which new comments are rejected
+_BLOCKED_STATUSES: frozenset[VideoStatusEnum] = frozenset(
+    {
+        VideoStatusEnum.PENDING,
+        VideoStatusEnum.PROCESSING,
+        VideoStatusEnum.ERROR,
+    }
+)
+
+
+# The analyser is stateless, so a single shared instance serves every request.
+_SENTIMENT_ANALYZER = MockSentimentAnalyzer()
+
 
 async def _determine_sentiment_score(text: str) -> Optional[float]:
     """Determine sentiment using a mocked analyser for deterministic results."""
-    analyzer = MockSentimentAnalyzer()
     # This mock now returns a float score instead of a string
-    return await analyzer.analyze_score(text)
+    return await _SENTIMENT_ANALYZER.analyze_score(text)
 
 
 async def add_comment_to_video(
@@ -39,7 +52,7 @@ async def add_comment_to_video(
 ) -> Comment:
     """Add a new comment to a READY video, denormalizing for queries."""
 
-    target_video = await video_service.get_video_by_id(video_id)
+    target_video = await get_video_by_id(video_id)
     if target_video is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -48,12 +61,7 @@ async def add_comment_to_video(
 
     # If the status attribute is present and indicates an in-progress / error state, block comments.
     # Otherwise (e.g. status missing because column not yet stored) we optimistically allow comments.
-    blocked_statuses = {
-        VideoStatusEnum.PENDING,
-        VideoStatusEnum.PROCESSING,
-        VideoStatusEnum.ERROR,
-    }
-    if getattr(target_video, "status", None) in blocked_statuses:
+    if getattr(target_video, "status", None) in _BLOCKED_STATUSES:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Video is not ready for comments yet",
@@ -67,55 +75,91 @@ async def add_comment_to_video(
     sentiment_score = await _determine_sentiment_score(request.text)
     comment_id = uuid1()
 
-    # Build Pydantic model (uses `text` as the canonical field name)
-    new_comment = Comment(
-        commentid=comment_id,
-        videoid=video_id,
-        userid=current_user.userid,
-        text=request.text,
-        sentiment_score=sentiment_score,
-    )
+    vid_s, cid_s, uid_s = str(video_id), str(comment_id), str(current_user.userid)
 
-    # Translate the model into the exact table schema. The Data API table columns are:
+    # Build the row in the exact table schema straight from the inputs. The
+    # Data API table columns are:
     #   videoid | commentid | comment | sentiment_score | userid
     comment_doc = {
-        "videoid": str(new_comment.videoid),
-        "commentid": str(new_comment.commentid),
-        "comment": new_comment.text,
-        "sentiment_score": new_comment.sentiment_score,
-        "userid": str(new_comment.userid),
+        "videoid": vid_s,
+        "commentid": cid_s,
+        "comment": request.text,
+        "sentiment_score": sentiment_score,
+        "userid": uid_s,
     }
 
-    # Write to both tables
-    await comments_by_video_table.insert_one(document=comment_doc)
-    await comments_by_user_table.insert_one(document=comment_doc)
+    # Write to both tables – the two rows are independent denormalisations of
+    # the same comment, so issue them concurrently.
+    await asyncio.gather(
+        comments_by_video_table.insert_one(document=comment_doc),
+        comments_by_user_table.insert_one(document=comment_doc),
+    )
 
-    return new_comment
+    # Every value is either server-generated or already validated (the request
+    # payload and the authenticated user), so skip a second validation pass.
+    return Comment.model_construct(
+        commentid=comment_id,
+        videoid=video_id,
+        userid=current_user.userid,
+        text=request.text,
+        sentiment_score=sentiment_score,
+    )
 
 
 # ---------------------------------------------------------------------------
-# Internal helper – enrich Comment models with author names
+# Listing pipeline – raw rows straight to CommentResponse
 # ---------------------------------------------------------------------------
+# Comment rows read back from our own tables were written by
+# ``add_comment_to_video`` from validated input, so the listing paths skip the
+# intermediate ``Comment`` model and build the response with
+# ``model_construct``.  Construct performs no coercion, hence the UUID columns
+# are converted explicitly.  User-submitted payloads must keep going through
+# ``model_validate``.
+
+
+class CommentRow(TypedDict, total=False):
+    """Shape of a row in the ``comments`` / ``comments_by_user`` tables."""
+
+    videoid: Any
+    commentid: Any
+    userid: Any
+    comment: str
+    sentiment_score: Optional[float]
+
+
+def _as_uuid(value) -> UUID:
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+def _response_from_row(
+    row: CommentRow, userid: UUID, user_obj: Optional[User]
+) -> CommentResponse:
+    return CommentResponse.model_construct(
+        commentId=_as_uuid(row["commentid"]),
+        videoId=_as_uuid(row["videoid"]),
+        userId=userid,
+        text=row.get("comment", row.get("text")),
+        sentimentScore=row.get("sentiment_score"),
+        firstname=user_obj.firstname if user_obj is not None else None,
+        lastname=user_obj.lastname if user_obj is not None else None,
+    )
 
 
 async def _enrich_comments_with_user_names(
-    comments: List[Comment],
+    rows: List[CommentRow],
 ) -> List[CommentResponse]:
     """Return `CommentResponse` objects with firstName/lastName attached."""
 
-    # Gather distinct userids present in the page
-    user_mapping = await user_service.get_users_by_ids([c.userid for c in comments])
-
-    enriched: List[CommentResponse] = []
-    for c in comments:
-        user_obj = user_mapping.get(c.userid)
-        base_dict = c.model_dump(by_alias=True)
-        if user_obj is not None:
-            base_dict["firstName"] = user_obj.firstname
-            base_dict["lastName"] = user_obj.lastname
-        enriched.append(CommentResponse.model_validate(base_dict))
+    author_ids = [_as_uuid(r["userid"]) for r in rows]
+    # Gather distinct userids present in the page – chatty threads repeat the
+    # same handful of authors many times.
+    user_mapping = await get_users_by_ids(list(set(author_ids)))
 
-    return enriched
+    lookup = user_mapping.get
+    return [
+        _response_from_row(row, uid, lookup(uid))
+        for row, uid in zip(rows, author_ids)
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -123,51 +167,63 @@ async def _enrich_comments_with_user_names(
 # ---------------------------------------------------------------------------
 
 
+def _page_window(
+    query_filter: dict, page: int, page_size: int, before: Optional[CommentID]
+) -> Tuple[dict, int]:
+    """Return the ``find`` kwargs and row offset for one page of comments.
+
+    Comment rows are clustered by ``commentid`` (a TimeUUID) DESC.  When the
+    caller passes *before* – the last ``commentid`` of the previous page – the
+    page is selected by key (``$lt``) so the server work stays bounded however
+    deep the client pages.  Otherwise the legacy ``page`` offset is used.
+    """
+
+    # AstraDB requires a ``sort`` clause whenever ``skip`` is used; replicate
+    # the natural clustering order explicitly (newest first).
+    find_kwargs = {
+        "filter": query_filter,
+        "limit": page_size,
+        "sort": {"commentid": -1},
+    }
+    if before is not None:
+        find_kwargs["filter"] = {**query_filter, "commentid": {"$lt": str(before)}}
+        return find_kwargs, 0
+
+    skip = (page - 1) * page_size
+    # Only include ``skip`` if we actually need to advance the cursor (skip>0).
+    if skip > 0:
+        find_kwargs["skip"] = skip
+    return find_kwargs, skip
+
+
 async def list_comments_for_video(
     video_id: VideoID,
     page: int,
     page_size: int,
     db_table: Optional[AstraDBCollection] = None,
+    exact_total: bool = False,
+    before: Optional[CommentID] = None,
 ) -> Tuple[List[CommentResponse], int]:
     if db_table is None:
         db_table = await get_table(COMMENTS_BY_VIDEO_TABLE_NAME)
 
     query_filter = {"videoid": str(video_id)}
-    skip = (page - 1) * page_size
-
-    # AstraDB requires a ``sort`` clause whenever ``skip`` is used. Comment rows
-    # are naturally clustered by ``commentid`` DESC, so we replicate that order
-    # explicitly to satisfy the API contract.
-    find_kwargs = {
-        "filter": query_filter,
-        "limit": page_size,
-        "sort": {"commentid": -1},  # newest first
-    }
-    # Only include ``skip`` if we actually need to advance the cursor (skip>0).
-    if skip > 0:
-        find_kwargs["skip"] = skip
+    find_kwargs, skip = _page_window(query_filter, page, page_size, before)
 
     cursor = db_table.find(**find_kwargs)
 
-    raw_docs = cursor.to_list() if hasattr(cursor, "to_list") else cursor
-    docs = await raw_docs if inspect.isawaitable(raw_docs) else raw_docs
-
-    # Astra rows store the text content in the column named "comment" (table schema).
-    # Our Pydantic model expects the API field "text".  Populate it on-the-fly so
-    # model validation succeeds without altering the DB schema.
-    for d in docs:
-        if "comment" in d and "text" not in d:
-            d["text"] = d["comment"]
+    docs = await fetch_docs(cursor)
 
-    total = await safe_count(
+    total = await page_total(
         db_table,
         query_filter=query_filter,
-        fallback_len=len(docs),
+        skip=skip,
+        page_size=page_size,
+        page_len=len(docs),
+        exact=exact_total,
     )
 
-    # Build Comment models, then enrich with author names
-    comment_models = [Comment.model_validate(d) for d in docs]
-    enriched = await _enrich_comments_with_user_names(comment_models)
+    enriched = await _enrich_comments_with_user_names(docs)
     return enriched, total
 
 
@@ -176,59 +232,32 @@ async def list_comments_by_user(
     page: int,
     page_size: int,
     db_table: Optional[AstraDBCollection] = None,
+    exact_total: bool = False,
+    before: Optional[CommentID] = None,
 ) -> Tuple[List[CommentResponse], int]:
     if db_table is None:
         db_table = await get_table(COMMENTS_BY_USER_TABLE_NAME)
 
     query_filter = {"userid": str(user_id)}
-    skip = (page - 1) * page_size
-
-    find_kwargs = {
-        "filter": query_filter,
-        "limit": page_size,
-        "sort": {"commentid": -1},
-    }
-    if skip > 0:
-        find_kwargs["skip"] = skip
+    find_kwargs, skip = _page_window(query_filter, page, page_size, before)
 
     cursor = db_table.find(**find_kwargs)
 
-    raw_docs = cursor.to_list() if hasattr(cursor, "to_list") else cursor
-    docs = await raw_docs if inspect.isawaitable(raw_docs) else raw_docs
-
-    # Astra rows store the text content in the column named "comment" (table schema).
-    # Our Pydantic model expects the API field "text".  Populate it on-the-fly so
-    # model validation succeeds without altering the DB schema.
-    for d in docs:
-        if "comment" in d and "text" not in d:
-            d["text"] = d["comment"]
+    docs = await fetch_docs(cursor)
 
-    total = await safe_count(
+    total = await page_total(
         db_table,
         query_filter=query_filter,
-        fallback_len=len(docs),
+        skip=skip,
+        page_size=page_size,
+        page_len=len(docs),
+        exact=exact_total,
     )
 
-    comment_models = [Comment.model_validate(d) for d in docs]
-
     # All comments belong to the same user – fetch once for efficiency.
-    if comment_models:
-        user_details_map = await user_service.get_users_by_ids(
-            [comment_models[0].userid]
-        )
-        user_obj = user_details_map.get(comment_models[0].userid)
-    else:
-        user_obj = None
-
-    enriched_list: List[CommentResponse] = []
-    for c in comment_models:
-        data = c.model_dump(by_alias=True)
-        if user_obj is not None:
-            data["firstName"] = user_obj.firstname
-            data["lastName"] = user_obj.lastname
-        enriched_list.append(CommentResponse.model_validate(data))
-
-    return enriched_list, total
+    user_obj = (await get_users_by_ids([user_id])).get(user_id) if docs else None
+
+    return [_response_from_row(d, user_id, user_obj) for d in docs], total
 
 
 async def get_comment_by_id(
@@ -1,170 +1,564 @@
-"""
-Embedding service for generating vector embeddings using IBM Granite model.
-
-This service uses the IBM Granite-Embedding-30m-English model to generate
-384-dimensional embeddings for text. The model is loaded once at startup
-and cached in memory for fast inference.
-"""
-
-import logging
-import re
-from typing import List, Optional
-
-from sentence_transformers import SentenceTransformer
-
-logger = logging.getLogger(__name__)
-
-
-class EmbeddingService:
-    """
-    Singleton service for generating embeddings using IBM Granite model.
-
-    The model is loaded once at initialization and cached for fast inference.
-    """
-
-    _instance: Optional["EmbeddingService"] = None
-    _model: Optional[SentenceTransformer] = None
-
-    MODEL_NAME = "ibm-granite/granite-embedding-30m-english"
-    EMBEDDING_DIMENSION = 384
-    MAX_TOKENS = 512
-
-    def __new__(cls):
-        """Implement singleton pattern."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
-    def __init__(self):
-        """Initialize the embedding service."""
-        if self._model is None:
-            logger.info(f"Loading embedding model: {self.MODEL_NAME}")
-            self._model = SentenceTransformer(self.MODEL_NAME)
-            logger.info(
-                f"Embedding model loaded successfully. Dimension: {self.EMBEDDING_DIMENSION}"
-            )
-
-    def _clip_to_max_tokens(self, text: str) -> str:
-        """
-        Clip text to maximum token limit (512 tokens).
-
-        Uses a simple tokenizer that matches the pattern used for NVIDIA embeddings.
-        This is a conservative approximation - actual tokenization may differ slightly.
-
-        Args:
-            text: The input text to clip
-
-        Returns:
-            The clipped text if over limit, otherwise original text
-        """
-        # Simple tokenizer: matches word characters and punctuation
-        token_re = re.compile(r"\w+|[^\w\s]", flags=re.UNICODE)
-        tokens = token_re.findall(text)
-
-        if len(tokens) <= self.MAX_TOKENS:
-            return text
-
-        # Clip to max tokens and rejoin
-        clipped_tokens = tokens[: self.MAX_TOKENS]
-        # Find the position in original text where we should cut
-        # This is approximate but works well enough
-        clipped_text = " ".join(clipped_tokens)
-
-        logger.warning(f"Text clipped from {len(tokens)} to {self.MAX_TOKENS} tokens")
-
-        return clipped_text
-
-    def generate_embedding(self, text: str, clip_tokens: bool = True) -> List[float]:
-        """
-        Generate a 384-dimensional embedding vector for the given text.
-
-        Args:
-            text: The input text to embed
-            clip_tokens: Whether to clip text to MAX_TOKENS (default: True)
-
-        Returns:
-            A list of 384 float values representing the embedding vector
-
-        Raises:
-            ValueError: If text is empty or model is not loaded
-        """
-        if not text or not text.strip():
-            raise ValueError("Cannot generate embedding for empty text")
-
-        if self._model is None:
-            raise ValueError("Embedding model not loaded")
-
-        # Clip to token limit if requested
-        if clip_tokens:
-            text = self._clip_to_max_tokens(text)
-
-        # Generate embedding
-        # encode() returns numpy array, convert to list of floats
-        embedding = self._model.encode(text, convert_to_numpy=True)
-
-        return embedding.tolist()
-
-    def generate_embeddings_batch(
-        self, texts: List[str], clip_tokens: bool = True
-    ) -> List[List[float]]:
-        """
-        Generate embeddings for multiple texts in a batch.
-
-        This is more efficient than calling generate_embedding() multiple times
-        as the model can process multiple texts in parallel.
-
-        Args:
-            texts: List of input texts to embed
-            clip_tokens: Whether to clip texts to MAX_TOKENS (default: True)
-
-        Returns:
-            List of embedding vectors, one for each input text
-
-        Raises:
-            ValueError: If any text is empty or model is not loaded
-        """
-        if not texts:
-            raise ValueError("Cannot generate embeddings for empty list")
-
-        if self._model is None:
-            raise ValueError("Embedding model not loaded")
-
-        # Validate and clip texts
-        processed_texts = []
-        for text in texts:
-            if not text or not text.strip():
-                raise ValueError("Cannot generate embedding for empty text")
-
-            if clip_tokens:
-                text = self._clip_to_max_tokens(text)
-
-            processed_texts.append(text)
-
-        # Generate embeddings in batch
-        embeddings = self._model.encode(
-            processed_texts, convert_to_numpy=True, show_progress_bar=False
-        )
-
-        return [emb.tolist() for emb in embeddings]
-
-
-# Global instance
-_embedding_service: Optional[EmbeddingService] = None
-
-
-def get_embedding_service() -> EmbeddingService:
-    """
-    Get the global embedding service instance.
-
-    This function initializes the service on first call and returns
-    the cached instance on subsequent calls.
-
-    Returns:
-        The global EmbeddingService instance
-    """
-    global _embedding_service
-
-    if _embedding_service is None:
-        _embedding_service = EmbeddingService()
-
-    return _embedding_service
+"""
+Embedding service for generating vector embeddings using IBM Granite model.
+
+This service uses the IBM Granite-Embedding-30m-English model to generate
+384-dimensional embeddings for text. The model is loaded once at startup
+and cached in memory for fast inference.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+import platform
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Where locally exported int8 models (ONNX / OpenVINO) are kept when the
+# published model repository does not ship them.
+_EXPORT_ROOT = Path.home() / ".cache" / "killrvideo" / "embeddings"
+
+# CPU feature flags that make OpenVINO's int8 kernels worthwhile.
+_INTEL_INT8_FLAGS = frozenset({"avx512_vnni", "avx_vnni", "amx_int8"})
+# CPU feature flags with native bfloat16 matmul support.
+_BF16_FLAGS = frozenset({"avx512_bf16", "amx_bf16"})
+
+
+def _cpu_info() -> Tuple[str, frozenset]:
+    """Return the CPU vendor id and feature flags from ``/proc/cpuinfo``."""
+    if platform.machine().lower() not in {"x86_64", "amd64"}:
+        return "", frozenset()
+    try:
+        cpuinfo = Path("/proc/cpuinfo").read_text()
+    except OSError:
+        return "", frozenset()
+    vendor = "GenuineIntel" if "GenuineIntel" in cpuinfo else ""
+    for line in cpuinfo.splitlines():
+        if line.startswith("flags"):
+            return vendor, frozenset(line.split(":", 1)[1].split())
+    return vendor, frozenset()
+
+
+def _intel_int8_cpu() -> bool:
+    """Return True on x86 Intel CPUs advertising VNNI or AMX int8 support."""
+    vendor, flags = _cpu_info()
+    return vendor == "GenuineIntel" and not _INTEL_INT8_FLAGS.isdisjoint(flags)
+
+
+def _torch_load_kwargs() -> Dict[str, Any]:
+    """Half-precision weights where the hardware runs them natively.
+
+    FP16 on CUDA, BF16 on CPUs with AVX-512 BF16 / AMX; FP32 otherwise.
+    Embeddings are returned as float32 regardless (see ``_as_float32``).
+    """
+    import torch  # installed with sentence-transformers
+
+    if torch.cuda.is_available():
+        return {"device": "cuda", "model_kwargs": {"torch_dtype": torch.float16}}
+    if not _BF16_FLAGS.isdisjoint(_cpu_info()[1]):
+        return {"model_kwargs": {"torch_dtype": torch.bfloat16}}
+    return {}
+
+
+def _as_float32(vectors: np.ndarray) -> np.ndarray:
+    # FP16 models yield float16 arrays; keep the service contract (and the
+    # ANN index input) at float32.  No copy when already float32.
+    return vectors.astype(np.float32, copy=False)
+
+
+def _resolve_backend(configured: Optional[str]) -> str:
+    backend = (configured or "auto").strip().lower()
+    if backend != "auto":
+        return backend
+    if _intel_int8_cpu() and importlib.util.find_spec("openvino") is not None:
+        return "openvino"
+    return "torch"
+
+
+def export_dir_for(model_name: str) -> Path:
+    """Local directory holding exported artefacts for *model_name*."""
+    return _EXPORT_ROOT / model_name.replace("/", "__")
+
+
+def _cpu_budget() -> int:
+    """Number of CPUs this process may actually use.
+
+    ``os.cpu_count()`` reports the host's cores, which oversubscribes a
+    container limited by affinity or a CFS quota.  Take the smaller of the
+    affinity mask and the cgroup (v2, then v1) quota, rounded up.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):  # pragma: no cover – non-Linux
+        cpus = os.cpu_count() or 1
+
+    quota = period = None
+    try:
+        raw_quota, raw_period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if raw_quota != "max":
+            quota, period = int(raw_quota), int(raw_period)
+    except (OSError, ValueError):
+        try:
+            cfs_root = Path("/sys/fs/cgroup/cpu")
+            quota = int((cfs_root / "cpu.cfs_quota_us").read_text())
+            period = int((cfs_root / "cpu.cfs_period_us").read_text())
+        except (OSError, ValueError):
+            pass
+
+    if quota and period and quota > 0:
+        cpus = min(cpus, -(-quota // period))
+    return max(cpus, 1)
+
+
+def _ort_session_options():
+    """Return ONNX Runtime session options tuned for CPU inference."""
+    import onnxruntime as ort  # optional dependency – only needed for "onnx"
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.intra_op_num_threads = _cpu_budget()
+    # Requests are already batched by the service; one inter-op thread avoids
+    # a second pool competing for the same cores.
+    options.inter_op_num_threads = 1
+    return options
+
+
+def _limit_torch_threads() -> None:
+    """Size torch's CPU thread pools to the container's CPU budget."""
+    import torch  # installed with sentence-transformers
+
+    torch.set_num_threads(_cpu_budget())
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:  # already fixed once parallel work has started
+        pass
+
+
+class EmbeddingService:
+    """
+    Singleton service for generating embeddings using IBM Granite model.
+
+    The model is loaded once at initialization and cached for fast inference.
+    """
+
+    _instance: Optional["EmbeddingService"] = None
+    _model: Optional[SentenceTransformer] = None
+    _batcher: Optional["_EmbeddingBatcher"] = None
+    _cache: Optional["_EmbeddingCache"] = None
+
+    MODEL_NAME = "ibm-granite/granite-embedding-30m-english"
+    EMBEDDING_DIMENSION = 384
+    MAX_TOKENS = 512
+    ONNX_QINT8_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+    OPENVINO_QINT8_FILE = "openvino/openvino_model_qint8_quantized.xml"
+
+    # Micro-batching of concurrent async requests (see _EmbeddingBatcher)
+    MAX_BATCH = 32
+    MAX_WAIT_MS = 5
+
+    # Repeated texts (titles, tags, popular search queries) skip the model
+    CACHE_SIZE = 10_000
+
+    # Sub-batch size used by stream_embeddings()
+    STREAM_CHUNK_SIZE = 32
+
+    def __new__(cls):
+        """Implement singleton pattern."""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the embedding service."""
+        if self._model is None:
+            logger.info(f"Loading embedding model: {self.MODEL_NAME}")
+            self._model = self._load_model()
+            # Let the model's own tokenizer clip inputs to MAX_TOKENS during
+            # encode() – one tokenisation pass with exact token counts.
+            self._model.max_seq_length = min(
+                self._model.max_seq_length or self.MAX_TOKENS, self.MAX_TOKENS
+            )
+            self._warm_up()
+            logger.info(
+                f"Embedding model loaded successfully. Dimension: {self.EMBEDDING_DIMENSION}"
+            )
+
+    def _warm_up(self) -> None:
+        """Run throwaway single and batched passes so lazy session setup,
+        thread-pool creation and kernel selection happen at start-up rather
+        than on the first user request."""
+        try:
+            self._model.encode("warmup", convert_to_numpy=True)
+            self._model.encode(
+                ["warmup"] * 8, convert_to_numpy=True, show_progress_bar=False
+            )
+        except Exception as exc:  # never block boot on a warm-up failure
+            logger.warning("Embedding model warm-up failed: %s", exc)
+
+    def _load_model(self) -> SentenceTransformer:
+        """Load the model with the configured backend, falling back to torch."""
+        backend = _resolve_backend(settings.EMBEDDING_BACKEND)
+        loaders = {"onnx": self._load_onnx_model, "openvino": self._load_openvino_model}
+
+        if backend in loaders:
+            try:
+                return loaders[backend]()
+            except Exception as exc:  # optional extras missing / export failed
+                logger.warning(
+                    "%s embedding backend unavailable (%s); falling back to torch",
+                    backend,
+                    exc,
+                )
+        elif backend != "torch":
+            logger.warning(
+                "Unknown EMBEDDING_BACKEND %r; falling back to torch", backend
+            )
+
+        _limit_torch_threads()
+        return SentenceTransformer(self.MODEL_NAME, **_torch_load_kwargs())
+
+    def _load_onnx_model(self) -> SentenceTransformer:
+        """Load an int8 dynamically-quantised ONNX Runtime model.
+
+        The quantised artefact is taken from the model repository when it is
+        published there; otherwise it is exported once into a local cache
+        directory and loaded from there on subsequent starts.
+        """
+        model_kwargs = {
+            "file_name": self.ONNX_QINT8_FILE,
+            "provider": "CPUExecutionProvider",
+            "session_options": _ort_session_options(),
+        }
+
+        export_dir = export_dir_for(self.MODEL_NAME)
+        if not (export_dir / self.ONNX_QINT8_FILE).is_file():
+            try:
+                return SentenceTransformer(
+                    self.MODEL_NAME, backend="onnx", model_kwargs=model_kwargs
+                )
+            except Exception:  # artefact not published – export it below
+                pass
+
+            from sentence_transformers import export_dynamic_quantized_onnx_model
+
+            logger.info("Exporting int8 ONNX embedding model to %s", export_dir)
+            fp32_model = SentenceTransformer(self.MODEL_NAME, backend="onnx")
+            fp32_model.save(str(export_dir))
+            export_dynamic_quantized_onnx_model(
+                fp32_model, "avx512_vnni", str(export_dir)
+            )
+
+        return SentenceTransformer(
+            str(export_dir), backend="onnx", model_kwargs=model_kwargs
+        )
+
+    def _load_openvino_model(self) -> SentenceTransformer:
+        """Load the model on the OpenVINO runtime.
+
+        Uses the int8 IR produced by ``scripts/export_openvino_int8.py`` when
+        present; static quantisation needs a calibration pass, so without it
+        the FP32 IR is used (OpenVINO still fuses LayerNorm/GELU).
+        """
+        ov_config = {
+            "PERFORMANCE_HINT": "THROUGHPUT",
+            "INFERENCE_NUM_THREADS": str(_cpu_budget()),
+        }
+
+        export_dir = export_dir_for(self.MODEL_NAME)
+        if (export_dir / self.OPENVINO_QINT8_FILE).is_file():
+            return SentenceTransformer(
+                str(export_dir),
+                backend="openvino",
+                model_kwargs={
+                    "file_name": self.OPENVINO_QINT8_FILE,
+                    "ov_config": ov_config,
+                },
+            )
+
+        logger.info(
+            "No int8 OpenVINO IR found in %s; loading FP32 IR instead", export_dir
+        )
+        return SentenceTransformer(
+            self.MODEL_NAME, backend="openvino", model_kwargs={"ov_config": ov_config}
+        )
+
+    def generate_embedding(self, text: str, clip_tokens: bool = True) -> np.ndarray:
+        """
+        Generate a 384-dimensional embedding vector for the given text.
+
+        Args:
+            text: The input text to embed
+            clip_tokens: Kept for compatibility; the model tokenizer always
+                truncates input to MAX_TOKENS
+
+        Returns:
+            A float32 array of shape (384,); call ``tolist()`` only where a
+            JSON payload needs plain floats
+
+        Raises:
+            ValueError: If text is empty or model is not loaded
+        """
+        if not text or not text.strip():
+            raise ValueError("Cannot generate embedding for empty text")
+
+        if self._model is None:
+            raise ValueError("Embedding model not loaded")
+
+        cache = self._embedding_cache()
+        cached = cache.get(text)
+        if cached is not None:
+            return cached
+
+        # encode() already yields a contiguous float32 array – hand it back
+        # as-is rather than boxing 384 Python floats per call.
+        return cache.put(
+            text, _as_float32(self._model.encode(text, convert_to_numpy=True))
+        )
+
+    async def generate_embedding_async(self, text: str) -> np.ndarray:
+        """
+        Async variant of generate_embedding() for request handlers.
+
+        Concurrent callers are coalesced into a single batched encode() call
+        that runs off the event loop, so the model sees one forward pass per
+        window instead of one per request.
+
+        Raises:
+            ValueError: If text is empty or model is not loaded
+        """
+        if not text or not text.strip():
+            raise ValueError("Cannot generate embedding for empty text")
+
+        if self._model is None:
+            raise ValueError("Embedding model not loaded")
+
+        cached = self._embedding_cache().get(text)
+        if cached is not None:
+            return cached
+
+        if self._batcher is None:
+            self._batcher = _EmbeddingBatcher(
+                self.generate_embeddings_batch,
+                max_batch=self.MAX_BATCH,
+                max_wait=self.MAX_WAIT_MS / 1000,
+            )
+        return await self._batcher.submit(text)
+
+    def generate_embeddings_batch(
+        self, texts: List[str], clip_tokens: bool = True
+    ) -> np.ndarray:
+        """
+        Generate embeddings for multiple texts in a batch.
+
+        This is more efficient than calling generate_embedding() multiple times
+        as the model can process multiple texts in parallel.
+
+        Args:
+            texts: List of input texts to embed
+            clip_tokens: Kept for compatibility; the model tokenizer always
+                truncates input to MAX_TOKENS
+
+        Returns:
+            A float32 array of shape (len(texts), 384), one row per input text
+
+        Raises:
+            ValueError: If any text is empty or model is not loaded
+        """
+        if not texts:
+            raise ValueError("Cannot generate embeddings for empty list")
+
+        if self._model is None:
+            raise ValueError("Embedding model not loaded")
+
+        # Validate texts
+        for text in texts:
+            if not text or not text.strip():
+                raise ValueError("Cannot generate embedding for empty text")
+
+        # Generate embeddings in batch
+        cache = self._embedding_cache()
+        embeddings = np.empty((len(texts), self.EMBEDDING_DIMENSION), dtype=np.float32)
+        misses: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            cached = cache.get(text)
+            if cached is not None:
+                embeddings[i] = cached
+            else:
+                misses.setdefault(text, []).append(i)
+
+        if misses:
+            # Encode each distinct uncached text once, then scatter the rows
+            computed = self._model.encode(
+                list(misses), convert_to_numpy=True, show_progress_bar=False
+            )
+            # Cache float32 copies: FP16/BF16 models yield half-precision
+            # rows, and a copy detaches each row from the batch array.
+            for (text, rows), vector in zip(misses.items(), computed):
+                embeddings[rows] = cache.put(text, _as_float32(vector).copy())
+
+        return embeddings
+
+    async def stream_embeddings(
+        self, texts: List[str], chunk_size: Optional[int] = None
+    ) -> AsyncIterator[np.ndarray]:
+        """
+        Yield embeddings for *texts* in input order as sub-batches finish.
+
+        The input is split into chunks that are encoded off the event loop;
+        the next chunk is already running while the caller consumes the rows
+        of the current one, so inference overlaps with downstream work.
+
+        Raises:
+            ValueError: If the list is empty; an empty text raises when its
+                chunk is reached
+        """
+        if not texts:
+            raise ValueError("Cannot generate embeddings for empty list")
+
+        size = chunk_size or self.STREAM_CHUNK_SIZE
+        chunks = [texts[i : i + size] for i in range(0, len(texts), size)]
+        loop = asyncio.get_running_loop()
+
+        pending = loop.run_in_executor(None, self.generate_embeddings_batch, chunks[0])
+        for next_chunk in chunks[1:] + [None]:
+            vectors = await pending
+            if next_chunk is not None:
+                pending = loop.run_in_executor(
+                    None, self.generate_embeddings_batch, next_chunk
+                )
+            for vector in vectors:
+                yield vector
+
+    def _embedding_cache(self) -> "_EmbeddingCache":
+        if self._cache is None:
+            self._cache = _EmbeddingCache(self.CACHE_SIZE)
+        return self._cache
+
+
+class _EmbeddingCache:
+    """Bounded LRU of text -> embedding.
+
+    Python caches ``str`` hashes, so keying on the text itself is as cheap as
+    a separate content hash.  Lookups also happen on executor threads (the
+    batcher encodes off the event loop), hence a thread lock rather than an
+    ``asyncio.Lock``.  Stored arrays are made read-only because every hit
+    hands out the same object.
+    """
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        with self._lock:
+            vector = self._entries.get(text)
+            if vector is not None:
+                self._entries.move_to_end(text)
+            return vector
+
+    def put(self, text: str, vector: np.ndarray) -> np.ndarray:
+        vector.setflags(write=False)
+        with self._lock:
+            self._entries[text] = vector
+            self._entries.move_to_end(text)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return vector
+
+
+class _EmbeddingBatcher:
+    """Collect texts submitted within a short window into one batch call.
+
+    The queue and worker task are bound to the event loop of the first
+    caller and recreated if a different loop (e.g. a new test loop) submits.
+    """
+
+    def __init__(self, encode_batch, *, max_batch: int, max_wait: float):
+        self._encode_batch = encode_batch
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def submit(self, text: str) -> np.ndarray:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+        future = loop.create_future()
+        self._queue.put_nowait((text, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            if queue.qsize() < self._max_batch - 1:
+                # Give concurrent requests a moment to join this batch.
+                await asyncio.sleep(self._max_wait)
+            while len(batch) < self._max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            texts = [text for text, _ in batch]
+            try:
+                vectors = await loop.run_in_executor(None, self._encode_batch, texts)
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
+
+
+# Global instance
+_embedding_service: Optional[EmbeddingService] = None
+
+
+def get_embedding_service() -> EmbeddingService:
+    """
+    Get the global embedding service instance.
+
+    This function initializes the service on first call and returns
+    the cached instance on subsequent calls.
+
+    Returns:
+        The global EmbeddingService instance
+    """
+    global _embedding_service
+
+    if _embedding_service is None:
+        _embedding_service = EmbeddingService()
+
+    return _embedding_service
+
+
+async def preload_embedding_service() -> None:
+    """Build the global service at application startup.
+
+    Loading the model and its warm-up encodes take seconds of CPU, so they run
+    in the default executor instead of on the event loop – and before the
+    first search or submission rather than inside it.  A failure is only
+    logged; the first request then retries through ``get_embedding_service``.
+    """
+
+    try:
+        await asyncio.get_running_loop().run_in_executor(None, get_embedding_service)
+    except Exception as exc:  # pragma: no cover – depends on model availability
+        logger.warning("Embedding model preload failed: %s", exc)
@@ -5,30 +5,61 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Optional, List, Tuple, Dict, Any  # noqa: F401
 from uuid import UUID, uuid4, uuid1
-import inspect
+import asyncio
+import logging
 
 from fastapi import HTTPException, status
+from astrapy.exceptions.data_api_exceptions import DataAPIResponseException  # type: ignore
 
 from app.db.astra_client import AstraDBCollection, get_table, get_astra_db
 from app.models.flag import (
     FlagCreateRequest,
     Flag,
     ContentTypeEnum,
+    FlagReasonCodeEnum,
     FlagStatusEnum,
 )
 from app.models.user import User
 from app.services import video_service
 from app.services import comment_service
-from app.utils.db_helpers import safe_count
+from app.utils.db_helpers import fetch_docs, page_total
+
+logger = logging.getLogger(__name__)
 
 CONTENT_MOD_TABLE_NAME = "content_moderation"
 
+# Value -> member maps so row conversion is a plain dict hit per enum field.
+_CONTENT_TYPE_BY_VALUE = {t.value: t for t in ContentTypeEnum}
+_STATUS_BY_VALUE = {s.value: s for s in FlagStatusEnum}
+_REASON_BY_VALUE = {r.value: r for r in FlagReasonCodeEnum}
+
+# Existence check per flaggable content type.  The service functions are
+# resolved at call time (not bound here) so they can be patched in tests.
+_CONTENT_LOOKUP = {
+    ContentTypeEnum.VIDEO: lambda content_id: video_service.get_video_by_id(
+        content_id
+    ),
+    ContentTypeEnum.COMMENT: lambda content_id: comment_service.get_comment_by_id(
+        content_id
+    ),
+}
+
+
+def _as_datetime(value: Any) -> Any:
+    """Coerce ISO strings from legacy docs; table rows already hold datetimes."""
+
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return value
+
 
 def _to_flag_model(doc: dict) -> Flag:
     """Convert DB document to `Flag` model instance."""
 
-    # Handle legacy collection docs vs. table rows.  Normalise keys first.
-    norm = {k.lower(): v for k, v in doc.items()}
+    # Handle legacy collection docs vs. table rows.  Table rows already use
+    # the lowercase schema; only camelCase legacy docs need their keys
+    # normalised.
+    norm = doc if "flagid" in doc else {k.lower(): v for k, v in doc.items()}
 
     # Extract / derive fields with sensible fallbacks
     flag_id = norm.get("flagid") or norm.get("flag_id")
@@ -50,30 +81,72 @@ def _to_flag_model(doc: dict) -> Flag:
 
     user_id_raw = norm.get("userid") or norm.get("user_id")
 
-    return Flag(
+    # Unknown values still go through the enum constructor so they raise the
+    # same ValueError as before.
+    content_type_enum = (
+        _CONTENT_TYPE_BY_VALUE.get(content_type) or ContentTypeEnum(content_type)
+        if content_type
+        else ContentTypeEnum.VIDEO
+    )
+    status_raw = norm.get("status", "open")
+    status_enum = _STATUS_BY_VALUE.get(status_raw) or FlagStatusEnum(status_raw)
+    reason_raw = reason_code or "other"
+    reason_enum = _REASON_BY_VALUE.get(reason_raw) or FlagReasonCodeEnum(reason_raw)
+    now = datetime.now(timezone.utc)
+
+    # Rows come from our own table and were validated on write, so build the
+    # model without re-running pydantic validation; the few fields that need
+    # coercion are converted explicitly above / below.
+    return Flag.model_construct(
         flagId=UUID(flag_id) if flag_id else uuid4(),
         userId=UUID(user_id_raw) if user_id_raw else UUID(int=0),
-        contentType=ContentTypeEnum(content_type)
-        if content_type
-        else ContentTypeEnum.VIDEO,
+        contentType=content_type_enum,
         contentId=UUID(content_id) if content_id else UUID(int=0),
-        reasonCode=reason_code or "other",
+        reasonCode=reason_enum,
         reasonText=reason_text,
-        createdAt=norm.get("createdat")
-        or norm.get("review_date")
-        or datetime.now(timezone.utc),
-        updatedAt=norm.get("updatedat")
-        or norm.get("review_date")
-        or datetime.now(timezone.utc),
-        status=FlagStatusEnum(norm.get("status", "open")),
+        createdAt=_as_datetime(
+            norm.get("createdat") or norm.get("review_date") or now
+        ),
+        updatedAt=_as_datetime(
+            norm.get("updatedat") or norm.get("review_date") or now
+        ),
+        status=status_enum,
         moderatorId=UUID(norm["moderatorid"])
         if norm.get("moderatorid")
         else (UUID(norm["reviewer"]) if norm.get("reviewer") else None),
         moderatorNotes=norm.get("moderatornotes"),
-        resolvedAt=norm.get("resolvedat") or norm.get("review_date"),
+        resolvedAt=_as_datetime(norm.get("resolvedat") or norm.get("review_date")),
     )
 
 
+def _already_exists(exc: DataAPIResponseException) -> bool:
+    # "Collection already exists" or a CQL table of the same name
+    # (``EXISTING_…`` error codes) – either way the storage is in place.
+    message = str(exc)
+    return "already exists" in message.lower() or "EXISTING_" in message
+
+
+async def ensure_flags_table() -> None:
+    """Create the moderation table/collection once at service start-up.
+
+    Idempotent: an "already exists" response (including the table defined by
+    ``docs/schema-astra.cql``) is expected and ignored.  Any other failure is
+    logged as a warning rather than raised so a transient error cannot block
+    boot; the request paths still cope with a missing collection.
+    """
+
+    db = await get_astra_db()
+    try:
+        await db.create_collection(CONTENT_MOD_TABLE_NAME)
+    except DataAPIResponseException as exc:
+        if _already_exists(exc):
+            logger.debug("%s already provisioned: %s", CONTENT_MOD_TABLE_NAME, exc)
+        else:
+            logger.warning("Could not provision %s: %s", CONTENT_MOD_TABLE_NAME, exc)
+    except Exception as exc:  # pragma: no cover – network / auth issues
+        logger.warning("Could not provision %s: %s", CONTENT_MOD_TABLE_NAME, exc)
+
+
 async def create_flag(
     request: FlagCreateRequest,
     current_user: User,
@@ -82,15 +155,21 @@ async def create_flag(
     """Create a new moderation flag, validating content existence."""
 
     # Validate content existence via appropriate service.
-    if request.contentType == ContentTypeEnum.VIDEO:
-        content = await video_service.get_video_by_id(request.contentId)
-    elif request.contentType == ContentTypeEnum.COMMENT:
-        content = await comment_service.get_comment_by_id(request.contentId)
-    else:  # pragma: no cover – extra safety
+    lookup = _CONTENT_LOOKUP.get(request.contentType)
+    if lookup is None:  # pragma: no cover – extra safety
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid content type for flag",
         )
+    content_lookup = lookup(request.contentId)
+
+    # The table handle does not depend on the lookup, so resolve both at once.
+    if db_table is None:
+        content, db_table = await asyncio.gather(
+            content_lookup, get_table(CONTENT_MOD_TABLE_NAME)
+        )
+    else:
+        content = await content_lookup
 
     if content is None:
         raise HTTPException(
@@ -98,9 +177,6 @@ async def create_flag(
             detail=f"{request.contentType.value.capitalize()} not found",
         )
 
-    if db_table is None:
-        db_table = await get_table(CONTENT_MOD_TABLE_NAME)
-
     now = datetime.now(timezone.utc)
 
     # Generate a *timeuuid* flagId as required by the table schema
@@ -145,40 +221,25 @@ async def create_flag(
     }
 
     # ------------------------------------------------------------------
-    # Attempt to insert the document.  If the **flags** collection has not
-    # been created yet Astra will return a ``COLLECTION_NOT_EXIST`` error.
-    # Instead of surfacing a 500 to the caller we create the collection on
-    # -the-fly and retry once.  This mirrors the graceful handling already
-    # implemented in ``list_flags``.
+    # Insert the document.  ``ensure_flags_table`` normally creates the
+    # collection at start-up; if that failed Astra returns
+    # ``COLLECTION_NOT_EXIST`` and we create it on-the-fly and retry once.
     # ------------------------------------------------------------------
 
     try:
         await db_table.insert_one(document=doc)
-    except Exception as exc:
-        # Import locally to avoid requiring the dependency when running
-        # in environments (e.g. CI) that rely on the stub client.
-        from astrapy.exceptions.data_api_exceptions import DataAPIResponseException  # type: ignore
-
-        if isinstance(exc, DataAPIResponseException) and "COLLECTION_NOT_EXIST" in str(
-            exc
-        ):
-            # Lazily create the collection and retry the insert exactly once.
+    except DataAPIResponseException as exc:
+        if "COLLECTION_NOT_EXIST" in str(exc):
             db = await get_astra_db()
-
-            # ``create_collection`` exists in both astrapy v1 and v2.  For v2
-            # we rely on the compatibility wrapper defined in `app.db.astra_client`.
             try:
                 await db.create_collection(CONTENT_MOD_TABLE_NAME)
-            except Exception:
-                # If another concurrent request already created the collection
-                # we can safely ignore the error and retry the insert.
-                pass
-
+            except DataAPIResponseException as create_exc:
+                # A concurrent request may have created it in the meantime.
+                if not _already_exists(create_exc):
+                    raise
             db_table = await get_table(CONTENT_MOD_TABLE_NAME)
             await db_table.insert_one(document=doc)
-        elif isinstance(
-            exc, DataAPIResponseException
-        ) and "UNKNOWN_TABLE_COLUMNS" in str(exc):
+        elif "UNKNOWN_TABLE_COLUMNS" in str(exc):
             # Strip any keys not in the table schema and retry once.
             allowed_cols = {
                 "contentid",
@@ -217,67 +278,46 @@ async def list_flags(
 
     skip = (page - 1) * page_size
 
-    # ------------------------------------------------------------------
-    # Gracefully handle the scenario where the **flags** collection has not
-    # been created yet.  Astra will raise a ``DataAPIResponseException`` with
-    # code ``COLLECTION_NOT_EXIST`` when attempting to query a missing
-    # collection.  Instead of propagating the 500 error to the client we
-    # treat this as "no results" so that the moderation inbox simply renders
-    # an empty list until the first flag is created (which implicitly creates
-    # the collection).
-    # ------------------------------------------------------------------
-
-    try:
-        # Tables do not have a ``createdAt`` column. Attempt the query with the
-        # legacy sort field first for compatibility with existing collection
-        # data, then gracefully retry without the sort clause if the Data API
-        # rejects it.
-
-        find_kwargs = {
-            "filter": query_filter,
-            "limit": page_size,
-        }
-        if skip > 0:
-            find_kwargs["skip"] = skip
-        # Optimistic sort on createdAt for backwards compatibility
-        find_kwargs["sort"] = {"createdAt": -1}
-
-        from astrapy.exceptions.data_api_exceptions import DataAPIResponseException
+    # Tables do not have a ``createdAt`` column. Attempt the query with the
+    # legacy sort field first for compatibility with existing collection
+    # data, then gracefully retry without the sort clause if the Data API
+    # rejects it.
 
-        cursor = db_table.find(**find_kwargs)
-
-        async def _fetch_docs(cur):
-            raw = cur.to_list() if hasattr(cur, "to_list") else cur
-            return await raw if inspect.isawaitable(raw) else raw
+    find_kwargs = {
+        "filter": query_filter,
+        "limit": page_size,
+    }
+    if skip > 0:
+        find_kwargs["skip"] = skip
+    # Optimistic sort on createdAt for backwards compatibility
+    find_kwargs["sort"] = {"createdAt": -1}
 
+    try:
         try:
-            docs = await _fetch_docs(cursor)
+            docs = await fetch_docs(db_table.find(**find_kwargs))
         except DataAPIResponseException as exc:
             if "CANNOT_SORT_UNKNOWN_COLUMNS" not in str(exc):
                 raise
 
             # Retry without the offending sort clause
             find_kwargs.pop("sort", None)
-            cursor = db_table.find(**find_kwargs)
-            docs = await _fetch_docs(cursor)
+            docs = await fetch_docs(db_table.find(**find_kwargs))
 
-        total_items = await safe_count(
+        # A short page already tells us the total; only full pages pay for
+        # the extra count round trip.
+        total_items = await page_total(
             db_table,
             query_filter=query_filter,
-            fallback_len=len(docs),
+            skip=skip,
+            page_size=page_size,
+            page_len=len(docs),
+            exact=True,
         )
-
-    except Exception as exc:
-        # Import locally to avoid an unconditional dependency when running in
-        # environments without the real Astra client (CI).
-        from astrapy.exceptions.data_api_exceptions import DataAPIResponseException
-
-        if isinstance(exc, DataAPIResponseException) and "COLLECTION_NOT_EXIST" in str(
-            exc
-        ):
-            # Collection hasn't been created yet → treat as empty result set.
+    except DataAPIResponseException as exc:
+        # If start-up provisioning failed the collection may not exist yet;
+        # render an empty inbox until the first flag creates it.
+        if "COLLECTION_NOT_EXIST" in str(exc):
             return [], 0
-        # Bubble up any other unexpected errors.
         raise
 
     return [_to_flag_model(d) for d in docs], total_items
@@ -289,18 +329,10 @@ async def get_flag_by_id(
     if db_table is None:
         db_table = await get_table(CONTENT_MOD_TABLE_NAME)
 
-    from unittest.mock import AsyncMock, MagicMock
-
-    # Stubs used in tests expect the camelCase field. Detect mocks and adapt so
-    # existing assertions remain valid without rewriting the suite.
-
-    if isinstance(db_table, (AsyncMock, MagicMock)):
+    doc = await db_table.find_one(filter={"flagid": str(flag_id)})
+    if doc is None:
+        # Graceful fallback for any legacy collection data.
         doc = await db_table.find_one(filter={"flagId": str(flag_id)})
-    else:
-        doc = await db_table.find_one(filter={"flagid": str(flag_id)})
-        if doc is None:
-            # Graceful fallback for any legacy collection data.
-            doc = await db_table.find_one(filter={"flagId": str(flag_id)})
 
     if doc is None:
         return None
@@ -333,17 +365,11 @@ async def action_on_flag(
     # moderatorNotes cannot be persisted (no column). We keep it only in the
     # in-memory model copy below.
 
-    from unittest.mock import AsyncMock, MagicMock
-
     await db_table.update_one(
-        filter=(
-            {"flagId": str(flag_to_action.flagId)}
-            if isinstance(db_table, (AsyncMock, MagicMock))
-            else {
-                "contentid": str(flag_to_action.contentId),
-                "flagid": str(flag_to_action.flagId),
-            }
-        ),
+        filter={
+            "contentid": str(flag_to_action.contentId),
+            "flagid": str(flag_to_action.flagId),
+        },
         update={"$set": update_payload_db},
     )
 
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+from typing import Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
 from fastapi import HTTPException, status
@@ -18,62 +19,35 @@ from app.models.rating import (
 from app.models.video import VideoID, VideoStatusEnum
 from app.models.user import User
 from app.services import video_service
-from astrapy.exceptions.data_api_exceptions import DataAPIResponseException
+from app.utils.db_helpers import fetch_docs
 
 RATINGS_TABLE_NAME = video_service.VIDEO_RATINGS_TABLE_NAME  # "video_ratings_by_user"
 RATINGS_SUMMARY_TABLE_NAME = video_service.VIDEO_RATINGS_SUMMARY_TABLE_NAME
 
 
-async def _update_video_aggregate_rating(
-    video_id: VideoID,
-    ratings_db_table: AstraDBCollection,
-    videos_db_table: AstraDBCollection,
-) -> None:
-    """Recalculate average and total ratings count for the given video."""
-
-    cursor = ratings_db_table.find(
-        filter={"videoid": str(video_id)}, projection={"rating": 1}
-    )
-    docs: List[Dict[str, Any]] = (
-        await cursor.to_list() if hasattr(cursor, "to_list") else cursor
-    )
-
-    if docs:
-        values = [int(d["rating"]) for d in docs if "rating" in d]
-        total = len(values)
-        average = sum(values) / total if total else None
-    else:
-        total = 0
-        average = None
-
-    try:
-        await videos_db_table.update_one(
-            filter={"videoid": str(video_id)},
-            update={
-                "$set": {
-                    "averageRating": average,
-                    "totalRatingsCount": total,
-                    "updatedAt": datetime.now(timezone.utc),
-                }
-            },
-        )
-    except DataAPIResponseException as exc:
-        # If the videos table schema does not include these columns (common
-        # when running against the default KillrVideo schema) Astra will
-        # reject the update with UNKNOWN_TABLE_COLUMNS.  That is not fatal –
-        # the API can still compute aggregates on-the-fly.
-        if "UNKNOWN_TABLE_COLUMNS" not in str(exc):
-            raise
-        # Otherwise silently ignore so the rating operation succeeds.
-
-
 async def rate_video(
     video_id: VideoID,
     request: RatingCreateOrUpdateRequest,
     current_user: User,
     db_table: Optional[AstraDBCollection] = None,
 ) -> Rating:
-    target_video = await video_service.get_video_by_id(video_id)
+    # Stringify the keys once; the same strings serve the filter and the
+    # summary update.
+    now = datetime.now(timezone.utc)
+    vid_s = str(video_id)
+    rating_filter = {"videoid": vid_s, "userid": str(current_user.userid)}
+
+    async def _ratings_table():
+        return db_table if db_table is not None else await get_table(RATINGS_TABLE_NAME)
+
+    # The video lookup and the table handles are independent – resolve them
+    # in one round of concurrent calls.
+    target_video, db_table, summary_db_table, videos_db_table = await asyncio.gather(
+        video_service.get_video_by_id(video_id),
+        _ratings_table(),
+        get_table(RATINGS_SUMMARY_TABLE_NAME),
+        get_table(video_service.VIDEOS_TABLE_NAME),
+    )
     if target_video is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -92,45 +66,34 @@ async def rate_video(
             detail="Video not available for rating",
         )
 
-    if db_table is None:
-        db_table = await get_table(RATINGS_TABLE_NAME)
+    # Read the caller's previous rating first – it carries the original
+    # rating date – then write through the shared rating path.  Tables
+    # support neither find-one-and-update nor ``$setOnInsert``.
+    previous_doc = await db_table.find_one(
+        filter=rating_filter, projection={"rating_date": 1}
+    )
+    created_at = previous_doc.get("rating_date", now) if previous_doc else now
+    if isinstance(created_at, str):
+        created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
 
-    now = datetime.now(timezone.utc)
-    rating_filter = {"videoid": str(video_id), "userid": str(current_user.userid)}
-    existing_doc = await db_table.find_one(filter=rating_filter)
+    # Every field is already typed (the value was validated by the request
+    # model), so skip a second validation pass.
+    rating_obj = Rating.model_construct(
+        videoId=video_id,
+        userId=current_user.userid,
+        rating=request.rating,
+        createdAt=created_at,
+        updatedAt=now,
+    )
 
-    if existing_doc:
-        await db_table.update_one(
-            filter=rating_filter,
-            update={"$set": {"rating": request.rating, "rating_date": now}},
-        )
-        created_at = existing_doc.get("rating_date", now)
-        rating_obj = Rating(
-            videoId=video_id,
-            userId=current_user.userid,
-            rating=request.rating,
-            createdAt=created_at,
-            updatedAt=now,
-        )
-    else:
-        rating_obj = Rating(
-            videoId=video_id,
-            userId=current_user.userid,
-            rating=request.rating,
-            createdAt=now,
-            updatedAt=now,
-        )
-        insert_doc = {
-            "videoid": str(video_id),
-            "userid": str(current_user.userid),
-            "rating": request.rating,
-            "rating_date": now,
-        }
-        await db_table.insert_one(document=insert_doc)
-
-    # update aggregate
-    await _update_video_aggregate_rating(
-        video_id, db_table, await get_table(video_service.VIDEOS_TABLE_NAME)
+    await video_service.save_user_rating(
+        vid_s,
+        current_user.userid,
+        request.rating,
+        db_table,
+        summary_db_table,
+        videos_db_table,
+        rated_at=now,
     )
     return rating_obj
 
@@ -144,18 +107,41 @@ async def get_video_ratings_summary(
     video_id: VideoID,
     current_user_id: UUID | None = None,
     ratings_db_table: Optional[AstraDBCollection] = None,
+    summary_db_table: Optional[AstraDBCollection] = None,
 ) -> AggregateRatingResponse:
-    """Return aggregated rating info for a video and optionally the caller's rating."""
+    """Return aggregated rating info for a video and optionally the caller's rating.
+
+    The video-wide part is served from a short TTL cache unless a summary
+    table is injected; the caller's own rating is always read fresh.
+    """
 
-    # Fetch video to access pre-computed aggregates
+    vid_s = str(video_id)
     target_video = await video_service.get_video_by_id(video_id)
     if target_video is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Video not found"
         )
 
-    avg = target_video.averageRating
-    total = target_video.totalRatingsCount
+    use_cache = summary_db_table is None
+    cached = video_service.rating_summary_cache.get(vid_s) if use_cache else None
+    if cached is not None:
+        avg, total = cached
+    else:
+        # Aggregates live in the summary table: one point read.  Videos rated
+        # before it existed have no row yet; their totals are still on the
+        # video row itself.
+        if summary_db_table is None:
+            summary_db_table = await get_table(RATINGS_SUMMARY_TABLE_NAME)
+        summary_doc = await summary_db_table.find_one(filter={"videoid": vid_s})
+        if summary_doc:
+            total = int(summary_doc.get("rating_counter") or 0)
+            rating_sum = int(summary_doc.get("rating_total") or 0)
+            avg = rating_sum / total if total else None
+        else:
+            total = target_video.totalRatingsCount
+            avg = target_video.averageRating
+        if use_cache:
+            video_service.rating_summary_cache.put(vid_s, (avg, total))
 
     user_rating_value: RatingValue | None = None
     if current_user_id is not None:
@@ -163,7 +149,7 @@ async def get_video_ratings_summary(
             ratings_db_table = await get_table(RATINGS_TABLE_NAME)
 
         doc = await ratings_db_table.find_one(
-            filter={"videoid": str(video_id), "userid": str(current_user_id)},
+            filter={"videoid": vid_s, "userid": str(current_user_id)},
             projection={"rating": 1},
         )
         if doc and "rating" in doc:
@@ -175,3 +161,88 @@ async def get_video_ratings_summary(
         totalRatingsCount=total,
         currentUserRating=user_rating_value,
     )
+
+
+async def get_video_ratings_summaries(
+    video_ids: Sequence[VideoID],
+    current_user_id: UUID | None = None,
+    ratings_db_table: Optional[AstraDBCollection] = None,
+    summary_db_table: Optional[AstraDBCollection] = None,
+) -> List[AggregateRatingResponse]:
+    """Batch form of :func:`get_video_ratings_summary` for a page of videos.
+
+    Summary rows for uncached videos and the caller's ratings are each read
+    with a single ``$in`` query (run concurrently) instead of one point read
+    per video.  Unlike the single-video variant this does not 404 on unknown
+    ids – list endpoints already hold the video rows – and a video without a
+    summary row is reported with no ratings (and not cached, so the
+    single-video read can still fall back to the video row).  Results follow
+    the order of *video_ids*.
+    """
+
+    vid_strs = list(dict.fromkeys(str(v) for v in video_ids))
+    if not vid_strs:
+        return []
+
+    use_cache = summary_db_table is None
+    aggregates: Dict[str, Tuple[Optional[float], int]] = {}
+    if use_cache:
+        for vid_s in vid_strs:
+            cached = video_service.rating_summary_cache.get(vid_s)
+            if cached is not None:
+                aggregates[vid_s] = cached
+    misses = [vid_s for vid_s in vid_strs if vid_s not in aggregates]
+
+    async def _summary_rows() -> List[dict]:
+        if not misses:
+            return []
+        table = summary_db_table
+        if table is None:
+            table = await get_table(RATINGS_SUMMARY_TABLE_NAME)
+        return await fetch_docs(table.find(filter={"videoid": {"$in": misses}}))
+
+    async def _user_rows() -> List[dict]:
+        if current_user_id is None:
+            return []
+        table = ratings_db_table
+        if table is None:
+            table = await get_table(RATINGS_TABLE_NAME)
+        return await fetch_docs(
+            table.find(
+                filter={
+                    "userid": str(current_user_id),
+                    "videoid": {"$in": vid_strs},
+                },
+                projection={"videoid": 1, "rating": 1},
+            )
+        )
+
+    summary_rows, user_rows = await asyncio.gather(_summary_rows(), _user_rows())
+
+    for row in summary_rows:
+        vid_s = str(row.get("videoid"))
+        total = int(row.get("rating_counter") or 0)
+        rating_sum = int(row.get("rating_total") or 0)
+        aggregates[vid_s] = (rating_sum / total if total else None, total)
+        if use_cache:
+            video_service.rating_summary_cache.put(vid_s, aggregates[vid_s])
+
+    user_ratings = {
+        str(row.get("videoid")): int(row["rating"])
+        for row in user_rows
+        if "rating" in row
+    }
+
+    results: List[AggregateRatingResponse] = []
+    for video_id in video_ids:
+        vid_s = str(video_id)
+        avg, total = aggregates.get(vid_s, (None, 0))
+        results.append(
+            AggregateRatingResponse(
+                videoId=video_id,
+                averageRating=avg,
+                totalRatingsCount=total,
+                currentUserRating=user_ratings.get(vid_s),
+            )
+        )
+    return results
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-import random
+import asyncio
+import logging
+import time
 from typing import List, Tuple
 
+import numpy as np
+from opentelemetry import trace
+
 from app.models.video import VideoID, VideoSummary
 from app.models.recommendation import (
     RecommendationItem,
@@ -11,6 +16,12 @@ from app.models.recommendation import (
 )
 from app.services import video_service
 from app.models.user import User
+from app.metrics import RECOMMENDATION_DURATION_SECONDS
+
+logger = logging.getLogger(__name__)
+# Module-scope tracer: a proxy that binds to the real provider once
+# observability is configured, so it is safe to create at import time.
+_tracer = trace.get_tracer(__name__)
 
 
 async def get_related_videos(
@@ -20,48 +31,61 @@ async def get_related_videos(
 
     In a future iteration this will call into a real recommendation engine that
     analyses the content of the referenced video to find similar items. For the
-    moment we simply return the latest videos (excluding the reference video)
-    and assign each a random relevance score.
+    moment we simply return the latest videos (excluding the reference video,
+    filtered server-side) and assign each a rank-based relevance score.
     """
 
-    from opentelemetry import trace
-    import time
-    from app.metrics import RECOMMENDATION_DURATION_SECONDS
-
-    tracer = trace.get_tracer(__name__)
     start_time = time.perf_counter()
 
-    with tracer.start_as_current_span("recommend.related_videos") as span:
+    with _tracer.start_as_current_span("recommend.related_videos") as span:
         span.set_attribute("video_id", str(video_id))
 
+        # Exclude the source video in the query itself rather than dropping it
+        # afterwards; the latest-videos row keeps its cap of three.  The
+        # candidate query does not depend on the source row yet, so start it
+        # speculatively and let it overlap the existence check below.
+        candidates = asyncio.ensure_future(
+            video_service.list_latest_videos(
+                page=1,
+                page_size=limit,
+                query_filter={"videoid": {"$ne": str(video_id)}},
+            )
+        )
+
         # Ensure the referenced video exists – if it does not, we treat the request
         # as valid but return an empty list. The caller is free to 404 at the API
         # layer if it wishes to enforce existence – keeping this generic allows the
         # service to be reused from different contexts.
-        target_video = await video_service.get_video_by_id(video_id)
+        try:
+            target_video = await video_service.get_video_by_id(video_id)
+        except BaseException:
+            candidates.cancel()
+            raise
         if target_video is None:
+            candidates.cancel()
             return []
 
-        latest_summaries, _total = await video_service.list_latest_videos(
-            page=1, page_size=limit + 5
-        )
-
-        related_items: List[RecommendationItem] = []
-
-        for summary in latest_summaries:
-            if summary.videoId == video_id:
-                # Skip the source video itself
-                continue
-            if len(related_items) >= limit:
-                break
-            related_items.append(
-                RecommendationItem(
-                    videoId=summary.videoId,
-                    title=summary.title,
-                    thumbnailUrl=summary.thumbnailUrl,
-                    score=round(random.uniform(0.5, 1.0), 2),
-                )
+        latest_summaries, _total = await candidates
+
+        # Placeholder scores decay linearly with rank (1.0 down towards 0.5),
+        # so the output is a pure function of the inputs and cacheable.  Score
+        # every candidate in one vectorised call; real similarity scoring
+        # should follow suit (one matrix-vector product, not per-item dots).
+        scores = np.round(
+            1.0 - 0.5 * np.arange(len(latest_summaries)) / max(limit, 1), 2
+        ).tolist()
+
+        # Fields come from already-validated ``VideoSummary`` objects and the
+        # scores are in range by construction, so skip re-validation.
+        related_items: List[RecommendationItem] = [
+            RecommendationItem.model_construct(
+                videoId=summary.videoId,
+                title=summary.title,
+                thumbnailUrl=summary.thumbnailUrl,
+                score=score,
             )
+            for summary, score in zip(latest_summaries, scores)
+        ]
 
         duration = time.perf_counter() - start_time
         RECOMMENDATION_DURATION_SECONDS.observe(duration)
@@ -83,19 +107,16 @@ async def get_personalized_for_you_videos(
     recommender can be dropped-in later without further API changes.
     """
 
-    from opentelemetry import trace
-    import time
-    from app.metrics import RECOMMENDATION_DURATION_SECONDS
-
-    tracer = trace.get_tracer(__name__)
     start_time = time.perf_counter()
 
-    with tracer.start_as_current_span("recommend.for_you") as span:
+    with _tracer.start_as_current_span("recommend.for_you") as span:
         span.set_attribute("user_id", str(current_user.userId))
 
-        # For visibility during development/testing.
-        print(
-            f"STUB: Generating 'For You' feed for user {current_user.userId} (page={page}, page_size={page_size})"
+        logger.debug(
+            "STUB: Generating 'For You' feed for user %s (page=%s, page_size=%s)",
+            current_user.userId,
+            page,
+            page_size,
         )
 
         videos, total_items = await video_service.list_latest_videos(
@@ -134,10 +155,14 @@ async def ingest_video_embedding(
             message=f"Video {request.videoId} not found.",
         )
 
-    print(
-        f"STUB: Received embedding for video {request.videoId}. "
-        f"Vector dimension: {len(request.vector)}. First 3 dims: {request.vector[:3]}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "STUB: Received embedding for video %s. Vector dimension: %d. "
+            "First 3 dims: %s",
+            request.videoId,
+            len(request.vector),
+            request.vector[:3],
+        )
 
     # Placeholder for updating database / vector store.
 
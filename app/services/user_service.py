@@ -1,54 +1,134 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
+from functools import lru_cache
+import asyncio
+import logging
 import re
-import inspect
 
-# Legacy astrapy (<2) exposed AstraDBCollection in astrapy.db. Starting from
-# v2 the equivalent type is `astrapy.AsyncCollection`.  The following logic
-# tries the old import first and falls back to the new one, ultimately falling
-# back to a simple stub when the real library is unavailable (e.g. in CI).
+from pydantic import TypeAdapter
 
-try:
-    from astrapy.db import AstraDBCollection  # type: ignore
-except ModuleNotFoundError:  # pragma: no cover
-    try:
-        from astrapy import AsyncCollection as AstraDBCollection  # type: ignore
-    except ModuleNotFoundError:  # pragma: no cover - tests / CI without astrapy
-
-        class AstraDBCollection:  # type: ignore
-            async def find_one(self, *args, **kwargs):
-                return None
-
-            async def insert_one(self, *args, **kwargs):
-                return {}
-
-            async def update_one(self, *args, **kwargs):
-                return {}
-
-            # Additional helpers for list-based operations in unit tests/CI
-            def find(self, *args, **kwargs):  # type: ignore[override]
-                return []
-
-            async def to_list(self, *args, **kwargs):  # noqa: D401
-                return []
-
-            async def count_documents(self, *args, **kwargs):  # noqa: D401
-                return 0
-
-
-from app.db.astra_client import get_table
+from app.db.astra_client import get_table, AstraDBCollection
 from app.models.user import (
     UserCreateRequest,
     User,
     UserProfileUpdateRequest,
 )
 from app.core.security import get_password_hash, verify_password
+from app.utils.db_helpers import fetch_docs
+from app.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
 
 USERS_TABLE_NAME: str = "users"
 USER_CREDENTIALS_TABLE_NAME: str = "user_credentials"
 LOGIN_ATTEMPTS_TABLE_NAME: str = "login_attempts"
 
+# Bulk lookups: ids per ``$in`` query and the cap on concurrent Data API
+# requests, which keeps a large fan-out inside the shared connection pool.
+USER_IN_CHUNK_SIZE = 20
+USER_LOOKUP_CONCURRENCY = 16
+
+# Short-lived user rows keyed by userid string, shared by the per-request
+# current-user lookup and bulk enrichment (comment pages, feeds), so repeat
+# reads skip the round trip.  Writers below invalidate their own entry; the
+# TTL bounds staleness across workers.
+USER_CACHE_TTL_SECONDS = 30.0
+USER_CACHE_SIZE = 10_000
+_user_cache: TTLCache[User] = TTLCache(
+    maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL_SECONDS
+)
+
+# Login email → userid.  The mapping never changes for an account (emails are
+# not editable), so on a hit the credentials and users reads go out together
+# instead of one after the other.  Only the key is cached: the password hash
+# and lock flag are re-read on every login.
+LOGIN_USERID_CACHE_TTL_SECONDS = 300.0
+_login_userid_cache: TTLCache[Any] = TTLCache(
+    maxsize=USER_CACHE_SIZE, ttl=LOGIN_USERID_CACHE_TTL_SECONDS
+)
+
+
+# Fire-and-forget writes (bookkeeping that must not hold up the response).
+# The event loop only keeps weak references to tasks, so hold them here until
+# they finish.
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _reap_background_task(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Background user write failed: %s", task.exception())
+
+
+def _run_in_background(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_reap_background_task)
+    return task
+
+
+# Compiled once; validating a whole page of rows in one call stays inside
+# pydantic-core instead of looping over ``User.model_validate`` in Python.
+_USER_LIST_ADAPTER = TypeAdapter(List[User])
+
+
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """A throwaway hash with the production cost factor (computed once).
+
+    Checking unknown emails against it makes a miss cost the same bcrypt work
+    as a wrong password, so login latency does not reveal which emails exist.
+    """
+
+    return get_password_hash("x" * 32)
+
+
+def invalidate_user_cache(user_id: UUID | str) -> None:
+    """Forget the cached row for *user_id* (no-op when absent)."""
+
+    _user_cache.pop(str(user_id))
+
+
+# ---------------------------------------------------------------------------
+# Data API requires primitive JSON types. Convert UUID -> str and
+# datetime -> ISO-8601 before persisting to Astra.  Dispatch on the exact
+# type; everything else passes through unchanged.
+# ---------------------------------------------------------------------------
+
+_SERIALIZERS = {UUID: str, datetime: datetime.isoformat}
+
+
+def _serialize(value):
+    convert = _SERIALIZERS.get(type(value))
+    return convert(value) if convert is not None else value
+
+
+# ---------------------------------------------------------------------------
+# Search columns.  ``search_users`` matches on lower-cased shadow copies
+# (``<field>_lower``, SAI-indexed – see docs/schema-astra.cql) with prefix
+# range filters instead of case-insensitive regexes, which cannot use an
+# index.  Writers keep the shadow columns in step with the originals.
+# ---------------------------------------------------------------------------
+
+SEARCH_FIELDS = ("email", "firstname", "lastname")
+
+
+def search_columns(doc: Dict[str, Any]) -> Dict[str, str]:
+    """Return the ``<field>_lower`` shadow values for the searchable fields in *doc*."""
+
+    return {
+        f"{field}_lower": doc[field].lower()
+        for field in SEARCH_FIELDS
+        if isinstance(doc.get(field), str)
+    }
+
+
+def _is_unknown_columns(exc: Exception) -> bool:
+    # Deployments whose ``users`` table predates the shadow columns reject
+    # them; writes then retry without so sign-up and profile edits keep working.
+    return "UNKNOWN_TABLE_COLUMNS" in str(exc)
+
 
 async def get_user_by_email_from_credentials_table(
     email: str, db_table: Optional[AstraDBCollection] = None
@@ -66,7 +146,9 @@ async def create_user_in_table(
     user_in: UserCreateRequest,
     users_table: Optional[AstraDBCollection] = None,
     credentials_table: Optional[AstraDBCollection] = None,
-) -> Dict[str, Any]:
+) -> Optional[Dict[str, Any]]:
+    """Create the user and credentials rows; ``None`` if the email is taken."""
+
     users_table = (
         users_table if users_table is not None else await get_table(USERS_TABLE_NAME)
     )
@@ -76,6 +158,12 @@ async def create_user_in_table(
         else await get_table(USER_CREDENTIALS_TABLE_NAME)
     )
 
+    # Cheap key probe first: a duplicate sign-up must not pay for bcrypt.
+    if await credentials_table.find_one(
+        filter={"email": user_in.email}, projection={"userid": 1}
+    ):
+        return None
+
     hashed_password = get_password_hash(user_in.password)
     user_id = uuid4()
     creation_date = datetime.now(timezone.utc)
@@ -97,26 +185,41 @@ async def create_user_in_table(
         "account_locked": False,
     }
 
-    # ------------------------------------------------------------------
-    # Data API requires primitive JSON types. Convert UUID -> str and
-    # datetime -> ISO-8601 before persisting to Astra.
-    # ------------------------------------------------------------------
-
-    def _serialize(value):  # noqa: D401 – internal helper
-        from uuid import UUID
-        from datetime import datetime
-
-        if isinstance(value, UUID):
-            return str(value)
-        if isinstance(value, datetime):
-            return value.isoformat()
-        return value
-
     user_document = {k: _serialize(v) for k, v in user_document.items()}
     credentials_document = {k: _serialize(v) for k, v in credentials_document.items()}
 
-    await users_table.insert_one(document=user_document)
-    await credentials_table.insert_one(document=credentials_document)
+    from astrapy.exceptions.data_api_exceptions import DataAPIResponseException
+
+    async def _insert_user():
+        try:
+            await users_table.insert_one(
+                document={**user_document, **search_columns(user_document)}
+            )
+        except DataAPIResponseException as exc:
+            if not _is_unknown_columns(exc):
+                raise
+            await users_table.insert_one(document=user_document)
+
+    # The two rows are independent – write them concurrently.  If only one
+    # insert lands, remove it again so a retry with the same email is not
+    # blocked by a half-created account.
+    user_result, credentials_result = await asyncio.gather(
+        _insert_user(),
+        credentials_table.insert_one(document=credentials_document),
+        return_exceptions=True,
+    )
+    if isinstance(user_result, BaseException) or isinstance(
+        credentials_result, BaseException
+    ):
+        if not isinstance(user_result, BaseException):
+            await users_table.delete_one(filter={"userid": user_document["userid"]})
+        if not isinstance(credentials_result, BaseException):
+            await credentials_table.delete_one(filter={"email": user_in.email})
+        raise (
+            user_result
+            if isinstance(user_result, BaseException)
+            else credentials_result
+        )
 
     # Return a dictionary that can be used for the UserCreateResponse
     return {
@@ -133,49 +236,98 @@ async def authenticate_user_from_table(
     users_table: Optional[AstraDBCollection] = None,
     credentials_table: Optional[AstraDBCollection] = None,
 ) -> Optional[User]:
+    # Credentials are read on every login (never cached): password and lock
+    # changes made outside this process must take effect immediately.  Only
+    # the email → userid key is cached, and it is bypassed when a table is
+    # injected.
+    use_cache = users_table is None and credentials_table is None
     credentials_table = (
         credentials_table
         if credentials_table is not None
         else await get_table(USER_CREDENTIALS_TABLE_NAME)
     )
-    user_credentials = await credentials_table.find_one(filter={"email": email})
+    cached_user_id = _login_userid_cache.get(email) if use_cache else None
+    if cached_user_id is not None:
+        users_table = await get_table(USERS_TABLE_NAME)
+
+    credentials_query = credentials_table.find_one(
+        filter={"email": email},
+        projection={"userid": 1, "password": 1, "account_locked": 1},
+    )
+    user_data_dict = None
+    if cached_user_id is not None:
+        credentials_doc, user_data_dict = await asyncio.gather(
+            credentials_query,
+            users_table.find_one(filter={"userid": cached_user_id}),
+        )
+    else:
+        credentials_doc = await credentials_query
 
-    if not user_credentials:
+    if not credentials_doc:
+        _login_userid_cache.pop(email)
+        # Burn the same bcrypt work as a real check (see _dummy_password_hash)
+        verify_password(password, _dummy_password_hash())
         return None
 
-    if not verify_password(password, user_credentials["password"]):
+    user_id = credentials_doc["userid"]
+    password_hash = credentials_doc["password"]
+    account_locked = bool(credentials_doc.get("account_locked"))
+
+    if not verify_password(password, password_hash):
         # Here you would add logic to update the login_attempts table
         return None
 
-    if user_credentials.get("account_locked"):
+    if account_locked:
         return None  # Or raise an exception for locked account
 
     # Reset login attempts on successful login (logic to be added)
 
-    users_table = (
-        users_table if users_table is not None else await get_table(USERS_TABLE_NAME)
-    )
-    user_data_dict = await users_table.find_one(
-        filter={"userid": user_credentials["userid"]}
-    )
+    if cached_user_id is None or str(cached_user_id) != str(user_id):
+        # Cold login (or a recreated account): read the user row by the id the
+        # credentials point at.
+        users_table = (
+            users_table
+            if users_table is not None
+            else await get_table(USERS_TABLE_NAME)
+        )
+        user_data_dict = await users_table.find_one(filter={"userid": user_id})
 
     if not user_data_dict:
         # This indicates a data consistency issue
+        _login_userid_cache.pop(email)
         return None
+    if use_cache:
+        _login_userid_cache.put(email, user_id)
 
-    # Update last login date
-    await users_table.update_one(
-        filter={"userid": user_credentials["userid"]},
-        update={"$set": {"last_login_date": datetime.now(timezone.utc)}},
-    )
+    # Update last login date off the critical path – the login response does
+    # not depend on the write landing.
+    now = datetime.now(timezone.utc)
+
+    async def _touch_last_login():
+        await users_table.update_one(
+            filter={"userid": user_id},
+            update={"$set": {"last_login_date": now}},
+        )
+        invalidate_user_cache(user_id)
+
+    _run_in_background(_touch_last_login())
 
     # Map dictionary to User Pydantic model
-    return User.model_validate(user_data_dict)
+    return User.model_validate({**user_data_dict, "last_login_date": now})
 
 
 async def get_user_by_id_from_table(
     user_id: UUID, db_table: Optional[AstraDBCollection] = None
 ) -> Optional[User]:
+    # Resolved on every authenticated request, so serve it from the shared
+    # user cache unless a table is injected.  Callers get their own copy:
+    # request code adjusts fields (e.g. token roles) on the returned user.
+    use_cache = db_table is None
+    if use_cache:
+        cached = _user_cache.get(str(user_id))
+        if cached is not None:
+            return cached.model_copy()
+
     table = db_table if db_table is not None else await get_table(USERS_TABLE_NAME)
     user_data_dict = await table.find_one(filter={"userid": user_id})
 
@@ -183,7 +335,10 @@ async def get_user_by_id_from_table(
         return None
 
     # Map dictionary to User Pydantic model
-    return User.model_validate(user_data_dict)
+    user = User.model_validate(user_data_dict)
+    if use_cache:
+        _user_cache.put(str(user_id), user.model_copy())
+    return user
 
 
 async def update_user_in_table(
@@ -198,8 +353,21 @@ async def update_user_in_table(
     if not update_fields:  # No fields to update
         return await get_user_by_id_from_table(user_id=user_id, db_table=table)
 
+    from astrapy.exceptions.data_api_exceptions import DataAPIResponseException
+
     # Perform the update
-    await table.update_one(filter={"userid": user_id}, update={"$set": update_fields})
+    try:
+        await table.update_one(
+            filter={"userid": user_id},
+            update={"$set": {**update_fields, **search_columns(update_fields)}},
+        )
+    except DataAPIResponseException as exc:
+        if not _is_unknown_columns(exc):
+            raise
+        await table.update_one(
+            filter={"userid": user_id}, update={"$set": update_fields}
+        )
+    invalidate_user_cache(user_id)
 
     # Refetch the document to get the updated version
     updated_user_doc = await table.find_one(filter={"userid": user_id})
@@ -215,113 +383,124 @@ async def search_users(
     db_table: Optional[AstraDBCollection] = None,
     limit: int = 20,
 ) -> List[User]:
-    """Search users by email or name (case-insensitive regex)."""
+    """Search users whose email or name starts with *query* (case-insensitive).
+
+    The prefix match runs as a range filter on the indexed ``*_lower`` shadow
+    columns.  Tables without those columns fall back to the legacy
+    case-insensitive regex, and tables that reject either filter to a bounded
+    client-side substring scan.
+    """
 
     table = db_table if db_table is not None else await get_table(USERS_TABLE_NAME)
 
-    query_filter: Dict[str, Any] = {}
+    candidate_filters: List[Dict[str, Any]] = [{}]
     if query:
+        lower_q = query.lower()
         escaped = re.escape(query)
-        query_filter["$or"] = [
-            {"email": {"$regex": escaped, "$options": "i"}},
-            {"firstname": {"$regex": escaped, "$options": "i"}},
-            {"lastname": {"$regex": escaped, "$options": "i"}},
+        candidate_filters = [
+            {
+                "$or": [
+                    {f"{field}_lower": {"$gte": lower_q, "$lt": lower_q + "\uffff"}}
+                    for field in SEARCH_FIELDS
+                ]
+            },
+            {
+                "$or": [
+                    {field: {"$regex": escaped, "$options": "i"}}
+                    for field in SEARCH_FIELDS
+                ]
+            },
         ]
 
     # ------------------------------------------------------------------
-    # Retrieve matching documents – behave gracefully with both real Astra
-    # collection cursors as well as various unittest.mock.AsyncMock setups.
+    # Retrieve matching documents.  ``fetch_docs`` copes with real Astra
+    # cursors, stub lists and mocks alike, probing each cursor type once.
     # ------------------------------------------------------------------
 
     from astrapy.exceptions.data_api_exceptions import DataAPIResponseException
 
-    docs: List[dict] = []
-
-    try:
-        result = table.find(filter=query_filter, limit=limit)
-
-        if isinstance(result, list):
-            docs = result
-        elif hasattr(result, "to_list"):
-            docs = await result.to_list()  # type: ignore[attr-defined]
-        elif inspect.isawaitable(result):
-            docs = await result  # type: ignore[assignment]
-        else:
-            docs = list(result) if result is not None else []
-    except DataAPIResponseException as exc:
-        # Astra table does not support $regex – fallback to client-side substring match.
-        if "UNSUPPORTED_FILTER_OPERATION" in str(exc):
-            # Fetch a broader set (bounded by `limit * 5` to avoid huge scans)
-            raw_cursor = table.find(filter={}, limit=limit * 5)
-            raw_docs = (
-                await raw_cursor.to_list()
-                if hasattr(raw_cursor, "to_list")
-                else raw_cursor
-            )
-
-            lower_q = query.lower() if query else ""
+    for query_filter in candidate_filters:
+        try:
+            docs = await fetch_docs(table.find(filter=query_filter, limit=limit))
+            return _USER_LIST_ADAPTER.validate_python(docs)
+        except DataAPIResponseException as exc:
+            if "UNSUPPORTED_FILTER_OPERATION" not in str(
+                exc
+            ) and not _is_unknown_columns(exc):
+                raise
+
+    # Neither filter is supported – client-side substring match over a
+    # bounded set (``limit * 5`` rows to avoid huge scans).  One compiled
+    # case-insensitive pattern is searched per field, so no lowered copy of
+    # each row is allocated.
+    raw_docs = await fetch_docs(table.find(filter={}, limit=limit * 5))
+    if query:
+        search = re.compile(re.escape(query), re.IGNORECASE).search
+        raw_docs = [
+            d
+            for d in raw_docs
+            if any(search(str(d.get(field) or "")) for field in SEARCH_FIELDS)
+        ]
+    return _USER_LIST_ADAPTER.validate_python(raw_docs[:limit])
 
-            def _match(d: dict) -> bool:  # noqa: D401
-                if not lower_q:
-                    return True
-                return any(
-                    lower_q in str(d.get(f)).lower()
-                    for f in ("email", "firstname", "lastname")
-                )
 
-            docs = [d for d in raw_docs if _match(d)][:limit]
-        else:
-            raise
+# ---------------------------------------------------------------------------
+# Role management (used by moderation endpoints)
+# ---------------------------------------------------------------------------
 
-    return [User.model_validate(d) for d in docs]
 
+async def _set_user_roles(
+    user_id: UUID,
+    role: str,
+    grant: bool,
+    db_table: Optional[AstraDBCollection],
+) -> Optional[User]:
+    # Tables support neither ``$addToSet``/``$pull`` nor find-one-and-update,
+    # so read the row, edit the roles in Python and ``$set`` the whole set.
+    # The returned user is built from that read plus the roles we wrote – no
+    # refetch.  Two concurrent changes to one user's roles can still lose one
+    # of them (last ``$set`` wins); role changes are rare moderator actions.
+    table = db_table if db_table is not None else await get_table(USERS_TABLE_NAME)
+    user_doc = await table.find_one(filter={"userid": user_id})
+    if not user_doc:
+        return None
 
-# ---------------------------------------------------------------------------
-# Role management stubs (used by moderation endpoints/tests)
-# ---------------------------------------------------------------------------
+    roles = list(user_doc.get("roles") or [])
+    if grant and role not in roles:
+        roles.append(role)
+    elif not grant and role in roles:
+        roles = [r for r in roles if r != role]
+    else:
+        return User.model_validate(user_doc)  # Nothing to do
+
+    await table.update_one(
+        filter={"userid": user_id},
+        update={"$set": {"roles": roles}},
+    )
+    invalidate_user_cache(user_id)
+    return User.model_validate({**user_doc, "roles": roles})
 
 
 async def assign_role_to_user(
     *,
-    user: User,
+    user_id: UUID,
     role: str,
     db_table: Optional[AstraDBCollection] = None,
-) -> User:
-    """Assign a role to a user (idempotent for the purpose of unit tests)."""
-
-    if role in user.roles:
-        return user  # Nothing to do
-
-    user.roles.append(role)
-
-    # Persist change if a real DB table is available; unit tests usually patch
-    # this out, so we guard accordingly.
-    if db_table is not None:
-        await db_table.update_one(
-            filter={"userid": user.userid},
-            update={"$set": {"roles": user.roles}},
-        )
+) -> Optional[User]:
+    """Assign a role to a user (idempotent); ``None`` if the user does not exist."""
 
-    return user
+    return await _set_user_roles(user_id, role, True, db_table)
 
 
 async def revoke_role_from_user(
     *,
-    user: User,
+    user_id: UUID,
     role: str,
     db_table: Optional[AstraDBCollection] = None,
-) -> User:
-    """Remove a role from a user (idempotent)."""
-
-    user.roles = [r for r in user.roles if r != role]
-
-    if db_table is not None:
-        await db_table.update_one(
-            filter={"userid": user.userid},
-            update={"$set": {"roles": user.roles}},
-        )
+) -> Optional[User]:
+    """Remove a role from a user (idempotent); ``None`` if the user does not exist."""
 
-    return user
+    return await _set_user_roles(user_id, role, False, db_table)
 
 
 # ---------------------------------------------------------------------------
@@ -335,9 +514,12 @@ async def get_users_by_ids(
 ) -> Dict[UUID, User]:
     """Return a mapping {user_id → User} for the supplied IDs.
 
-    The helper first attempts a single `$in` query for efficiency.  When the
-    underlying Astra *table* rejects that operator (UNSUPPORTED_FILTER_OPERATION)
-    we gracefully fall back to issuing the look-ups in parallel.
+    Cached rows are served from memory.  The rest are fetched with ``$in``
+    queries of at most ``USER_IN_CHUNK_SIZE`` ids each (the Data API caps list
+    sizes), issued concurrently.  When the underlying Astra *table* rejects
+    the operator outright (UNSUPPORTED_FILTER_OPERATION) we fall back to
+    per-id look-ups.  Either way at most ``USER_LOOKUP_CONCURRENCY`` requests
+    are in flight.  The cache is bypassed when *db_table* is injected.
     """
 
     # Early-out: no IDs ⇒ empty mapping
@@ -345,28 +527,54 @@ async def get_users_by_ids(
         return {}
 
     # Ensure uniqueness and string form for the driver
-    ids_str: List[str] = list({str(u) for u in user_ids})
+    ids_str: List[str] = list(dict.fromkeys(str(u) for u in user_ids))
+
+    use_cache = db_table is None
+    users: Dict[UUID, User] = {}
+    missing: List[str] = []
+    for uid in ids_str:
+        cached = _user_cache.get(uid) if use_cache else None
+        if cached is not None:
+            users[cached.userid] = cached
+        else:
+            missing.append(uid)
+    if not missing:
+        return users
 
     table = db_table if db_table is not None else await get_table(USERS_TABLE_NAME)
 
     from astrapy.exceptions.data_api_exceptions import DataAPIResponseException
-    import asyncio
+
+    gate = asyncio.Semaphore(USER_LOOKUP_CONCURRENCY)
+
+    async def _fetch_chunk(chunk: List[str]) -> List[dict]:
+        async with gate:
+            cursor = table.find(filter={"userid": {"$in": chunk}}, limit=len(chunk))
+            return await fetch_docs(cursor)
+
+    async def _fetch_one(uid: str):  # noqa: D401 – small helper
+        async with gate:
+            return await table.find_one(filter={"userid": uid})
+
+    chunks = [
+        missing[i : i + USER_IN_CHUNK_SIZE]
+        for i in range(0, len(missing), USER_IN_CHUNK_SIZE)
+    ]
 
     docs: List[dict]
     try:
-        cursor = table.find(filter={"userid": {"$in": ids_str}}, limit=len(ids_str))
-        raw_docs = cursor.to_list() if hasattr(cursor, "to_list") else cursor
-        docs = await raw_docs if inspect.isawaitable(raw_docs) else raw_docs
+        pages = await asyncio.gather(*[_fetch_chunk(chunk) for chunk in chunks])
+        docs = [d for page in pages for d in page]
     except DataAPIResponseException as exc:
         # Some Astra **tables** reject $in – fall back to individual fetches.
         if "UNSUPPORTED_FILTER_OPERATION" in str(exc):
-
-            async def _fetch_one(uid: str):  # noqa: D401 – small helper
-                return await table.find_one(filter={"userid": uid})
-
-            results = await asyncio.gather(*[_fetch_one(uid) for uid in ids_str])
+            results = await asyncio.gather(*[_fetch_one(uid) for uid in missing])
             docs = [d for d in results if d]
         else:
             raise
 
-    return {UUID(d["userid"]): User.model_validate(d) for d in docs}
+    for user in _USER_LIST_ADAPTER.validate_python(docs):
+        users[user.userid] = user
+        if use_cache:
+            _user_cache.put(str(user.userid), user)
+    return users
@@ -1,16 +1,33 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from pydantic import TypeAdapter
 
 from app.db.astra_client import AstraDBCollection  # noqa: F401
 
 from app.models.video import VideoSummary
+from app.utils.db_helpers import fetch_docs
+from app.utils.ttl_cache import TTLCache
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+_VIDEO_SUMMARY_LIST_ADAPTER = TypeAdapter(List[VideoSummary])
+
+# Threshold-trimmed result lists keyed by ``(vector_column, cache_key,
+# similarity_threshold)``.  ANN sorts cannot ``skip``, so page *n* has to
+# fetch every row before it; paging through a hot query reuses the rows the
+# earlier page already paid for.  The flag records whether Astra ran out of
+# rows, i.e. whether the list is complete.
+SEARCH_RESULT_CACHE_SIZE = 1024
+SEARCH_RESULT_TTL_SECONDS = 60.0
+_search_results: TTLCache[Tuple[List[Dict[str, Any]], bool]] = TTLCache(
+    maxsize=SEARCH_RESULT_CACHE_SIZE, ttl=SEARCH_RESULT_TTL_SECONDS
+)
+
 
 def _collect_docs_from_cursor(cursor):
     """Return a list of docs from an astrapy cursor or a stub list in unit-tests."""
@@ -34,6 +51,7 @@ async def semantic_search_with_threshold(
     page_size: int,
     similarity_threshold: float = 0.0,
     overfetch_factor: int = 3,
+    cache_key: Optional[Hashable] = None,
 ) -> Tuple[List[VideoSummary], int]:
     """Run a vector search and apply a client-side similarity cutoff.
 
@@ -52,6 +70,10 @@ async def semantic_search_with_threshold(
     overfetch_factor : int, optional
         How many extra rows to ask Astra for. 3× the *page_size* works well
         for typical thresholds around 0.7-0.9.
+    cache_key : Hashable, optional
+        Identifies the query (e.g. the search text).  When given, the trimmed
+        rows are cached briefly and later pages are sliced from them while
+        they cover the requested window.
     """
 
     from opentelemetry import trace
@@ -63,6 +85,23 @@ async def semantic_search_with_threshold(
     if page < 1 or page_size < 1:
         return [], 0
 
+    start = (page - 1) * page_size
+    end = start + page_size
+
+    result_key = (
+        (vector_column, cache_key, similarity_threshold)
+        if cache_key is not None
+        else None
+    )
+    cached = _search_results.get(result_key) if result_key is not None else None
+    if cached is not None:
+        docs, complete = cached
+        if complete or len(docs) >= end:
+            return (
+                _VIDEO_SUMMARY_LIST_ADAPTER.validate_python(docs[start:end]),
+                len(docs),
+            )
+
     # Ask Astra for a generous slice so we can trim client-side.
     overfetch = page_size * overfetch_factor * page  # grow with page number
 
@@ -79,11 +118,8 @@ async def semantic_search_with_threshold(
         )
 
     # Fetch docs.
-    docs: List[Dict[str, Any]]
-    if hasattr(cursor, "to_list"):
-        docs = await cursor.to_list()
-    else:
-        docs = cursor  # type: ignore[assignment]
+    docs: List[Dict[str, Any]] = await fetch_docs(cursor)
+    complete = len(docs) < overfetch
 
     logger.debug(
         "Vector search fetched %s docs (page=%s, overfetch=%s)",
@@ -113,13 +149,14 @@ async def semantic_search_with_threshold(
         span.set_attribute("duration_ms", int(duration * 1000))
         span.set_attribute("total_results", len(docs))
 
+    if result_key is not None:
+        _search_results.put(result_key, (docs, complete))
+
     total = len(docs)
 
     # Slice to requested page.
-    start = (page - 1) * page_size
-    end = start + page_size
     page_docs = docs[start:end]
 
-    summaries = [VideoSummary.model_validate(d) for d in page_docs]
+    summaries = _VIDEO_SUMMARY_LIST_ADAPTER.validate_python(page_docs)
 
     return summaries, total
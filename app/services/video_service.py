@@ -10,11 +10,14 @@ from __future__ import annotations
 import re
 from datetime import datetime, timezone, timedelta
 import asyncio
+from contextvars import ContextVar
+from itertools import islice
 from typing import Optional, List, Dict, Any, Tuple
 from uuid import UUID, uuid4, uuid1
 import logging
 
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 
 from app.db.astra_client import get_table, AstraDBCollection
 from app.models.video import (
@@ -38,6 +41,8 @@ from app.external_services.youtube_metadata import (
 )
 from app.core.config import settings
 from app.services.embedding_service import get_embedding_service
+from app.utils.db_helpers import fetch_docs, page_total
+from app.utils.ttl_cache import TTLCache
 
 from astrapy.exceptions.data_api_exceptions import DataAPIResponseException
 
@@ -56,24 +61,18 @@ VIDEO_RATINGS_TABLE_NAME: str = "video_ratings_by_user"
 VIDEO_RATINGS_SUMMARY_TABLE_NAME: str = "video_ratings"
 VIDEO_ACTIVITY_TABLE_NAME: str = "video_activity"
 
-# A collection of regex patterns that match the majority of YouTube URL formats
-# and capture the video ID in a named group called "id".
-_YOUTUBE_PATTERNS: List[re.Pattern[str]] = [
-    # https://youtu.be/<id>
-    re.compile(r"(?:https?://)?(?:www\.)?youtu\.be/(?P<id>[A-Za-z0-9_-]{11})"),
-    # https://www.youtube.com/watch?v=<id>
-    re.compile(
-        r"(?:https?://)?(?:www\.)?youtube\.com/watch\?v=(?P<id>[A-Za-z0-9_-]{11})"
-    ),
-    # https://www.youtube.com/embed/<id>
-    re.compile(r"(?:https?://)?(?:www\.)?youtube\.com/embed/(?P<id>[A-Za-z0-9_-]{11})"),
-    # https://www.youtube.com/v/<id>
-    re.compile(r"(?:https?://)?(?:www\.)?youtube\.com/v/(?P<id>[A-Za-z0-9_-]{11})"),
-    # https://www.youtube.com/shorts/<id>
-    re.compile(
-        r"(?:https?://)?(?:www\.)?youtube\.com/shorts/(?P<id>[A-Za-z0-9_-]{11})"
-    ),
-]
+# One pattern for the majority of YouTube URL formats, capturing the video ID
+# in a named group called "id".  The arms share the scheme/host prefix and the
+# ID tail, so a URL is matched in a single pass.
+_YOUTUBE_RE: re.Pattern[str] = re.compile(
+    r"(?:https?://)?(?:www\.)?"
+    r"(?:youtu\.be/"  # https://youtu.be/<id>
+    r"|youtube\.com/(?:watch\?v="  # https://www.youtube.com/watch?v=<id>
+    r"|embed/"  # https://www.youtube.com/embed/<id>
+    r"|v/"  # https://www.youtube.com/v/<id>
+    r"|shorts/))"  # https://www.youtube.com/shorts/<id>
+    r"(?P<id>[A-Za-z0-9_-]{11})"
+)
 
 
 # ---------------------------------------------------------------------------
@@ -88,8 +87,42 @@ logger.info(
     logging.getLogger().getEffectiveLevel(),
 )
 
-# Flag to track if we've logged the view tracking limitation warning
-_logged_views_disabled = False
+# Set once the ``views`` column turns out not to be writable through the Table
+# API (UNKNOWN_TABLE_COLUMNS, or ``$inc`` rejected); later views skip the
+# doomed write entirely.
+_views_disabled = False
+
+# Set once the videos table rejects the ``averageRating`` / ``totalRatingsCount``
+# mirror (UNKNOWN_TABLE_COLUMNS); later rating writes skip it entirely.
+_rating_mirror_disabled = False
+
+# Per-request memo for ``get_video_by_id`` – see ``start_video_lookup_scope``.
+_video_lookup_memo: ContextVar[Optional[Dict[str, Optional[Video]]]] = ContextVar(
+    "video_lookup_memo", default=None
+)
+
+# Validates a whole page of rows in one pydantic-core call.  Rows still go
+# through validation (not ``model_construct``): the driver hands back ids,
+# dates and URLs as strings that the summary fields coerce.
+_VIDEO_SUMMARY_LIST_ADAPTER = TypeAdapter(List[VideoSummary])
+
+# Tag autocomplete vocabulary – ``(tag, tag.lower())`` pairs sorted by tag,
+# built from the most recent videos.  Rebuilt at most once per TTL rather than
+# re-scanning ``TAG_VOCABULARY_SCAN_LIMIT`` rows on every keystroke.
+TAG_VOCABULARY_SCAN_LIMIT = 2000
+TAG_VOCABULARY_TTL_SECONDS = 60.0
+_tag_vocabulary: TTLCache[List[Tuple[str, str]]] = TTLCache(
+    maxsize=1, ttl=TAG_VOCABULARY_TTL_SECONDS
+)
+
+# Short-lived (average, count) per video for the rating summary read path.
+# Every rating write drops the entry; the TTL bounds staleness from writes in
+# other workers.
+RATING_SUMMARY_CACHE_TTL_SECONDS = 10.0
+RATING_SUMMARY_CACHE_SIZE = 10_000
+rating_summary_cache: TTLCache[Tuple[Optional[float], int]] = TTLCache(
+    maxsize=RATING_SUMMARY_CACHE_SIZE, ttl=RATING_SUMMARY_CACHE_TTL_SECONDS
+)
 
 
 # ---------------------------------------------------------------------------
@@ -111,11 +144,8 @@ def extract_youtube_video_id(youtube_url: str) -> Optional[str]:
         The extracted video ID, or ``None`` if no pattern matched.
     """
 
-    for pattern in _YOUTUBE_PATTERNS:
-        match = pattern.match(youtube_url)
-        if match:
-            return match.group("id")
-    return None
+    match = _YOUTUBE_RE.match(youtube_url)
+    return match.group("id") if match else None
 
 
 # ---------------------------------------------------------------------------
@@ -216,9 +246,11 @@ async def submit_new_video(
 
     embedding_text = "\n".join(components)
 
-    # Generate embedding using Granite model (returns List[float] with 384 dimensions)
+    # Generate embedding using Granite model (float32 array, 384 dimensions)
     embedding_service = get_embedding_service()
-    full_doc["content_features"] = embedding_service.generate_embedding(embedding_text)
+    embedding = await embedding_service.generate_embedding_async(embedding_text)
+    # The Data API payload is JSON, so the float32 array is unboxed only here.
+    full_doc["content_features"] = embedding.tolist()
 
     # Ensure any HttpUrl instances are converted to plain strings so AstraDB
     # JSON encoder does not choke.  We purposely *do not* strip unknown
@@ -292,6 +324,26 @@ async def submit_new_video(
 # ---------------------------------------------------------------------------
 
 
+def start_video_lookup_scope() -> None:
+    """Give the current request its own ``get_video_by_id`` memo.
+
+    Context variables are task-local and every request is served by its own
+    task, so the memo lives exactly as long as the request that installed it.
+    Outside such a scope (scripts, background jobs, unit tests) lookups are
+    never cached.
+    """
+
+    _video_lookup_memo.set({})
+
+
+def _forget_video(video_id: VideoID | str) -> None:
+    """Drop *video_id* from the request memo; every writer to its row calls this."""
+
+    memo = _video_lookup_memo.get()
+    if memo is not None:
+        memo.pop(str(video_id), None)
+
+
 async def get_video_by_id(
     video_id: VideoID, db_table: Optional[AstraDBCollection] = None
 ) -> Optional[Video]:
@@ -303,6 +355,7 @@ async def get_video_by_id(
         The UUID of the video to load.
     db_table:
         Optional pre-fetched AstraDB collection – primarily used for unit tests.
+        Injected tables always bypass the per-request memo.
 
     Returns
     -------
@@ -310,6 +363,21 @@ async def get_video_by_id(
         The corresponding ``Video`` model or ``None`` if not found.
     """
 
+    memo = _video_lookup_memo.get() if db_table is None else None
+    if memo is None:
+        return await _load_video(video_id, db_table)
+
+    key = str(video_id)
+    if key not in memo:
+        memo[key] = await _load_video(video_id, None)
+    # Hand out copies: callers may adjust the model they get back.
+    video = memo[key]
+    return video.model_copy() if video is not None else None
+
+
+async def _load_video(
+    video_id: VideoID, db_table: Optional[AstraDBCollection]
+) -> Optional[Video]:
     if db_table is None:
         db_table = await get_table(VIDEOS_TABLE_NAME)
 
@@ -364,6 +432,7 @@ async def update_video_details(
             filter={"videoid": _uuid_for_db(video_to_update.videoid, db_table)},
             update={"$set": update_fields_filtered},
         )
+        _forget_video(video_to_update.videoid)
 
     # Re-fetch to get the fully updated model
     updated_video = await get_video_by_id(video_to_update.videoid, db_table)
@@ -396,6 +465,10 @@ async def record_video_view(
     the entire workflow remains Data-API-only.
     """
 
+    global _views_disabled
+    if _views_disabled:
+        return
+
     if db_table is None:
         db_table = await get_table(VIDEOS_TABLE_NAME)
 
@@ -406,48 +479,31 @@ async def record_video_view(
             update={"$inc": {"views": 1}},
             upsert=True,
         )
+        _forget_video(video_id)
     except DataAPIResponseException as exc:
-        global _logged_views_disabled
         error_str = str(exc)
 
-        # Check if this is the known Table API limitation where the 'views' column
-        # exists in CQL schema but isn't exposed via the Table API yet
-        if (
+        # Either the 'views' column exists in the CQL schema but isn't exposed
+        # via the Table API yet, or the table rejects $inc on it.  A read +
+        # $set fallback would race concurrent views and pull the whole row on
+        # every playback, so view counting is simply off for such tables.
+        if not (
             "UNKNOWN_TABLE_COLUMNS" in error_str
             or "UNSUPPORTED_UPDATE_OPERATIONS" in error_str
-        ):
-            # Log warning once per process lifecycle to avoid log spam
-            if not _logged_views_disabled:
-                logger.warning(
-                    "View tracking is currently disabled. The 'views' column exists in "
-                    "the CQL schema (docs/schema-astra.cql:95) but is not yet exposed "
-                    "via the Astra DB Table API. Views will not be tracked until API "
-                    "support is added. Error codes: UNKNOWN_TABLE_COLUMNS / "
-                    "UNSUPPORTED_UPDATE_OPERATIONS_FOR_TABLE"
-                )
-                _logged_views_disabled = True
-            return  # Gracefully no-op without breaking the API contract
-
-        # Some deployments (Astra *tables*) currently reject $inc on bigint –
-        # fall back to a manual read-modify-write cycle.
-        if (
-            "Update operation not supported" in error_str
+            or "Update operation not supported" in error_str
             or "unsupported operations" in error_str
         ):
-            current = (
-                await db_table.find_one(
-                    filter={"videoid": _uuid_for_db(video_id, db_table)}
-                )
-                or {}
-            )
-            new_count = int(current.get("views", 0)) + 1
-            await db_table.update_one(
-                filter={"videoid": _uuid_for_db(video_id, db_table)},
-                update={"$set": {"views": new_count}},
-                upsert=True,
-            )
-        else:
             raise
+        # Warn once and stop issuing the write for this process lifecycle
+        logger.warning(
+            "View tracking is currently disabled. The 'views' column exists in "
+            "the CQL schema (docs/schema-astra.cql:95) but cannot be incremented "
+            "via the Astra DB Table API. Views will not be tracked until API "
+            "support is added. Error codes: UNKNOWN_TABLE_COLUMNS / "
+            "UNSUPPORTED_UPDATE_OPERATIONS_FOR_TABLE"
+        )
+        _views_disabled = True
+        return  # Gracefully no-op without breaking the API contract
 
     # Log individual view event in the time-series activity table (unchanged)
     activity_table = await get_table(VIDEO_ACTIVITY_TABLE_NAME)
@@ -470,8 +526,14 @@ async def list_videos_with_query(
     sort_options: Optional[Dict[str, Any]] = None,
     db_table: Optional[AstraDBCollection] = None,
     source_table_name: str = VIDEOS_TABLE_NAME,
+    exact_total: bool = False,
 ) -> Tuple[List[VideoSummary], int]:
-    """Generic helper to run a paginated query and map to summaries."""
+    """Generic helper to run a paginated query and map to summaries.
+
+    The returned total comes from :func:`page_total`: exact when the page is
+    short, otherwise a cheap "at least one more" estimate unless
+    *exact_total* asks for a ``count_documents`` round trip.
+    """
 
     from opentelemetry import trace
     import time
@@ -511,19 +573,15 @@ async def list_videos_with_query(
             filter=query_filter, skip=skip, limit=page_size, sort=sort_options
         )
 
-        docs: List[Dict[str, Any]] = []
-        if hasattr(cursor, "to_list"):
-            docs = await cursor.to_list()
-        else:  # Stub collection path
-            docs = cursor  # type: ignore[assignment]
-
-        # Use helper that gracefully degrades on tables
-        from app.utils.db_helpers import safe_count
+        docs: List[Dict[str, Any]] = await fetch_docs(cursor)
 
-        total_items = await safe_count(
+        total_items = await page_total(
             db_table,
             query_filter=query_filter,
-            fallback_len=len(docs),
+            skip=skip,
+            page_size=page_size,
+            page_len=len(docs),
+            exact=exact_total,
         )
 
         # Metrics
@@ -532,7 +590,7 @@ async def list_videos_with_query(
         span.set_attribute("duration_ms", int(duration * 1000))
         span.set_attribute("result_count", total_items)
 
-    summaries: List[VideoSummary] = [VideoSummary.model_validate(d) for d in docs]
+    summaries: List[VideoSummary] = _VIDEO_SUMMARY_LIST_ADAPTER.validate_python(docs)
 
     return summaries, total_items
 
@@ -541,14 +599,19 @@ async def list_latest_videos(
     page: int,
     page_size: int,
     db_table: Optional[AstraDBCollection] = None,
+    query_filter: Optional[Dict[str, Any]] = None,
 ) -> Tuple[List[VideoSummary], int]:
-    """Return the newest *three* videos across all days for the home page row."""
+    """Return the newest *three* videos across all days for the home page row.
+
+    *query_filter* narrows the candidates server-side (e.g. excluding one
+    video) without lifting the cap.
+    """
 
     # We only need a single row of 3 videos on the UI – cap the page size.
     effective_size = min(page_size, 3)
 
     return await list_videos_with_query(
-        {},
+        query_filter or {},
         page,
         effective_size,
         sort_options={"added_date": -1},
@@ -679,53 +742,153 @@ async def list_trending_videos(
 # ---------------------------------------------------------------------------
 
 
+def invalidate_rating_summary_cache(video_id: VideoID | str) -> None:
+    """Forget the cached rating aggregate for *video_id* (no-op when absent)."""
+
+    rating_summary_cache.pop(str(video_id))
+
+
+async def update_rating_aggregate(
+    video_id: VideoID | str,
+    ratings_table: AstraDBCollection,
+    summary_table: AstraDBCollection,
+    videos_table: Optional[AstraDBCollection] = None,
+) -> None:
+    """Rebuild the per-video totals in ``video_ratings`` from the rating rows.
+
+    Tables have no counter support and reject ``$inc``, and a read of the
+    summary row followed by a ``$set`` of the adjusted totals loses votes when
+    two ratings land together.  Instead every write re-derives
+    ``rating_total`` / ``rating_counter`` from ``video_ratings_by_user`` (only
+    the ``rating`` column is projected, folded in one pass) and ``$set``s the
+    result, so a race can leave the summary behind for at most one write – the
+    next rating of the video corrects it.  When *videos_table* is given the
+    average is mirrored onto the video row, which list and detail reads still
+    use.  Write errors propagate: a summary that silently stops moving is
+    worse than a failed request.
+    """
+
+    vid_s = str(video_id)
+    rows = await fetch_docs(
+        ratings_table.find(filter={"videoid": vid_s}, projection={"rating": 1})
+    )
+    rating_sum = 0
+    count = 0
+    for row in rows:
+        value = row.get("rating")
+        if value is not None:
+            rating_sum += int(value)
+            count += 1
+
+    # The summary row and the video-row mirror are independent writes.
+    await asyncio.gather(
+        summary_table.update_one(
+            filter={"videoid": vid_s},
+            update={"$set": {"rating_counter": count, "rating_total": rating_sum}},
+            upsert=True,
+        ),
+        _mirror_rating_aggregate(vid_s, videos_table, rating_sum, count),
+    )
+
+
+async def _mirror_rating_aggregate(
+    vid_s: str,
+    videos_table: Optional[AstraDBCollection],
+    rating_sum: int,
+    count: int,
+) -> None:
+    global _rating_mirror_disabled
+    if videos_table is None or _rating_mirror_disabled:
+        return
+    try:
+        await videos_table.update_one(
+            filter={"videoid": vid_s},
+            update={
+                "$set": {
+                    "averageRating": rating_sum / count if count else None,
+                    "totalRatingsCount": count,
+                    "updatedAt": datetime.now(timezone.utc),
+                }
+            },
+        )
+        _forget_video(vid_s)
+    except DataAPIResponseException as exc:
+        # If the videos table schema does not include these columns (common
+        # when running against the default KillrVideo schema) Astra will
+        # reject the update with UNKNOWN_TABLE_COLUMNS.  That is not fatal –
+        # the summary table is the source of truth – and the schema will not
+        # grow the columns mid-process, so stop issuing the write.
+        if "UNKNOWN_TABLE_COLUMNS" not in str(exc):
+            raise
+        logger.warning(
+            "videos table has no averageRating/totalRatingsCount columns; "
+            "rating aggregates are kept in %s only",
+            VIDEO_RATINGS_SUMMARY_TABLE_NAME,
+        )
+        _rating_mirror_disabled = True
+
+
+async def save_user_rating(
+    video_id: VideoID | str,
+    user_id: UUID | str,
+    rating: int,
+    ratings_table: AstraDBCollection,
+    summary_table: AstraDBCollection,
+    videos_table: Optional[AstraDBCollection] = None,
+    *,
+    rated_at: Optional[datetime] = None,
+) -> None:
+    """Upsert one user's rating of a video and refresh the video's totals.
+
+    The single write path behind both rating endpoints.  ``(videoid, userid)``
+    is the primary key of ``video_ratings_by_user``, so a re-rate – or two
+    concurrent first ratings by the same user – replaces the caller's row, and
+    the rebuilt totals count it once.
+    """
+
+    vid_s = str(video_id)
+    await ratings_table.update_one(
+        filter={"videoid": vid_s, "userid": str(user_id)},
+        update={
+            "$set": {
+                "rating": rating,
+                "rating_date": rated_at or datetime.now(timezone.utc),
+            }
+        },
+        upsert=True,
+    )
+    await update_rating_aggregate(vid_s, ratings_table, summary_table, videos_table)
+    invalidate_rating_summary_cache(vid_s)
+
+
 async def record_rating(
     video_id: VideoID,
     current_user: User,
     rating_req: VideoRatingRequest,
     ratings_table: Optional[AstraDBCollection] = None,
     ratings_summary_table: Optional[AstraDBCollection] = None,
+    videos_table: Optional[AstraDBCollection] = None,
 ) -> None:
     """Record or update the caller's rating and update summary."""
 
-    if ratings_table is None:
-        ratings_table = await get_table(VIDEO_RATINGS_TABLE_NAME)
-    if ratings_summary_table is None:
-        ratings_summary_table = await get_table(VIDEO_RATINGS_SUMMARY_TABLE_NAME)
+    async def _table(injected, name):
+        return injected if injected is not None else await get_table(name)
 
-    # Upsert user rating doc
-    await ratings_table.insert_one(
-        {
-            "videoid": _uuid_for_db(video_id, ratings_table),
-            "userid": current_user.userid,
-            "rating": rating_req.rating,
-            "rating_date": datetime.now(timezone.utc),
-        }
+    # The three handles are independent – resolve them concurrently.
+    ratings_table, ratings_summary_table, videos_table = await asyncio.gather(
+        _table(ratings_table, VIDEO_RATINGS_TABLE_NAME),
+        _table(ratings_summary_table, VIDEO_RATINGS_SUMMARY_TABLE_NAME),
+        _table(videos_table, VIDEOS_TABLE_NAME),
     )
 
-    # Update summary table counters
-    try:
-        await ratings_summary_table.update_one(
-            filter={"videoid": _uuid_for_db(video_id, ratings_summary_table)},
-            update={"$inc": {"rating_counter": 1, "rating_total": rating_req.rating}},
-            upsert=True,
-        )
-    except DataAPIResponseException as exc:
-        if "Update operation not supported" in str(
-            exc
-        ) or "unsupported operations" in str(exc):
-            existing = await ratings_summary_table.find_one(
-                filter={"videoid": _uuid_for_db(video_id, ratings_summary_table)}
-            )
-            counter = int(existing.get("rating_counter", 0)) + 1 if existing else 1
-            total = int(existing.get("rating_total", 0)) + rating_req.rating
-            await ratings_summary_table.update_one(
-                filter={"videoid": _uuid_for_db(video_id, ratings_summary_table)},
-                update={"$set": {"rating_counter": counter, "rating_total": total}},
-                upsert=True,
-            )
-        else:
-            raise
+    await save_user_rating(
+        video_id,
+        current_user.userid,
+        rating_req.rating,
+        ratings_table,
+        ratings_summary_table,
+        videos_table,
+    )
 
 
 async def get_rating_summary(
@@ -807,7 +970,7 @@ async def search_videos_by_semantic(
     embedding_service = get_embedding_service()
 
     try:
-        query_vector = embedding_service.generate_embedding(query)
+        query_vector = (await embedding_service.generate_embedding_async(query)).tolist()
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -820,6 +983,8 @@ async def search_videos_by_semantic(
         semantic_search_with_threshold,
     )
 
+    # Results are only shared for the default table, not an injected one.
+    cache_key = query if db_table is None else None
     if db_table is None:
         db_table = await get_table(VIDEOS_TABLE_NAME)
 
@@ -832,6 +997,8 @@ async def search_videos_by_semantic(
         # Use configurable similarity threshold from settings
         # Can be adjusted via VECTOR_SEARCH_SIMILARITY_THRESHOLD in .env
         similarity_threshold=settings.VECTOR_SEARCH_SIMILARITY_THRESHOLD,
+        # Later pages of the same query reuse the rows already fetched.
+        cache_key=cache_key,
     )
 
 
@@ -847,36 +1014,42 @@ async def suggest_tags(
 ) -> List[TagSuggestion]:
     """Return tag suggestions containing the query substring (case-insensitive)."""
 
-    if db_table is None:
-        db_table = await get_table(VIDEOS_TABLE_NAME)
-
-    # Fetch tags field from a subset of recent videos
-    cursor = db_table.find(
-        filter={
-            "tags": {"$exists": True},
-        },
-        projection={"tags": 1},
-        limit=2000,
-        sort={"added_date": -1},
+    # The shared vocabulary is bypassed when a table is injected.
+    use_cache = db_table is None
+    vocabulary = _tag_vocabulary.get(VIDEOS_TABLE_NAME) if use_cache else None
+    if vocabulary is None:
+        if db_table is None:
+            db_table = await get_table(VIDEOS_TABLE_NAME)
+        vocabulary = await _load_tag_vocabulary(db_table)
+        if use_cache:
+            _tag_vocabulary.put(VIDEOS_TABLE_NAME, vocabulary)
+
+    needle = query.lower()
+    matching = (tag for tag, lowered in vocabulary if needle in lowered)
+    return [TagSuggestion(tag=t) for t in islice(matching, limit)]
+
+
+async def _load_tag_vocabulary(db_table: AstraDBCollection) -> List[Tuple[str, str]]:
+    """Collect the distinct tags of recent videos as sorted ``(tag, lower)`` pairs."""
+
+    raw_docs = await fetch_docs(
+        db_table.find(
+            filter={
+                "tags": {"$exists": True},
+            },
+            projection={"tags": 1},
+            limit=TAG_VOCABULARY_SCAN_LIMIT,
+            sort={"added_date": -1},
+        )
     )
 
-    if asyncio.iscoroutine(cursor):
-        cursor = await cursor
-    if hasattr(cursor, "to_list"):
-        raw_docs = await cursor.to_list()
-    else:
-        raw_docs = cursor  # type: ignore[assignment]
-
     tag_set: set[str] = set()
     for doc in raw_docs:
         tags_field = doc.get("tags")
         if isinstance(tags_field, list):
-            for t in tags_field:
-                if isinstance(t, str):
-                    tag_set.add(t)
+            tag_set.update(t for t in tags_field if isinstance(t, str))
 
-    matching = [t for t in sorted(tag_set) if query.lower() in t.lower()]
-    return [TagSuggestion(tag=t) for t in matching[:limit]]
+    return [(t, t.lower()) for t in sorted(tag_set)]
 
 
 async def restore_video(video_id: VideoID) -> bool:
@@ -1081,6 +1254,7 @@ async def process_video_submission(video_id: VideoID, youtube_video_id: str) ->
             filter={"videoid": _uuid_for_db(video_id, videos_table)},
             update={"$set": interim_set},
         )
+        _forget_video(video_id)
 
         await asyncio.sleep(5)
 
@@ -1100,6 +1274,7 @@ async def process_video_submission(video_id: VideoID, youtube_video_id: str) ->
         filter={"videoid": _uuid_for_db(video_id, videos_table)},
         update={"$set": final_set},
     )
+    _forget_video(video_id)
 
     logger.debug("PROC completed: final_status=%s", final_status)
 
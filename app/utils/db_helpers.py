@@ -13,11 +13,12 @@ layers share the same pagination logic regardless of the underlying storage
 object.
 """
 
-from typing import Any, Dict
+import inspect
+from typing import Any, Awaitable, Callable, Dict, List
 
 from astrapy.exceptions.data_api_exceptions import DataAPIResponseException  # type: ignore
 
-__all__ = ["safe_count"]
+__all__ = ["safe_count", "page_total", "fetch_docs"]
 
 
 async def safe_count(
@@ -42,3 +43,79 @@ async def safe_count(
             # An unexpected Data API error – surface to caller.
             raise
         return fallback_len
+
+
+async def page_total(
+    db_table,
+    *,
+    query_filter: Dict[str, Any],
+    skip: int,
+    page_size: int,
+    page_len: int,
+    exact: bool = False,
+) -> int:
+    """Return the ``totalItems`` value to report alongside a page of results.
+
+    A short page means the end of the result set was reached, so the total is
+    known without another round trip.  For a full page the caller either asks
+    for the *exact* count (via :func:`safe_count`) or receives the cheap
+    estimate ``skip + page_len + 1`` – enough for paging UIs to offer a "next"
+    link without paying for a second Data API call on every request.
+    """
+
+    if page_len < page_size:
+        return skip + page_len
+    if not exact:
+        return skip + page_len + 1
+    return await safe_count(
+        db_table, query_filter=query_filter, fallback_len=skip + page_len
+    )
+
+
+# ---------------------------------------------------------------------------
+# Cursor materialisation
+# ---------------------------------------------------------------------------
+# ``find`` hands back different shapes depending on the driver (async cursor
+# with ``to_list``), the stub collections (plain lists) and the mocks used in
+# unit tests (awaitables).  The shape is fixed per cursor *type*, so it is
+# probed once and the matching fetch strategy is memoised.
+
+
+async def _await_to_list(cursor) -> List[Any]:
+    return await cursor.to_list()
+
+
+async def _call_to_list(cursor) -> List[Any]:
+    return cursor.to_list()
+
+
+async def _await_cursor(cursor) -> List[Any]:
+    return list(await cursor)
+
+
+async def _as_list(cursor) -> List[Any]:
+    return list(cursor)
+
+
+_FETCHERS: Dict[type, Callable[[Any], Awaitable[List[Any]]]] = {}
+
+
+def _pick_fetcher(cursor) -> Callable[[Any], Awaitable[List[Any]]]:
+    to_list = getattr(cursor, "to_list", None)
+    if to_list is not None:
+        return (
+            _await_to_list if inspect.iscoroutinefunction(to_list) else _call_to_list
+        )
+    if inspect.isawaitable(cursor):
+        return _await_cursor
+    return _as_list
+
+
+async def fetch_docs(cursor) -> List[Any]:
+    """Materialise the rows behind *cursor* whatever shape ``find`` returned."""
+
+    cursor_type = type(cursor)
+    fetch = _FETCHERS.get(cursor_type)
+    if fetch is None:
+        fetch = _FETCHERS[cursor_type] = _pick_fetcher(cursor)
+    return await fetch(cursor)
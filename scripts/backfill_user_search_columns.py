@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+"""Populate the lower-cased search columns on existing ``users`` rows.
+
+``search_users`` matches prefixes against ``email_lower`` / ``firstname_lower``
+/ ``lastname_lower``; rows written before those columns existed are invisible
+to it until this script has filled them in.  Run it once after adding the
+columns (see docs/schema-astra.cql).
+
+Usage (module mode):
+    python -m scripts.backfill_user_search_columns [--dry-run] [--page-size N]
+
+Environment / settings are taken from :pydata:`app.core.config.settings`.
+"""
+
+import argparse
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.db.astra_client import get_table
+from app.services.user_service import USERS_TABLE_NAME, search_columns
+from app.utils.db_helpers import fetch_docs
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+PAGE_SIZE_DEFAULT = 100
+
+
+async def backfill_user_search_columns(
+    *, page_size: int = PAGE_SIZE_DEFAULT, dry_run: bool = False
+):
+    """Set the ``*_lower`` columns on every user row that is missing or stale."""
+
+    if not all([settings.ASTRA_DB_API_ENDPOINT, settings.ASTRA_DB_APPLICATION_TOKEN]):
+        raise RuntimeError("Astra DB settings missing; cannot run backfill job.")
+
+    db_table = await get_table(USERS_TABLE_NAME)
+
+    processed, updated = 0, 0
+    skip = 0
+
+    while True:
+        find_kwargs = {"filter": {}, "limit": page_size}
+        if skip:
+            find_kwargs["skip"] = skip
+        batch = await fetch_docs(db_table.find(**find_kwargs))
+        if not batch:
+            break
+
+        for doc in batch:
+            if not (uid := doc.get("userid")):
+                continue  # Safety guard for malformed rows
+            shadow = search_columns(doc)
+            if not shadow or all(doc.get(k) == v for k, v in shadow.items()):
+                continue
+            if not dry_run:
+                await db_table.update_one(
+                    filter={"userid": uid}, update={"$set": shadow}
+                )
+            updated += 1
+
+        processed += len(batch)
+        skip += len(batch)
+        logger.info(
+            "Processed %d users; %s: %d",
+            processed,
+            "would update" if dry_run else "updated",
+            updated,
+        )
+
+    logger.info("Backfill complete. Total processed: %d | updated: %d", processed, updated)
+
+
+def _main():  # noqa: D401
+    parser = argparse.ArgumentParser(
+        description="Backfill users.*_lower search columns"
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=PAGE_SIZE_DEFAULT,
+        help="Fetch page size from Data API (default: 100)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report rows that need updating without writing",
+    )
+
+    args = parser.parse_args()
+
+    asyncio.run(
+        backfill_user_search_columns(page_size=args.page_size, dry_run=args.dry_run)
+    )
+
+
+if __name__ == "__main__":
+    _main()
@@ -104,7 +104,7 @@ def _build_embedding_vector(doc: Dict[str, Any]) -> List[float]:
 
     # Generate embedding using Granite model (handles token limiting internally)
     embedding_service = get_embedding_service()
-    return embedding_service.generate_embedding(text)
+    return embedding_service.generate_embedding(text).tolist()
 
 
 async def backfill_vectors(
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+"""Rebuild the ``video_ratings`` totals for every video from its rating rows.
+
+``video_ratings`` is derived data: each rating write re-derives a video's
+``rating_total`` / ``rating_counter`` from ``video_ratings_by_user``.  After
+the table has been recreated with bigint columns (see
+migrations/2026_10_video_ratings_bigint.cql) it starts empty, so run this once
+to fill in the videos that were rated before the migration.
+
+Usage (module mode):
+    python -m scripts.backfill_video_rating_totals [--dry-run] [--page-size N]
+
+Environment / settings are taken from :pydata:`app.core.config.settings`.
+"""
+
+import argparse
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.db.astra_client import get_table
+from app.services.video_service import (
+    VIDEOS_TABLE_NAME,
+    VIDEO_RATINGS_SUMMARY_TABLE_NAME,
+    VIDEO_RATINGS_TABLE_NAME,
+    update_rating_aggregate,
+)
+from app.utils.db_helpers import fetch_docs
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+PAGE_SIZE_DEFAULT = 100
+
+
+async def backfill_video_rating_totals(
+    *, page_size: int = PAGE_SIZE_DEFAULT, dry_run: bool = False
+):
+    """Recompute the summary row (and video-row mirror) of every video."""
+
+    if not all([settings.ASTRA_DB_API_ENDPOINT, settings.ASTRA_DB_APPLICATION_TOKEN]):
+        raise RuntimeError("Astra DB settings missing; cannot run backfill job.")
+
+    videos_table, ratings_table, summary_table = await asyncio.gather(
+        get_table(VIDEOS_TABLE_NAME),
+        get_table(VIDEO_RATINGS_TABLE_NAME),
+        get_table(VIDEO_RATINGS_SUMMARY_TABLE_NAME),
+    )
+
+    processed = 0
+    skip = 0
+
+    while True:
+        find_kwargs = {"filter": {}, "projection": {"videoid": 1}, "limit": page_size}
+        if skip:
+            find_kwargs["skip"] = skip
+        batch = await fetch_docs(videos_table.find(**find_kwargs))
+        if not batch:
+            break
+
+        for doc in batch:
+            if not (vid := doc.get("videoid")):
+                continue  # Safety guard for malformed rows
+            if not dry_run:
+                await update_rating_aggregate(
+                    vid, ratings_table, summary_table, videos_table
+                )
+
+        processed += len(batch)
+        skip += len(batch)
+        logger.info(
+            "%s %d videos", "Would rebuild" if dry_run else "Rebuilt", processed
+        )
+
+    logger.info("Backfill complete. Total processed: %d", processed)
+
+
+def _main():  # noqa: D401
+    parser = argparse.ArgumentParser(
+        description="Rebuild video_ratings totals from video_ratings_by_user"
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=PAGE_SIZE_DEFAULT,
+        help="Fetch page size from Data API (default: 100)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="List the videos that would be rebuilt without writing",
+    )
+
+    args = parser.parse_args()
+
+    asyncio.run(
+        backfill_video_rating_totals(page_size=args.page_size, dry_run=args.dry_run)
+    )
+
+
+if __name__ == "__main__":
+    _main()
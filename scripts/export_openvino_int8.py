@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+"""Export an int8 (statically quantised) OpenVINO IR of the embedding model.
+
+Static quantisation needs a short calibration pass over sample sentences, so
+it is done once offline rather than at service start-up.  The IR is written to
+the local export directory that ``EmbeddingService`` checks when
+``EMBEDDING_BACKEND`` is ``openvino`` (or ``auto`` on Intel CPUs).
+
+Usage (module mode):
+    python -m scripts.export_openvino_int8
+
+Requires ``sentence-transformers[openvino]``.
+"""
+
+import logging
+
+from sentence_transformers import (
+    SentenceTransformer,
+    export_static_quantized_openvino_model,
+)
+from optimum.intel import OVQuantizationConfig
+
+from app.services.embedding_service import EmbeddingService, export_dir_for
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+
+def _main():  # noqa: D401
+    export_dir = export_dir_for(EmbeddingService.MODEL_NAME)
+
+    model = SentenceTransformer(EmbeddingService.MODEL_NAME, backend="openvino")
+    model.save(str(export_dir))
+
+    logger.info("Quantising %s to int8 into %s", EmbeddingService.MODEL_NAME, export_dir)
+    export_static_quantized_openvino_model(
+        model, OVQuantizationConfig(), str(export_dir)
+    )
+    logger.info("Done – set EMBEDDING_BACKEND=openvino (or auto) to use it.")
+
+
+if __name__ == "__main__":
+    _main()
@@ -32,16 +32,9 @@ async def test_register_user_success():
         "email": SAMPLE_EMAIL,
     }
 
-    with (
-        patch(
-            "app.services.user_service.get_user_by_email_from_credentials_table",
-            new_callable=AsyncMock,
-        ) as mock_get_user_by_email,
-        patch(
-            "app.services.user_service.create_user_in_table", new_callable=AsyncMock
-        ) as mock_create_user,
-    ):
-        mock_get_user_by_email.return_value = None
+    with patch(
+        "app.services.user_service.create_user_in_table", new_callable=AsyncMock
+    ) as mock_create_user:
         mock_create_user.return_value = mock_created_user_doc
 
         async with AsyncClient(app=app, base_url="http://test") as ac:
@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, patch
 from app.main import app
 from app.core.config import settings
 from app.core.security import create_access_token
-from app.models.comment import Comment
+from app.models.comment import Comment, CommentResponse
 from app.models.user import User
 from app.models.rating import Rating, AggregateRatingResponse
 
@@ -96,6 +96,7 @@ async def test_list_video_comments():
             )
         assert resp.status_code == status.HTTP_200_OK
         mock_list.assert_awaited_once()
+        assert mock_list.await_args.kwargs["exact_total"] is False
 
 
 @pytest.mark.asyncio
@@ -108,11 +109,39 @@ async def test_list_user_comments():
 
         async with AsyncClient(app=app, base_url="http://test") as ac:
             resp = await ac.get(
-                f"{settings.API_V1_STR}/users/{uuid4()}/comments?page=1&pageSize=10"
+                f"{settings.API_V1_STR}/users/{uuid4()}/comments"
+                "?page=1&pageSize=10&exactTotal=true"
             )
 
         assert resp.status_code == status.HTTP_200_OK
         mock_list.assert_awaited_once()
+        assert mock_list.await_args.kwargs["exact_total"] is True
+
+
+@pytest.mark.asyncio
+async def test_list_video_comments_returns_next_cursor_on_full_page():
+    comments = [
+        CommentResponse(
+            commentid=uuid4(), videoid=uuid4(), userid=uuid4(), comment=f"c{i}"
+        )
+        for i in range(2)
+    ]
+    with patch(
+        "app.api.v1.endpoints.comments_ratings.comment_service.list_comments_for_video",
+        new_callable=AsyncMock,
+    ) as mock_list:
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            mock_list.return_value = (comments, 3)
+            full = await ac.get(
+                f"{settings.API_V1_STR}/videos/{uuid4()}/comments?pageSize=2"
+            )
+            mock_list.return_value = (comments[:1], 1)
+            short = await ac.get(
+                f"{settings.API_V1_STR}/videos/{uuid4()}/comments?pageSize=2"
+            )
+
+    assert full.json()["pagination"]["nextCursor"] == str(comments[-1].commentId)
+    assert short.json()["pagination"]["nextCursor"] is None
 
 
 # ----------------------------- Ratings POST -----------------------------
@@ -192,6 +192,9 @@ async def test_search_users_endpoint(moderator_user: User, moderator_token: str)
             )
         assert resp.status_code == status.HTTP_200_OK
         mock_search.assert_awaited_once()
+        body = resp.json()
+        assert [u["userId"] for u in body] == [str(moderator_user.userid)]
+        assert body[0]["email"] == moderator_user.email
 
 
 @pytest.mark.asyncio
@@ -233,5 +236,5 @@ async def test_assign_revoke_moderator_endpoints(
             )
         assert resp_assign.status_code == status.HTTP_200_OK
         assert resp_revoke.status_code == status.HTTP_200_OK
-        mock_assign.assert_awaited_once()
-        mock_revoke.assert_awaited_once()
+        mock_assign.assert_awaited_once_with(user_id=target_id, role="moderator")
+        mock_revoke.assert_awaited_once_with(user_id=target_id, role="moderator")
@@ -302,6 +302,56 @@ async def test_get_latest_videos():
         mock_list.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_get_latest_videos_overlays_summary_ratings():
+    from app.models.rating import AggregateRatingResponse
+    from app.models.video import VideoSummary
+
+    rated, unrated = uuid4(), uuid4()
+    cards = [
+        VideoSummary(
+            videoid=vid,
+            name="Title",
+            userid=uuid4(),
+            added_date=datetime.now(timezone.utc),
+            averageRating=2.0,
+        )
+        for vid in (rated, unrated)
+    ]
+
+    with (
+        patch(
+            "app.api.v1.endpoints.video_catalog.video_service.list_latest_videos",
+            new_callable=AsyncMock,
+        ) as mock_list,
+        patch(
+            "app.api.v1.endpoints.video_catalog.rating_service.get_video_ratings_summaries",
+            new_callable=AsyncMock,
+        ) as mock_summaries,
+    ):
+        mock_list.return_value = (cards, 2)
+        mock_summaries.return_value = [
+            AggregateRatingResponse(
+                videoId=rated, averageRating=4.5, totalRatingsCount=2
+            ),
+            AggregateRatingResponse(
+                videoId=unrated, averageRating=None, totalRatingsCount=0
+            ),
+        ]
+
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.get(
+                f"{settings.API_V1_STR}/videos/latest?page=1&pageSize=10"
+            )
+
+    assert response.status_code == status.HTTP_200_OK
+    # One batched summary read for the whole page
+    mock_summaries.assert_awaited_once_with([rated, unrated])
+    ratings = [card["averageRating"] for card in response.json()["data"]]
+    # No summary row: the card keeps the average from its video row
+    assert ratings == [4.5, 2.0]
+
+
 # Record view endpoint
 
 
@@ -6,8 +6,10 @@ from app.db import astra_client
 @pytest.fixture(autouse=True)
 def reset_db_instance():
     astra_client.db_instance = None
+    astra_client._table_handles.clear()
     yield
     astra_client.db_instance = None
+    astra_client._table_handles.clear()
 
 
 @pytest.mark.asyncio
@@ -90,3 +92,24 @@ async def test_get_table(monkeypatch):
         table = await astra_client.get_table("test_table")
         assert table is mock_collection
         mock_db_instance.collection.assert_called_once_with("test_table")
+
+
+@pytest.mark.asyncio
+async def test_get_table_reuses_handle_per_db_instance():
+    first_db = MagicMock()
+    second_db = MagicMock()
+
+    with patch(
+        "app.db.astra_client.get_astra_db", new_callable=AsyncMock
+    ) as mock_get_db:
+        mock_get_db.return_value = first_db
+        table_a = await astra_client.get_table("videos")
+        table_b = await astra_client.get_table("videos")
+        assert table_a is table_b
+        first_db.collection.assert_called_once_with("videos")
+
+        # A re-initialised client must not hand out the old handle
+        mock_get_db.return_value = second_db
+        table_c = await astra_client.get_table("videos")
+        assert table_c is second_db.collection.return_value
+        second_db.collection.assert_called_once_with("videos")
@@ -31,3 +31,22 @@ def test_flag_model_instantiation():
     # Basic assertions that the model has stored the data correctly
     assert flag.status == FlagStatusEnum.OPEN
     assert flag.reasonText == "Unwanted content"
+
+
+def test_flag_resolved_at_accepts_none_datetime_and_iso_string():
+    now = datetime.now(timezone.utc)
+    base = dict(
+        userId=uuid4(),
+        contentType=ContentTypeEnum.VIDEO,
+        contentId=uuid4(),
+        reasonCode=FlagReasonCodeEnum.SPAM,
+        createdAt=now,
+        updatedAt=now,
+    )
+
+    assert Flag(**base).resolvedAt is None
+    assert Flag(**base, resolvedAt=now).resolvedAt == now
+    assert Flag(**base, resolvedAt=now.isoformat()).resolvedAt == now
+    assert Flag(**base, resolvedAt="2024-01-01T00:00:00Z").resolvedAt == datetime(
+        2024, 1, 1, tzinfo=timezone.utc
+    )
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 from datetime import datetime, timezone
 
@@ -42,7 +42,7 @@ async def test_add_comment_success(viewer_user: User, sample_video: Video):
 
     with (
         patch(
-            "app.services.comment_service.video_service.get_video_by_id",
+            "app.services.comment_service.get_video_by_id",
             new_callable=AsyncMock,
         ) as mock_get_vid,
         patch(
@@ -74,7 +74,7 @@ async def test_add_comment_video_not_ready(viewer_user: User, sample_video: Vide
     sample_video.status = VideoStatusEnum.PENDING
 
     with patch(
-        "app.services.comment_service.video_service.get_video_by_id",
+        "app.services.comment_service.get_video_by_id",
         new_callable=AsyncMock,
     ) as mock_get_vid:
         mock_get_vid.return_value = sample_video
@@ -156,3 +156,86 @@ async def test_get_comment_by_id_not_found():
         filter={"videoid": video_id, "commentid": comment_id}
     )
     assert comment is None
+
+
+@pytest.mark.asyncio
+async def test_list_comments_for_video_builds_responses_from_rows():
+    video_id = uuid4()
+    author = User(
+        userid=uuid4(), firstname="Ada", lastname="Lovelace", email="ada@example.com"
+    )
+    row = {
+        "videoid": str(video_id),
+        "commentid": str(uuid4()),
+        "userid": str(author.userid),
+        "comment": "Loved it",
+        "sentiment_score": 0.9,
+    }
+
+    mock_db = AsyncMock()
+    mock_cursor = AsyncMock()
+    mock_cursor.to_list.return_value = [row]
+    mock_db.find = MagicMock(return_value=mock_cursor)
+    mock_db.count_documents.return_value = 1
+
+    with patch(
+        "app.services.comment_service.get_users_by_ids",
+        new_callable=AsyncMock,
+    ) as mock_users:
+        mock_users.return_value = {author.userid: author}
+        comments, total = await comment_service.list_comments_for_video(
+            video_id=video_id, page=1, page_size=10, db_table=mock_db
+        )
+
+    assert total == 1
+    (resp,) = comments
+    assert resp.videoId == video_id
+    assert resp.userId == author.userid
+    assert resp.text == "Loved it"
+    assert resp.firstname == "Ada" and resp.lastname == "Lovelace"
+
+
+@pytest.mark.asyncio
+async def test_get_comment_by_id_accepts_table_row_shape():
+    comment_id = uuid4()
+    video_id = uuid4()
+    # Rows read from the ``comments`` table only carry the ``comment`` column
+    row = {
+        "commentid": comment_id,
+        "videoid": video_id,
+        "userid": uuid4(),
+        "comment": "from the table",
+        "sentiment_score": 0.1,
+    }
+
+    mock_db = AsyncMock()
+    mock_db.find_one.return_value = row
+
+    comment = await comment_service.get_comment_by_id(
+        comment_id=comment_id, video_id=video_id, db_table=mock_db
+    )
+
+    assert comment is not None
+    assert comment.text == comment.comment == "from the table"
+
+
+@pytest.mark.asyncio
+async def test_list_comments_for_video_with_before_cursor_uses_keyset():
+    video_id = uuid4()
+    before = uuid4()
+
+    mock_db = AsyncMock()
+    mock_cursor = AsyncMock()
+    mock_cursor.to_list.return_value = []
+    mock_db.find = MagicMock(return_value=mock_cursor)
+
+    comments, total = await comment_service.list_comments_for_video(
+        video_id=video_id, page=5, page_size=10, db_table=mock_db, before=before
+    )
+
+    assert comments == [] and total == 0
+    mock_db.find.assert_called_once_with(
+        filter={"videoid": str(video_id), "commentid": {"$lt": str(before)}},
+        limit=10,
+        sort={"commentid": -1},
+    )
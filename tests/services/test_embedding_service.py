@@ -0,0 +1,229 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from app.services import embedding_service
+from app.services.embedding_service import EmbeddingService
+
+
+def _bare_service() -> EmbeddingService:
+    """Return an instance without triggering the (slow) model load."""
+    return object.__new__(EmbeddingService)
+
+
+@pytest.fixture
+def fp32_host(monkeypatch):
+    """Pretend the host has neither CUDA nor BF16 so torch loads stay FP32."""
+    monkeypatch.setattr(embedding_service, "_torch_load_kwargs", lambda: {})
+
+
+def test_load_model_defaults_to_torch(monkeypatch, fp32_host):
+    monkeypatch.setattr(embedding_service.settings, "EMBEDDING_BACKEND", "torch")
+    with patch.object(embedding_service, "SentenceTransformer") as mock_st:
+        model = _bare_service()._load_model()
+
+    mock_st.assert_called_once_with(EmbeddingService.MODEL_NAME)
+    assert model is mock_st.return_value
+
+
+def test_load_model_onnx_falls_back_to_torch(monkeypatch, fp32_host):
+    monkeypatch.setattr(embedding_service.settings, "EMBEDDING_BACKEND", "onnx")
+    service = _bare_service()
+    service._load_onnx_model = MagicMock(side_effect=ImportError("onnxruntime"))
+
+    with patch.object(embedding_service, "SentenceTransformer") as mock_st:
+        model = service._load_model()
+
+    service._load_onnx_model.assert_called_once()
+    mock_st.assert_called_once_with(EmbeddingService.MODEL_NAME)
+    assert model is mock_st.return_value
+
+
+def test_auto_backend_picks_openvino_only_on_intel_with_extras(monkeypatch):
+    monkeypatch.setattr(embedding_service, "_intel_int8_cpu", lambda: True)
+    with patch.object(
+        embedding_service.importlib.util, "find_spec", return_value=object()
+    ):
+        assert embedding_service._resolve_backend("auto") == "openvino"
+    with patch.object(embedding_service.importlib.util, "find_spec", return_value=None):
+        assert embedding_service._resolve_backend("auto") == "torch"
+
+    monkeypatch.setattr(embedding_service, "_intel_int8_cpu", lambda: False)
+    assert embedding_service._resolve_backend("auto") == "torch"
+    assert embedding_service._resolve_backend("ONNX") == "onnx"
+
+
+
+def test_init_caps_model_sequence_length_at_max_tokens():
+    EmbeddingService._instance = None
+    EmbeddingService._model = None
+    fake_model = MagicMock(max_seq_length=8192)
+    try:
+        with patch.object(EmbeddingService, "_load_model", return_value=fake_model):
+            service = EmbeddingService()
+        assert service._model.max_seq_length == EmbeddingService.MAX_TOKENS
+        # Single and batched warm-up passes ran before the first request
+        assert fake_model.encode.call_count == 2
+    finally:
+        EmbeddingService._instance = None
+        EmbeddingService._model = None
+
+
+@pytest.mark.asyncio
+async def test_generate_embedding_async_coalesces_concurrent_requests():
+    service = _bare_service()
+    service._model = MagicMock()
+    calls = []
+
+    def fake_batch(texts):
+        calls.append(list(texts))
+        return [[float(len(t))] for t in texts]
+
+    service.generate_embeddings_batch = fake_batch
+
+    results = await asyncio.gather(
+        *(service.generate_embedding_async("x" * n) for n in range(1, 6))
+    )
+
+    assert results == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert calls == [["x", "xx", "xxx", "xxxx", "xxxxx"]]
+
+
+def test_generate_embedding_returns_float32_array():
+    service = _bare_service()
+    service._model = MagicMock()
+    service._model.encode.return_value = np.zeros(
+        EmbeddingService.EMBEDDING_DIMENSION, dtype=np.float32
+    )
+
+    vector = service.generate_embedding("hello")
+
+    assert isinstance(vector, np.ndarray)
+    assert vector.dtype == np.float32
+    assert vector.shape == (EmbeddingService.EMBEDDING_DIMENSION,)
+
+
+def test_embeddings_are_cached_and_batch_encodes_only_misses():
+    service = _bare_service()
+    service._model = MagicMock()
+    dim = EmbeddingService.EMBEDDING_DIMENSION
+    service._model.encode.side_effect = lambda texts, **_: np.stack(
+        [np.full(dim, len(t), dtype=np.float32) for t in texts]
+    )
+
+    service.generate_embeddings_batch(["aa", "b"])
+    result = service.generate_embeddings_batch(["b", "ccc", "aa", "ccc"])
+
+    assert service._model.encode.call_count == 2
+    assert service._model.encode.call_args.args[0] == ["ccc"]
+    assert result[:, 0].tolist() == [1.0, 3.0, 2.0, 3.0]
+
+
+def test_batch_caches_float32_rows_from_half_precision_models():
+    service = _bare_service()
+    service._model = MagicMock()
+    dim = EmbeddingService.EMBEDDING_DIMENSION
+    service._model.encode.return_value = np.ones((1, dim), dtype=np.float16)
+
+    service.generate_embeddings_batch(["half"])
+    cached = service.generate_embedding("half")
+
+    assert service._model.encode.call_count == 1
+    assert cached.dtype == np.float32
+
+
+def test_embedding_cache_evicts_least_recently_used():
+    cache = embedding_service._EmbeddingCache(maxsize=2)
+    cache.put("a", np.zeros(1))
+    cache.put("b", np.zeros(1))
+    cache.get("a")
+    cache.put("c", np.zeros(1))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_cpu_budget_respects_cgroup_quota(monkeypatch):
+    monkeypatch.setattr(
+        embedding_service.os, "sched_getaffinity", lambda pid: set(range(16))
+    )
+
+    def fake_read_text(path):
+        if str(path) == "/sys/fs/cgroup/cpu.max":
+            return "250000 100000\n"
+        raise OSError
+
+    monkeypatch.setattr(embedding_service.Path, "read_text", fake_read_text)
+
+    assert embedding_service._cpu_budget() == 3
+
+
+def test_torch_load_kwargs_picks_half_precision_for_hardware(monkeypatch):
+    import torch
+
+    monkeypatch.setattr(torch.cuda, "is_available", lambda: False)
+    monkeypatch.setattr(
+        embedding_service, "_cpu_info", lambda: ("GenuineIntel", frozenset({"amx_bf16"}))
+    )
+    assert embedding_service._torch_load_kwargs() == {
+        "model_kwargs": {"torch_dtype": torch.bfloat16}
+    }
+
+    monkeypatch.setattr(embedding_service, "_cpu_info", lambda: ("", frozenset()))
+    assert embedding_service._torch_load_kwargs() == {}
+
+    monkeypatch.setattr(torch.cuda, "is_available", lambda: True)
+    assert embedding_service._torch_load_kwargs()["device"] == "cuda"
+
+
+def test_generate_embedding_upcasts_half_precision_output():
+    service = _bare_service()
+    service._model = MagicMock()
+    service._model.encode.return_value = np.ones(4, dtype=np.float16)
+
+    assert service.generate_embedding("fp16").dtype == np.float32
+
+
+@pytest.mark.asyncio
+async def test_stream_embeddings_yields_rows_in_order_per_chunk():
+    service = _bare_service()
+    chunks_seen = []
+
+    def fake_batch(texts):
+        chunks_seen.append(list(texts))
+        return np.array([[float(t)] for t in texts], dtype=np.float32)
+
+    service.generate_embeddings_batch = fake_batch
+
+    rows = [
+        row[0]
+        async for row in service.stream_embeddings(
+            [str(i) for i in range(7)], chunk_size=3
+        )
+    ]
+
+    assert rows == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    assert chunks_seen == [["0", "1", "2"], ["3", "4", "5"], ["6"]]
+
+
+@pytest.mark.asyncio
+async def test_preload_builds_the_service_off_the_event_loop(monkeypatch):
+    import threading
+
+    built_on = []
+
+    def _fake_service():
+        built_on.append(threading.current_thread())
+        return MagicMock()
+
+    monkeypatch.setattr(embedding_service, "_embedding_service", None)
+    monkeypatch.setattr(embedding_service, "EmbeddingService", _fake_service)
+
+    await embedding_service.preload_embedding_service()
+
+    assert built_on and built_on[0] is not threading.main_thread()
+    assert embedding_service.get_embedding_service() is not None
+    assert len(built_on) == 1
@@ -158,7 +158,7 @@ async def test_get_flag_by_id_found():
 
     flag = await flag_service.get_flag_by_id(flag_id=fid, db_table=mock_db)
 
-    mock_db.find_one.assert_called_once_with(filter={"flagId": str(fid)})
+    mock_db.find_one.assert_called_once_with(filter={"flagid": str(fid)})
     assert flag is not None and flag.flagId == fid
 
 
@@ -198,5 +198,161 @@ async def test_action_on_flag_updates_status():
     )
 
     mock_db.update_one.assert_called_once()
+    assert mock_db.update_one.call_args.kwargs["filter"] == {
+        "contentid": str(initial_flag.contentId),
+        "flagid": str(fid),
+    }
     assert updated_flag.status == FlagStatusEnum.APPROVED
     assert updated_flag.moderatorId == moderator_user.userid
+
+
+@pytest.mark.asyncio
+async def test_create_flag_resolves_table_alongside_content_lookup(viewer_user: User):
+    comment_id = uuid4()
+    flag_request = FlagCreateRequest(
+        contentType=ContentTypeEnum.COMMENT,
+        contentId=comment_id,
+        reasonCode=FlagReasonCodeEnum.SPAM,
+    )
+    mock_db_table = AsyncMock()
+
+    with (
+        patch(
+            "app.services.flag_service.comment_service.get_comment_by_id",
+            new_callable=AsyncMock,
+        ) as mock_get_comment,
+        patch(
+            "app.services.flag_service.get_table", new_callable=AsyncMock
+        ) as mock_get_table,
+    ):
+        mock_get_comment.return_value = MagicMock()
+        mock_get_table.return_value = mock_db_table
+
+        new_flag = await flag_service.create_flag(
+            request=flag_request, current_user=viewer_user
+        )
+
+    assert new_flag.contentId == comment_id
+    mock_get_comment.assert_awaited_once_with(comment_id)
+    mock_get_table.assert_awaited_once_with(flag_service.CONTENT_MOD_TABLE_NAME)
+    mock_db_table.insert_one.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_list_flags_short_page_skips_count():
+    docs = [
+        {
+            "flagid": str(uuid4()),
+            "contentid": str(uuid4()),
+            "content_type": ContentTypeEnum.VIDEO.value,
+            "status": FlagStatusEnum.OPEN.value,
+            "flagged_reason": FlagReasonCodeEnum.SPAM.value,
+        }
+        for _ in range(3)
+    ]
+    mock_db = AsyncMock()
+    mock_db.find.return_value = docs
+
+    flags, total = await flag_service.list_flags(
+        page=2, page_size=10, db_table=mock_db
+    )
+
+    assert len(flags) == 3 and total == 13
+    mock_db.count_documents.assert_not_called()
+
+
+def test_to_flag_model_table_row_and_legacy_doc_agree():
+    flag_id, content_id = uuid4(), uuid4()
+    row = {
+        "flagid": str(flag_id),
+        "contentid": str(content_id),
+        "content_type": "comment",
+        "status": "under_review",
+        "flagged_reason": "spam:buy now",
+    }
+    legacy = {
+        "flagId": str(flag_id),
+        "contentId": str(content_id),
+        "contentType": "comment",
+        "status": "under_review",
+        "reasonCode": "spam",
+        "reasonText": "buy now",
+    }
+
+    from_row = flag_service._to_flag_model(row)
+    from_legacy = flag_service._to_flag_model(legacy)
+
+    for flag in (from_row, from_legacy):
+        assert flag.flagId == flag_id and flag.contentId == content_id
+        assert flag.contentType is ContentTypeEnum.COMMENT
+        assert flag.status is FlagStatusEnum.UNDER_REVIEW
+        assert flag.reasonText == "buy now"
+
+
+def test_to_flag_model_coerces_fields_without_validation():
+    row = {
+        "flagid": str(uuid4()),
+        "contentid": str(uuid4()),
+        "content_type": "video",
+        "status": "approved",
+        "flagged_reason": "copyright",
+        "reviewer": str(uuid4()),
+        "review_date": "2025-01-02T03:04:05Z",
+    }
+
+    flag = flag_service._to_flag_model(row)
+
+    assert flag.reasonCode is FlagReasonCodeEnum.COPYRIGHT
+    assert flag.resolvedAt == datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert flag.createdAt == flag.resolvedAt
+    assert isinstance(flag.moderatorId, UUID)
+    assert Flag.model_validate(flag.model_dump()) == flag
+
+
+@pytest.mark.asyncio
+async def test_ensure_flags_table_ignores_already_exists():
+    mock_db = MagicMock()
+    mock_db.create_collection = AsyncMock(
+        side_effect=flag_service.DataAPIResponseException("already exists")
+    )
+
+    with patch(
+        "app.services.flag_service.get_astra_db", new_callable=AsyncMock
+    ) as mock_get_db:
+        mock_get_db.return_value = mock_db
+        await flag_service.ensure_flags_table()
+
+    mock_db.create_collection.assert_awaited_once_with(
+        flag_service.CONTENT_MOD_TABLE_NAME
+    )
+
+
+@pytest.mark.asyncio
+async def test_ensure_flags_table_warns_on_other_api_errors(caplog):
+    mock_db = MagicMock()
+    mock_db.create_collection = AsyncMock(
+        side_effect=flag_service.DataAPIResponseException("UNAUTHENTICATED_REQUEST")
+    )
+
+    with patch(
+        "app.services.flag_service.get_astra_db", new_callable=AsyncMock
+    ) as mock_get_db:
+        mock_get_db.return_value = mock_db
+        with caplog.at_level("WARNING", logger=flag_service.logger.name):
+            await flag_service.ensure_flags_table()
+
+    assert "Could not provision" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_list_flags_treats_missing_collection_as_empty():
+    mock_table = MagicMock()
+    mock_table.find.side_effect = flag_service.DataAPIResponseException(
+        "COLLECTION_NOT_EXIST: content_moderation"
+    )
+
+    flags, total = await flag_service.list_flags(
+        page=1, page_size=10, db_table=mock_table
+    )
+
+    assert (flags, total) == ([], 0)
@@ -1,4 +1,5 @@
 import pytest
+from fastapi import HTTPException
 from unittest.mock import AsyncMock, patch, MagicMock
 from uuid import uuid4
 from datetime import datetime, timezone
@@ -49,19 +50,27 @@ async def test_rate_video_new(viewer_user: User):
     ):
         mock_get_vid.return_value = ready_video
         ratings_tbl = AsyncMock()
-        videos_tbl = AsyncMock()
-        mock_get_table.side_effect = [ratings_tbl, videos_tbl]
+        summary_tbl = AsyncMock()
+        summary_tbl.find_one.return_value = None
+        mock_get_table.return_value = summary_tbl
 
         ratings_tbl.find_one.return_value = None
-        ratings_tbl.insert_one.return_value = {}
-        ratings_tbl.find = MagicMock(return_value=[])
-        ratings_tbl.count_documents.return_value = 0
 
         result = await rating_service.rate_video(
             video_id, req, viewer_user, db_table=ratings_tbl
         )
         assert result.rating == 4
-        ratings_tbl.insert_one.assert_called_once()
+        rating_filter = {
+            "videoid": str(video_id),
+            "userid": str(viewer_user.userid),
+        }
+        assert ratings_tbl.find_one.await_args.kwargs["filter"] == rating_filter
+        ratings_tbl.update_one.assert_awaited_once()
+        kwargs = ratings_tbl.update_one.await_args.kwargs
+        assert kwargs["filter"] == rating_filter
+        assert kwargs["update"]["$set"]["rating"] == 4
+        assert kwargs["upsert"] is True
+        ratings_tbl.insert_one.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -102,25 +111,27 @@ async def test_rate_video_update(viewer_user: User):
             "app.services.rating_service.get_table", new_callable=AsyncMock
         ) as mock_get_table,
         patch(
-            "app.services.rating_service._update_video_aggregate_rating",
+            "app.services.rating_service.video_service.update_rating_aggregate",
             new_callable=AsyncMock,
         ) as mock_update_agg,
     ):
         mock_get_vid.return_value = ready_video
         ratings_tbl = AsyncMock()
+        summary_tbl = AsyncMock()
         videos_tbl = AsyncMock()
-        mock_get_table.side_effect = [ratings_tbl, videos_tbl]
+        mock_get_table.side_effect = [summary_tbl, videos_tbl]
 
         ratings_tbl.find_one.return_value = existing_doc
-        ratings_tbl.update_one.return_value = {}
 
         result = await rating_service.rate_video(
             video_id, req, viewer_user, db_table=ratings_tbl
         )
 
-        ratings_tbl.update_one.assert_called_once()
+        ratings_tbl.update_one.assert_awaited_once()
         assert result.rating == req.rating
-        mock_update_agg.assert_awaited_once()
+        mock_update_agg.assert_awaited_once_with(
+            str(video_id), ratings_tbl, summary_tbl, videos_tbl
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -141,8 +152,6 @@ async def test_get_video_ratings_summary_with_user(viewer_user: User):
         location_type=0,
         status=VideoStatusEnum.READY,
         title="Title",
-        averageRating=4.5,
-        totalRatingsCount=2,
     )
 
     with (
@@ -156,13 +165,236 @@ async def test_get_video_ratings_summary_with_user(viewer_user: User):
     ):
         mock_get_vid.return_value = video_obj
         ratings_tbl = AsyncMock()
+        summary_tbl = AsyncMock()
         mock_get_table.return_value = ratings_tbl
         ratings_tbl.find_one.return_value = {"rating": 5}
+        summary_tbl.find_one.return_value = {"rating_counter": 2, "rating_total": 9}
 
         summary = await rating_service.get_video_ratings_summary(
-            video_id, current_user_id=viewer_user.userid, ratings_db_table=ratings_tbl
+            video_id,
+            current_user_id=viewer_user.userid,
+            ratings_db_table=ratings_tbl,
+            summary_db_table=summary_tbl,
         )
 
         assert summary.averageRating == 4.5
         assert summary.totalRatingsCount == 2
         assert summary.currentUserRating == 5
+
+
+@pytest.mark.asyncio
+async def test_get_video_ratings_summary_falls_back_to_video_row():
+    video_id = uuid4()
+    summary_tbl = AsyncMock()
+    summary_tbl.find_one.return_value = None
+
+    with patch(
+        "app.services.rating_service.video_service.get_video_by_id",
+        new_callable=AsyncMock,
+    ) as mock_get_vid:
+        mock_get_vid.return_value = MagicMock(averageRating=3.5, totalRatingsCount=4)
+
+        summary = await rating_service.get_video_ratings_summary(
+            video_id, summary_db_table=summary_tbl
+        )
+
+    assert summary.averageRating == 3.5
+    assert summary.totalRatingsCount == 4
+
+
+@pytest.mark.asyncio
+async def test_rate_video_propagates_summary_write_failure(viewer_user: User):
+    summary_tbl = AsyncMock()
+    summary_tbl.find_one.return_value = None
+    summary_tbl.update_one.side_effect = rating_service.video_service.DataAPIResponseException(
+        "boom"
+    )
+    ratings_tbl = AsyncMock()
+    ratings_tbl.find_one.return_value = None
+
+    with (
+        patch(
+            "app.services.rating_service.video_service.get_video_by_id",
+            new_callable=AsyncMock,
+        ) as mock_get_vid,
+        patch(
+            "app.services.rating_service.get_table", new_callable=AsyncMock
+        ) as mock_get_table,
+    ):
+        mock_get_vid.return_value = MagicMock(
+            status=VideoStatusEnum.READY, averageRating=None, totalRatingsCount=0
+        )
+        mock_get_table.return_value = summary_tbl
+
+        with pytest.raises(rating_service.video_service.DataAPIResponseException):
+            await rating_service.rate_video(
+                uuid4(),
+                RatingCreateOrUpdateRequest(rating=4),
+                viewer_user,
+                db_table=ratings_tbl,
+            )
+
+
+@pytest.mark.asyncio
+async def test_rate_video_resolves_tables_concurrently_with_video_lookup(
+    viewer_user: User,
+):
+    video_id = uuid4()
+    ratings_tbl = AsyncMock()
+    ratings_tbl.find_one.return_value = None
+    # The rows after the upsert: another viewer's 5 and the caller's 2
+    ratings_tbl.find = MagicMock(return_value=[{"rating": 5}, {"rating": 2}])
+    summary_tbl = AsyncMock()
+    tables = {
+        rating_service.RATINGS_TABLE_NAME: ratings_tbl,
+        rating_service.RATINGS_SUMMARY_TABLE_NAME: summary_tbl,
+        rating_service.video_service.VIDEOS_TABLE_NAME: AsyncMock(),
+    }
+
+    with (
+        patch(
+            "app.services.rating_service.video_service.get_video_by_id",
+            new_callable=AsyncMock,
+        ) as mock_get_vid,
+        patch(
+            "app.services.rating_service.get_table",
+            new=AsyncMock(side_effect=lambda name: tables[name]),
+        ),
+    ):
+        mock_get_vid.return_value = MagicMock(
+            status=VideoStatusEnum.READY, averageRating=None, totalRatingsCount=0
+        )
+
+        await rating_service.rate_video(
+            video_id, RatingCreateOrUpdateRequest(rating=2), viewer_user
+        )
+
+    ratings_tbl.update_one.assert_awaited_once()
+    assert ratings_tbl.find.call_args.kwargs == {
+        "filter": {"videoid": str(video_id)},
+        "projection": {"rating": 1},
+    }
+    assert summary_tbl.update_one.await_args.kwargs["update"] == {
+        "$set": {"rating_counter": 2, "rating_total": 7}
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_video_ratings_summary_caches_aggregate_until_rated(
+    viewer_user: User,
+):
+    video_id = uuid4()
+    ratings_tbl = AsyncMock()
+    ratings_tbl.find_one.return_value = None
+    summary_tbl = AsyncMock()
+    summary_tbl.find_one.return_value = {"rating_counter": 1, "rating_total": 4}
+    tables = {
+        rating_service.RATINGS_TABLE_NAME: ratings_tbl,
+        rating_service.RATINGS_SUMMARY_TABLE_NAME: summary_tbl,
+        rating_service.video_service.VIDEOS_TABLE_NAME: AsyncMock(),
+    }
+    rating_service.video_service.invalidate_rating_summary_cache(video_id)
+
+    with (
+        patch(
+            "app.services.rating_service.video_service.get_video_by_id",
+            new_callable=AsyncMock,
+        ) as mock_get_vid,
+        patch(
+            "app.services.rating_service.get_table",
+            new=AsyncMock(side_effect=lambda name: tables[name]),
+        ),
+    ):
+        mock_get_vid.return_value = MagicMock(
+            status=VideoStatusEnum.READY, averageRating=None, totalRatingsCount=0
+        )
+
+        first = await rating_service.get_video_ratings_summary(video_id)
+        second = await rating_service.get_video_ratings_summary(video_id)
+        assert first.averageRating == second.averageRating == 4.0
+        assert summary_tbl.find_one.await_count == 1
+
+        # Existence is checked on every read, cached or not
+        mock_get_vid.return_value = None
+        with pytest.raises(HTTPException) as excinfo:
+            await rating_service.get_video_ratings_summary(video_id)
+        assert excinfo.value.status_code == 404
+        mock_get_vid.return_value = MagicMock(
+            status=VideoStatusEnum.READY, averageRating=None, totalRatingsCount=0
+        )
+
+        # A write drops the entry so the next read sees the new counters
+        await rating_service.rate_video(
+            video_id, RatingCreateOrUpdateRequest(rating=2), viewer_user
+        )
+        summary_tbl.find_one.return_value = {"rating_counter": 2, "rating_total": 6}
+        third = await rating_service.get_video_ratings_summary(video_id)
+
+    assert third.averageRating == 3.0 and third.totalRatingsCount == 2
+    rating_service.video_service.invalidate_rating_summary_cache(video_id)
+
+
+@pytest.mark.asyncio
+async def test_rate_video_update_keeps_original_rating_date(viewer_user: User):
+    video_id = uuid4()
+    ratings_tbl = AsyncMock()
+    ratings_tbl.find_one.return_value = {
+        "rating": 1,
+        "rating_date": "2025-01-02T03:04:05Z",
+    }
+
+    with (
+        patch(
+            "app.services.rating_service.video_service.get_video_by_id",
+            new_callable=AsyncMock,
+        ) as mock_get_vid,
+        patch(
+            "app.services.rating_service.get_table", new_callable=AsyncMock
+        ) as mock_get_table,
+    ):
+        mock_get_vid.return_value = MagicMock(
+            status=VideoStatusEnum.READY, averageRating=None, totalRatingsCount=0
+        )
+        mock_get_table.return_value.find_one.return_value = None
+
+        result = await rating_service.rate_video(
+            video_id,
+            RatingCreateOrUpdateRequest(rating=3),
+            viewer_user,
+            db_table=ratings_tbl,
+        )
+
+    assert result.createdAt == datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert result.model_dump(by_alias=True)["videoid"] == video_id
+
+
+@pytest.mark.asyncio
+async def test_get_video_ratings_summaries_batches_lookups(viewer_user: User):
+    rated, unrated = uuid4(), uuid4()
+    ratings_tbl = MagicMock()
+    ratings_tbl.find.return_value = [{"videoid": str(rated), "rating": 4}]
+    summary_tbl = MagicMock()
+    summary_tbl.find.return_value = [
+        {"videoid": str(rated), "rating_counter": 2, "rating_total": 7}
+    ]
+
+    summaries = await rating_service.get_video_ratings_summaries(
+        [unrated, rated],
+        current_user_id=viewer_user.userid,
+        ratings_db_table=ratings_tbl,
+        summary_db_table=summary_tbl,
+    )
+
+    summary_tbl.find.assert_called_once_with(
+        filter={"videoid": {"$in": [str(unrated), str(rated)]}}
+    )
+    assert ratings_tbl.find.call_args.kwargs["filter"] == {
+        "userid": str(viewer_user.userid),
+        "videoid": {"$in": [str(unrated), str(rated)]},
+    }
+    assert [s.videoId for s in summaries] == [unrated, rated]
+    assert summaries[0].totalRatingsCount == 0
+    assert summaries[0].averageRating is None
+    assert summaries[0].currentUserRating is None
+    assert summaries[1].averageRating == 3.5
+    assert summaries[1].currentUserRating == 4
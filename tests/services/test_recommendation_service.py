@@ -70,34 +70,66 @@ async def test_get_related_videos_returns_expected_items(sample_video):
             new_callable=AsyncMock,
         ) as mock_get_video,
         patch(
-            "app.services.recommendation_service.video_service.list_latest_videos",
+            "app.services.recommendation_service.video_service.list_videos_with_query",
             new_callable=AsyncMock,
-        ) as mock_list_latest,
+        ) as mock_list_query,
     ):
         mock_get_video.return_value = sample_video
-        mock_list_latest.return_value = (summaries, len(summaries))
+        # The DB applies the exclusion, so only the other videos come back
+        mock_list_query.return_value = (summaries[1:], 2)
 
         items = await get_related_videos(video_id=sample_video.videoid, limit=2)
 
-        # Should exclude source video and respect limit
+        # The exclusion is pushed into the query
+        query_filter, _page, page_size = mock_list_query.await_args.args
+        assert query_filter == {"videoid": {"$ne": str(sample_video.videoid)}}
+        assert page_size == 2
         assert len(items) == 2
         assert all(isinstance(i, RecommendationItem) for i in items)
         returned_ids = {i.videoid for i in items}
         assert sample_video.videoid not in returned_ids
+        # Stub scores are deterministic and decrease with rank
+        assert [i.score for i in items] == [1.0, 0.75]
 
 
 @pytest.mark.asyncio
 async def test_get_related_videos_source_not_found(sample_video_id):
-    with patch(
-        "app.services.recommendation_service.video_service.get_video_by_id",
-        new_callable=AsyncMock,
-    ) as mock_get_video:
+    with (
+        patch(
+            "app.services.recommendation_service.video_service.get_video_by_id",
+            new_callable=AsyncMock,
+        ) as mock_get_video,
+        patch(
+            "app.services.recommendation_service.video_service.list_videos_with_query",
+            new_callable=AsyncMock,
+        ),
+    ):
         mock_get_video.return_value = None
 
         items = await get_related_videos(video_id=sample_video_id, limit=5)
         assert items == []
 
 
+@pytest.mark.asyncio
+async def test_get_related_videos_keeps_latest_row_cap(sample_video):
+    with (
+        patch(
+            "app.services.recommendation_service.video_service.get_video_by_id",
+            new_callable=AsyncMock,
+        ) as mock_get_video,
+        patch(
+            "app.services.recommendation_service.video_service.list_videos_with_query",
+            new_callable=AsyncMock,
+        ) as mock_list_query,
+    ):
+        mock_get_video.return_value = sample_video
+        mock_list_query.return_value = ([], 0)
+
+        await get_related_videos(video_id=sample_video.videoid, limit=10)
+
+    assert mock_list_query.await_args.args[2] == 3
+
+
 @pytest.mark.asyncio
 async def test_get_personalized_for_you_videos_calls_video_service(sample_video):
     dummy_user = User(
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from uuid import uuid4
@@ -53,6 +55,7 @@ async def test_get_user_by_email_from_credentials_table_not_found():
 async def test_create_user_in_table(sample_user_create_request: UserCreateRequest):
     mock_users_table = AsyncMock()
     mock_credentials_table = AsyncMock()
+    mock_credentials_table.find_one.return_value = None
 
     with patch("app.services.user_service.get_password_hash") as mock_get_password_hash:
         mock_hashed_password = "hashed_secure_password"
@@ -83,6 +86,10 @@ async def test_create_user_in_table(sample_user_create_request: UserCreateReques
             assert user_document["lastname"] == sample_user_create_request.lastname
             assert user_document["email"] == sample_user_create_request.email
             assert user_document["account_status"] == "active"
+            assert (
+                user_document["email_lower"]
+                == sample_user_create_request.email.lower()
+            )
 
             # Check the credentials document
             args, kwargs = mock_credentials_table.insert_one.call_args
@@ -106,6 +113,7 @@ async def test_create_user_in_table_uses_get_table_if_no_db_table_provided(
     ) as mock_get_table:
         mock_users_table = AsyncMock()
         mock_credentials_table = AsyncMock()
+        mock_credentials_table.find_one.return_value = None
         mock_get_table.side_effect = [mock_users_table, mock_credentials_table]
 
         with patch(
@@ -119,6 +127,27 @@ async def test_create_user_in_table_uses_get_table_if_no_db_table_provided(
             mock_credentials_table.insert_one.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_create_user_in_table_existing_email_skips_hashing(
+    sample_user_create_request: UserCreateRequest,
+):
+    mock_users_table = AsyncMock()
+    mock_credentials_table = AsyncMock()
+    mock_credentials_table.find_one.return_value = {"userid": str(uuid4())}
+
+    with patch("app.services.user_service.get_password_hash") as mock_hash:
+        created = await user_service.create_user_in_table(
+            user_in=sample_user_create_request,
+            users_table=mock_users_table,
+            credentials_table=mock_credentials_table,
+        )
+
+    assert created is None
+    mock_hash.assert_not_called()
+    mock_users_table.insert_one.assert_not_called()
+    mock_credentials_table.insert_one.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_get_user_by_email_uses_get_table_if_no_db_table_provided():
     with patch(
@@ -184,6 +213,13 @@ async def test_authenticate_user_from_table_success():
             password, "hashed_correct_password"
         )
 
+        # last_login_date is written by a background task
+        await asyncio.gather(*user_service._background_tasks)
+        kwargs = mock_users_table.update_one.await_args.kwargs
+        assert kwargs["filter"] == {"userid": user_id}
+        assert "last_login_date" in kwargs["update"]["$set"]
+        user_service._login_userid_cache.pop(email)
+
 
 @pytest.mark.asyncio
 async def test_authenticate_user_from_table_user_not_found():
@@ -197,11 +233,18 @@ async def test_authenticate_user_from_table_user_not_found():
         mock_get_table.return_value = mock_credentials_table
         mock_credentials_table.find_one.return_value = None
 
-        authenticated_user = await user_service.authenticate_user_from_table(
-            email, password
-        )
+        with patch(
+            "app.services.user_service.verify_password", return_value=True
+        ) as mock_verify_password:
+            authenticated_user = await user_service.authenticate_user_from_table(
+                email, password
+            )
 
         assert authenticated_user is None
+        # Unknown emails still pay for a hash check against the dummy hash
+        mock_verify_password.assert_called_once_with(
+            password, user_service._dummy_password_hash()
+        )
 
 
 @pytest.mark.asyncio
@@ -257,7 +300,6 @@ async def test_update_user_in_table_success():
 
     mock_db_table = AsyncMock()
     mock_db_table.find_one.return_value = expected_updated_user_doc
-    mock_db_table.update_one.return_value = MagicMock()
 
     updated_user = await user_service.update_user_in_table(
         user_id=user_id, update_data=update_request, db_table=mock_db_table
@@ -272,7 +314,12 @@ async def test_update_user_in_table_success():
     mock_db_table.update_one.assert_called_once_with(
         filter={"userid": user_id},
         update={
-            "$set": {"firstname": "UpdatedFirstName", "lastname": "UpdatedLastName"}
+            "$set": {
+                "firstname": "UpdatedFirstName",
+                "lastname": "UpdatedLastName",
+                "firstname_lower": "updatedfirstname",
+                "lastname_lower": "updatedlastname",
+            }
         },
     )
 
@@ -325,7 +372,10 @@ async def test_update_user_in_table_user_not_found_initially():
 
     assert updated_user is None
     mock_db_table.update_one.assert_called_once_with(
-        filter={"userid": user_id}, update={"$set": {"firstname": "UpdatedName"}}
+        filter={"userid": user_id},
+        update={
+            "$set": {"firstname": "UpdatedName", "firstname_lower": "updatedname"}
+        },
     )
     mock_db_table.find_one.assert_called_once_with(filter={"userid": user_id})
 
@@ -347,12 +397,31 @@ async def test_search_users_with_query():
     mock_cursor.to_list.return_value = [doc]
     mock_db.find.return_value = mock_cursor
 
-    results = await user_service.search_users(query="alice", db_table=mock_db)
+    results = await user_service.search_users(query="Alice", db_table=mock_db)
 
     mock_db.find.assert_called_once()
+    assert mock_db.find.call_args.kwargs["filter"]["$or"][0] == {
+        "email_lower": {"$gte": "alice", "$lt": "alice\uffff"}
+    }
     assert isinstance(results, list)
 
 
+@pytest.mark.asyncio
+async def test_search_users_falls_back_to_client_scan_when_filters_unsupported():
+    docs = [
+        {**_user_doc(uuid4()), "firstname": "Alice"},
+        {**_user_doc(uuid4()), "firstname": "Bob", "lastname": None},
+    ]
+    unsupported = _data_api_error("UNSUPPORTED_FILTER_OPERATION: $or")
+    mock_db = MagicMock()
+    mock_db.find.side_effect = [unsupported, unsupported, docs]
+
+    results = await user_service.search_users(query="LIC", db_table=mock_db)
+
+    assert [u.firstname for u in results] == ["Alice"]
+    assert mock_db.find.call_args.kwargs["filter"] == {}
+
+
 @pytest.mark.asyncio
 async def test_search_users_no_query():
     mock_db = AsyncMock()
@@ -363,3 +432,226 @@ async def test_search_users_no_query():
     results = await user_service.search_users(db_table=mock_db)
     mock_db.find.assert_called_once()
     assert results == []
+
+
+def _data_api_error(message: str) -> Exception:
+    from astrapy.exceptions.data_api_exceptions import DataAPIResponseException
+
+    return DataAPIResponseException(message)
+
+
+def _user_doc(user_id) -> dict:
+    return {
+        "userid": str(user_id),
+        "firstname": "Bulk",
+        "lastname": "User",
+        "email": f"{user_id}@example.com",
+        "created_date": datetime.now(timezone.utc),
+        "account_status": "active",
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_users_by_ids_chunks_in_queries(monkeypatch):
+    monkeypatch.setattr(user_service, "USER_IN_CHUNK_SIZE", 2)
+    ids = [uuid4() for _ in range(5)]
+    mock_db = MagicMock()
+    mock_db.find.side_effect = lambda filter, limit: [
+        _user_doc(uid) for uid in filter["userid"]["$in"]
+    ]
+
+    users = await user_service.get_users_by_ids(ids + ids[:1], db_table=mock_db)
+
+    assert set(users) == set(ids)
+    chunk_sizes = [
+        len(c.kwargs["filter"]["userid"]["$in"]) for c in mock_db.find.call_args_list
+    ]
+    assert chunk_sizes == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_get_users_by_ids_serves_repeats_from_cache():
+    ids = [uuid4(), uuid4()]
+    mock_db = MagicMock()
+    mock_db.find.side_effect = lambda filter, limit: [
+        _user_doc(uid) for uid in filter["userid"]["$in"]
+    ]
+
+    with patch(
+        "app.services.user_service.get_table", new_callable=AsyncMock
+    ) as mock_get_table:
+        mock_get_table.return_value = mock_db
+        await user_service.get_users_by_ids(ids[:1])
+        users = await user_service.get_users_by_ids(ids)
+
+    # Second call only asks the table for the id it has not seen yet
+    assert mock_db.find.call_args.kwargs["filter"] == {
+        "userid": {"$in": [str(ids[1])]}
+    }
+    assert set(users) == set(ids)
+    for uid in ids:
+        user_service.invalidate_user_cache(uid)
+
+
+@pytest.mark.asyncio
+async def test_get_user_by_id_from_table_is_cached_until_invalidated():
+    user_id = uuid4()
+    mock_db = AsyncMock()
+    mock_db.find_one.return_value = _user_doc(user_id)
+
+    with patch(
+        "app.services.user_service.get_table", new_callable=AsyncMock
+    ) as mock_get_table:
+        mock_get_table.return_value = mock_db
+        first = await user_service.get_user_by_id_from_table(user_id)
+        second = await user_service.get_user_by_id_from_table(user_id)
+        assert first == second and first is not second
+        assert mock_db.find_one.await_count == 1
+
+        # A caller adjusting its copy does not leak into the next request
+        second.roles = ["moderator"]
+        third = await user_service.get_user_by_id_from_table(user_id)
+        assert third.roles == first.roles != ["moderator"]
+
+        user_service.invalidate_user_cache(user_id)
+        await user_service.get_user_by_id_from_table(user_id)
+
+    assert mock_db.find_one.await_count == 2
+    user_service.invalidate_user_cache(user_id)
+
+
+@pytest.mark.asyncio
+async def test_role_helpers_read_then_set_the_roles():
+    user_id = uuid4()
+    mock_db = AsyncMock()
+    mock_db.find_one.return_value = {**_user_doc(user_id), "roles": ["viewer"]}
+
+    promoted = await user_service.assign_role_to_user(
+        user_id=user_id, role="moderator", db_table=mock_db
+    )
+
+    assert promoted.roles == ["viewer", "moderator"]
+    mock_db.update_one.assert_awaited_once_with(
+        filter={"userid": user_id},
+        update={"$set": {"roles": ["viewer", "moderator"]}},
+    )
+
+    # Revoking a role the user does not hold writes nothing
+    mock_db.update_one.reset_mock()
+    unchanged = await user_service.revoke_role_from_user(
+        user_id=user_id, role="moderator", db_table=mock_db
+    )
+    assert unchanged.roles == ["viewer"]
+    mock_db.update_one.assert_not_awaited()
+
+    mock_db.find_one.return_value = None
+    assert (
+        await user_service.revoke_role_from_user(
+            user_id=user_id, role="moderator", db_table=mock_db
+        )
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_user_in_table_rolls_back_user_row_when_credentials_fail(
+    sample_user_create_request: UserCreateRequest,
+):
+    mock_users_table = AsyncMock()
+    mock_credentials_table = AsyncMock()
+    mock_credentials_table.find_one.return_value = None
+    mock_credentials_table.insert_one.side_effect = RuntimeError("write failed")
+
+    with patch("app.services.user_service.get_password_hash", return_value="h"):
+        with pytest.raises(RuntimeError):
+            await user_service.create_user_in_table(
+                user_in=sample_user_create_request,
+                users_table=mock_users_table,
+                credentials_table=mock_credentials_table,
+            )
+
+    mock_users_table.insert_one.assert_awaited_once()
+    inserted_id = mock_users_table.insert_one.await_args.kwargs["document"]["userid"]
+    mock_users_table.delete_one.assert_awaited_once_with(
+        filter={"userid": inserted_id}
+    )
+    mock_credentials_table.delete_one.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_authenticate_user_sees_lock_set_between_logins():
+    user_id = uuid4()
+    credentials_doc = {
+        "email": "hot@example.com",
+        "password": "hashed",
+        "userid": user_id,
+        "account_locked": False,
+    }
+    credentials_tbl = AsyncMock()
+    credentials_tbl.find_one.return_value = credentials_doc
+    users_tbl = AsyncMock()
+    users_tbl.find_one.return_value = _user_doc(user_id)
+
+    with patch("app.services.user_service.verify_password", return_value=True):
+        first = await user_service.authenticate_user_from_table(
+            "hot@example.com", "pw", users_tbl, credentials_tbl
+        )
+        credentials_tbl.find_one.return_value = {
+            **credentials_doc,
+            "account_locked": True,
+        }
+        locked = await user_service.authenticate_user_from_table(
+            "hot@example.com", "pw", users_tbl, credentials_tbl
+        )
+
+    await asyncio.gather(*user_service._background_tasks)
+    assert first is not None and first.userid == user_id
+    assert locked is None
+    assert credentials_tbl.find_one.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_authenticate_user_caches_only_the_userid():
+    user_id = uuid4()
+    email = "userid-cache@example.com"
+    credentials_tbl = AsyncMock()
+    credentials_tbl.find_one.return_value = {
+        "email": email,
+        "password": "hashed",
+        "userid": user_id,
+        "account_locked": False,
+    }
+    users_tbl = AsyncMock()
+    users_tbl.find_one.return_value = _user_doc(user_id)
+    user_service._login_userid_cache.pop(email)
+
+    with (
+        patch(
+            "app.services.user_service.get_table",
+            new=AsyncMock(
+                side_effect=lambda name: {
+                    user_service.USER_CREDENTIALS_TABLE_NAME: credentials_tbl,
+                    user_service.USERS_TABLE_NAME: users_tbl,
+                }[name]
+            ),
+        ),
+        patch("app.services.user_service.verify_password", return_value=True),
+    ):
+        first = await user_service.authenticate_user_from_table(email, "pw")
+        assert user_service._login_userid_cache.get(email) == user_id
+
+        # Warm login: credentials are still read (lock/password changes apply),
+        # and the users read goes out with them by the cached id.
+        credentials_tbl.find_one.return_value = {
+            **credentials_tbl.find_one.return_value,
+            "account_locked": True,
+        }
+        locked = await user_service.authenticate_user_from_table(email, "pw")
+
+    await asyncio.gather(*user_service._background_tasks)
+    assert first is not None and first.userid == user_id
+    assert locked is None
+    assert credentials_tbl.find_one.await_count == 2
+    assert users_tbl.find_one.await_count == 2
+    assert users_tbl.find_one.await_args.kwargs["filter"] == {"userid": user_id}
+    user_service._login_userid_cache.pop(email)
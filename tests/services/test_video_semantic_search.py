@@ -33,3 +33,49 @@ async def test_semantic_search_token_limit(monkeypatch):
 
     assert exc.value.status_code == 400
     assert "512-token" in exc.value.detail
+
+
+@pytest.mark.asyncio
+async def test_semantic_search_serves_later_pages_from_cached_rows(monkeypatch):
+    from unittest.mock import MagicMock
+    from datetime import datetime, timezone
+    from uuid import uuid4
+
+    from app.services import vector_search_utils
+    from app.utils.ttl_cache import TTLCache
+
+    monkeypatch.setattr(
+        vector_search_utils, "_search_results", TTLCache(maxsize=4, ttl=60.0)
+    )
+    docs = [
+        {
+            "videoid": str(uuid4()),
+            "name": f"Video {i}",
+            "userid": str(uuid4()),
+            "added_date": datetime.now(timezone.utc),
+            "$similarity": 0.9,
+        }
+        for i in range(5)
+    ]
+    db_table = MagicMock()
+    db_table.find.return_value = docs
+
+    async def _search(page):
+        return await vector_search_utils.semantic_search_with_threshold(
+            db_table=db_table,
+            vector_column="content_features",
+            query_vector=[0.1, 0.2],
+            page=page,
+            page_size=2,
+            cache_key="cats",
+        )
+
+    first, total = await _search(1)
+    # Astra returned fewer rows than asked for, so the list is complete and
+    # every later page is a slice of it
+    second, _ = await _search(2)
+    third, _ = await _search(3)
+
+    assert total == 5
+    assert [s.name for s in first + second + third] == [d["name"] for d in docs]
+    db_table.find.assert_called_once()
@@ -254,6 +254,154 @@ async def test_record_video_view_success():
         mock_activity_table.insert_one.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_record_video_view_stops_writing_once_views_unsupported(monkeypatch):
+    monkeypatch.setattr(video_service, "_views_disabled", False)
+    mock_table = AsyncMock()
+    mock_table.update_one.side_effect = video_service.DataAPIResponseException(
+        "UNKNOWN_TABLE_COLUMNS: views"
+    )
+
+    await video_service.record_video_view(uuid4(), mock_table)
+    await video_service.record_video_view(uuid4(), mock_table)
+
+    # The failing write is attempted once, then skipped
+    mock_table.update_one.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_record_video_view_no_ops_when_inc_rejected(monkeypatch):
+    monkeypatch.setattr(video_service, "_views_disabled", False)
+    mock_table = AsyncMock()
+    mock_table.update_one.side_effect = video_service.DataAPIResponseException(
+        "UNSUPPORTED_UPDATE_OPERATIONS_FOR_TABLE: $inc"
+    )
+
+    with patch(
+        "app.services.video_service.get_table", new_callable=AsyncMock
+    ) as mock_get_table:
+        await video_service.record_video_view(uuid4(), mock_table)
+        await video_service.record_video_view(uuid4(), mock_table)
+
+    # No read + $set fallback: the $inc is tried once, then views are off
+    mock_table.update_one.assert_awaited_once()
+    mock_table.find_one.assert_not_awaited()
+    mock_get_table.assert_not_awaited()
+    assert video_service._views_disabled is True
+
+
+@pytest.mark.asyncio
+async def test_record_rating_shares_the_rate_video_write_path(test_user: User):
+    from app.models.video import VideoRatingRequest
+
+    video_id = uuid4()
+    ratings_tbl = AsyncMock()
+    summary_tbl = AsyncMock()
+    videos_tbl = AsyncMock()
+
+    # A re-rate 4 -> 2 replaces the caller's row; the totals follow the rows
+    ratings_tbl.find = MagicMock(return_value=[{"rating": 2}, {"rating": 5}])
+    await video_service.record_rating(
+        video_id,
+        test_user,
+        VideoRatingRequest(rating=2),
+        ratings_tbl,
+        summary_tbl,
+        videos_tbl,
+    )
+
+    kwargs = ratings_tbl.update_one.await_args.kwargs
+    assert kwargs["filter"] == {
+        "videoid": str(video_id),
+        "userid": str(test_user.userid),
+    }
+    assert kwargs["upsert"] is True
+    ratings_tbl.insert_one.assert_not_awaited()
+    assert summary_tbl.update_one.await_args.kwargs["update"] == {
+        "$set": {"rating_counter": 2, "rating_total": 7}
+    }
+    # The video row's aggregate columns move on this path too
+    video_set = videos_tbl.update_one.await_args.kwargs["update"]["$set"]
+    assert video_set["averageRating"] == 3.5
+    assert video_set["totalRatingsCount"] == 2
+
+
+@pytest.mark.asyncio
+async def test_record_rating_resolves_all_table_handles(test_user: User):
+    from app.models.video import VideoRatingRequest
+
+    ratings_tbl = AsyncMock()
+    ratings_tbl.find = MagicMock(return_value=[{"rating": 3}])
+    tables = {
+        video_service.VIDEO_RATINGS_TABLE_NAME: ratings_tbl,
+        video_service.VIDEO_RATINGS_SUMMARY_TABLE_NAME: AsyncMock(),
+        video_service.VIDEOS_TABLE_NAME: AsyncMock(),
+    }
+
+    with patch(
+        "app.services.video_service.get_table",
+        new=AsyncMock(side_effect=lambda name: tables[name]),
+    ) as mock_get_table:
+        await video_service.record_rating(
+            uuid4(), test_user, VideoRatingRequest(rating=3)
+        )
+
+    assert sorted(c.args[0] for c in mock_get_table.await_args_list) == sorted(tables)
+    for table in tables.values():
+        table.update_one.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_update_rating_aggregate_rebuilds_totals_from_rows():
+    video_id = uuid4()
+    ratings_tbl = MagicMock()
+    ratings_tbl.find.return_value = [{"rating": 4}, {"rating": 3}, {}, {"rating": 4}]
+    summary_tbl = AsyncMock()
+    videos_tbl = AsyncMock()
+
+    await video_service.update_rating_aggregate(
+        video_id, ratings_tbl, summary_tbl, videos_tbl
+    )
+
+    assert ratings_tbl.find.call_args.kwargs == {
+        "filter": {"videoid": str(video_id)},
+        "projection": {"rating": 1},
+    }
+    summary_tbl.find_one.assert_not_awaited()
+    kwargs = summary_tbl.update_one.await_args.kwargs
+    assert kwargs["update"] == {"$set": {"rating_counter": 3, "rating_total": 11}}
+    assert kwargs["upsert"] is True
+    video_set = videos_tbl.update_one.await_args.kwargs["update"]["$set"]
+    assert video_set["averageRating"] == 11 / 3
+    assert video_set["totalRatingsCount"] == 3
+
+
+@pytest.mark.asyncio
+async def test_update_rating_aggregate_stops_mirroring_once_columns_unknown(
+    monkeypatch,
+):
+    monkeypatch.setattr(video_service, "_rating_mirror_disabled", False)
+    ratings_tbl = MagicMock()
+    ratings_tbl.find.return_value = [{"rating": 4}]
+    summary_tbl = AsyncMock()
+    videos_tbl = AsyncMock()
+    videos_tbl.update_one.side_effect = video_service.DataAPIResponseException(
+        "UNKNOWN_TABLE_COLUMNS: averageRating"
+    )
+
+    await video_service.update_rating_aggregate(
+        uuid4(), ratings_tbl, summary_tbl, videos_tbl
+    )
+    await video_service.update_rating_aggregate(
+        uuid4(), ratings_tbl, summary_tbl, videos_tbl
+    )
+
+    # The summary keeps moving; the doomed mirror write is tried only once
+    assert summary_tbl.update_one.await_count == 2
+    assert videos_tbl.update_one.await_count == 1
+    assert video_service._rating_mirror_disabled is True
+
+
 # ------------------------------------------------------------
 # list_latest_videos (delegate to generic) – just verify query call
 # ------------------------------------------------------------
@@ -285,6 +433,35 @@ async def test_list_latest_videos():
         assert total == 0
 
 
+@pytest.mark.asyncio
+async def test_list_videos_with_query_skips_count_unless_exact():
+    docs = [
+        {
+            "videoid": str(uuid4()),
+            "name": f"Video {i}",
+            "userid": str(uuid4()),
+            "added_date": datetime.now(timezone.utc),
+        }
+        for i in range(2)
+    ]
+    mock_db = AsyncMock()
+    mock_db.find = MagicMock(return_value=docs)
+    mock_db.count_documents.return_value = 42
+
+    # A full page reports "at least one more" without a count round trip
+    summaries, total = await video_service.list_videos_with_query(
+        {}, page=2, page_size=2, db_table=mock_db
+    )
+    assert len(summaries) == 2
+    assert total == 5
+    mock_db.count_documents.assert_not_awaited()
+
+    _, total = await video_service.list_videos_with_query(
+        {}, page=2, page_size=2, db_table=mock_db, exact_total=True
+    )
+    assert total == 42
+
+
 # ------------------------------------------------------------
 # search_videos_by_keyword
 # ------------------------------------------------------------
@@ -341,6 +518,28 @@ async def test_suggest_tags_no_match():
     assert suggestions == []
 
 
+@pytest.mark.asyncio
+async def test_suggest_tags_reuses_vocabulary_across_keystrokes(monkeypatch):
+    monkeypatch.setattr(
+        video_service,
+        "_tag_vocabulary",
+        video_service.TTLCache(maxsize=1, ttl=60.0),
+    )
+    mock_db = AsyncMock()
+    mock_db.find.return_value = [{"tags": ["Python", "pytest", "fastapi"]}]
+
+    with patch(
+        "app.services.video_service.get_table", new_callable=AsyncMock
+    ) as mock_get_table:
+        mock_get_table.return_value = mock_db
+        first = await video_service.suggest_tags("p", limit=5)
+        second = await video_service.suggest_tags("PY", limit=1)
+
+    assert [s.tag for s in first] == ["Python", "fastapi", "pytest"]
+    assert [s.tag for s in second] == ["Python"]
+    mock_db.find.assert_called_once()
+
+
 # ------------------------------------------------------------
 # process_video_submission
 # ------------------------------------------------------------
@@ -479,3 +678,41 @@ async def test_list_trending_videos_counts_and_order():
     assert trending[0].viewCount == 3
     assert str(trending[1].videoid) == vid2
     assert trending[1].viewCount == 1
+
+
+# ------------------------------------------------------------
+# per-request lookup memo
+# ------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_get_video_by_id_memoised_within_lookup_scope(monkeypatch):
+    monkeypatch.setattr(video_service, "_views_disabled", False)
+    target_video = _build_video()
+    mock_table = AsyncMock()
+    mock_table.find_one.return_value = target_video.model_dump(by_alias=False)
+
+    with patch(
+        "app.services.video_service.get_table", new_callable=AsyncMock
+    ) as mock_get_table:
+        mock_get_table.return_value = mock_table
+
+        # Outside a scope every call goes to the database
+        await video_service.get_video_by_id(target_video.videoid)
+        await video_service.get_video_by_id(target_video.videoid)
+        assert mock_table.find_one.await_count == 2
+
+        video_service.start_video_lookup_scope()
+        try:
+            first = await video_service.get_video_by_id(target_video.videoid)
+            second = await video_service.get_video_by_id(target_video.videoid)
+            # A write to the row drops the memo entry
+            await video_service.record_video_view(target_video.videoid)
+            third = await video_service.get_video_by_id(target_video.videoid)
+        finally:
+            video_service._video_lookup_memo.set(None)
+
+        # Each caller gets its own copy of the memoised video
+        assert first == second and first is not second
+        assert third == first
+        assert mock_table.find_one.await_count == 4
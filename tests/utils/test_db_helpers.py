@@ -0,0 +1,52 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.utils.db_helpers import fetch_docs, page_total
+
+
+@pytest.mark.asyncio
+async def test_page_total_short_page_skips_count():
+    table = AsyncMock()
+    total = await page_total(
+        table, query_filter={}, skip=20, page_size=10, page_len=3
+    )
+    assert total == 23
+    table.count_documents.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_page_total_full_page_estimates_next_page():
+    table = AsyncMock()
+    total = await page_total(
+        table, query_filter={}, skip=0, page_size=10, page_len=10
+    )
+    assert total == 11
+    table.count_documents.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_page_total_exact_uses_count():
+    table = AsyncMock()
+    table.count_documents.return_value = 42
+    total = await page_total(
+        table, query_filter={"a": 1}, skip=0, page_size=10, page_len=10, exact=True
+    )
+    assert total == 42
+    table.count_documents.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_fetch_docs_handles_cursor_shapes():
+    async_cursor = MagicMock()
+    async_cursor.to_list = AsyncMock(return_value=[{"a": 1}])
+    assert await fetch_docs(async_cursor) == [{"a": 1}]
+
+    sync_cursor = MagicMock()
+    sync_cursor.to_list.return_value = [{"b": 2}]
+    assert await fetch_docs(sync_cursor) == [{"b": 2}]
+
+    async def _rows():
+        return [{"c": 3}]
+
+    assert await fetch_docs(_rows()) == [{"c": 3}]
+    assert await fetch_docs([{"d": 4}]) == [{"d": 4}]